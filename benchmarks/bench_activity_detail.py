@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark: detailed activity collection, serial vs concurrent requests.
+
+Runs against an in-process stand-in with per-request latency. The serial
+flow is the previous one: detail, then splits for each activity in turn,
+then one coaching lookup. The concurrent flow is ``collect_latest_activity``
+(all of them at once on ``ACTIVITY_DETAIL_WORKERS`` threads) with an empty
+activity store, so it downloads everything too. Both must produce the same
+activities (exits 1 otherwise).
+
+    python3 benchmarks/bench_activity_detail.py --latency-ms 150
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from activity_store import ActivityStore
+from detailed_activity_slimmer import activity_id_of, fetch_activity_payloads, slim_detailed_activity
+from garmin_standin import start_standin
+from http_session import use_standin
+
+
+def serial(count):
+    """The collection as it was: one request at a time."""
+    import garth
+
+    activities = garth.Activity.list(limit=count)
+    detailed = []
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for activity in activities:
+            detailed.append(slim_detailed_activity(activity, fetch_activity_payloads(activity_id_of(activity), executor)))
+    coaching = collection_utils._fetch_coaching(activities)
+    for activity in detailed:
+        if activity.get('activity_id') in coaching:
+            activity['coaching'] = coaching[activity['activity_id']]
+    return detailed
+
+
+def concurrent(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        collection_utils._activity_store = ActivityStore(Path(tmp) / "cache.sqlite")
+        try:
+            result = collection_utils.collect_latest_activity(Path(tmp) / "out.json", Path(tmp), count=count)
+        finally:
+            collection_utils._activity_store = None
+    return [result] if count == 1 else result
+
+
+def measure(server, func, count):
+    before = server.stats["requests"]
+    started = time.perf_counter()
+    result = func(count)
+    return time.perf_counter() - started, server.stats["requests"] - before, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=100, help="stand-in latency per request")
+    args = parser.parse_args()
+
+    server = start_standin(latency_ms=args.latency_ms)
+    use_standin(server.url)
+    rows = []
+    try:
+        for count in (1, 5, 10, 20):
+            serial_s, serial_req, expected = measure(server, serial, count)
+            concurrent_s, concurrent_req, actual = measure(server, concurrent, count)
+            if json.dumps(actual, default=str) != json.dumps(expected, default=str):
+                print(f"❌ Output differs for the last {count} activities")
+                sys.exit(1)
+            assert serial_req == concurrent_req
+            rows.append((count, concurrent_req, serial_s, concurrent_s))
+    finally:
+        server.shutdown()
+
+    print(f"\n{'activities':>10} {'requests':>9} {'serial s':>9} {'concurrent s':>13} {'speedup':>8}")
+    for count, requests, serial_s, concurrent_s in rows:
+        print(f"{count:>10} {requests:>9} {serial_s:>9.2f} {concurrent_s:>13.2f} {serial_s / concurrent_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
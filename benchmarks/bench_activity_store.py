@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Benchmark: activity history from the activity store vs a full list every run.
+
+Runs against an in-process stand-in with per-request latency. For each
+history size prints requests and wall time of the previous fetch
+(``Activity.list(limit=N)`` every run), of the first store sync, and of a
+later run with nothing new. Output must match (exits 1 otherwise).
+
+    python3 benchmarks/bench_activity_store.py --latency-ms 100
+"""
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from activity_slimmer import slim_activity_list
+from activity_store import ActivityStore
+from garmin_standin import start_standin
+from http_session import use_standin
+
+
+def full_list(count):
+    import garth
+    return garth.Activity.list(limit=count)
+
+
+def measure(server, func, count):
+    before = server.stats["requests"]
+    started = time.perf_counter()
+    activities = func(count)
+    return server.stats["requests"] - before, time.perf_counter() - started, activities
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=60, help="stand-in latency per request")
+    args = parser.parse_args()
+
+    server = start_standin(latency_ms=args.latency_ms)
+    use_standin(server.url)
+    print(f"{'activities':>10} {'run':<14} {'requests':>8} {'seconds':>8}")
+    try:
+        for count in (50, 500, 2000):
+            with tempfile.TemporaryDirectory() as tmp:
+                collection_utils._activity_store = ActivityStore(Path(tmp) / "cache.sqlite")
+                runs = [("full list", full_list), ("store, first", collection_utils._recent_activities),
+                        ("store, again", collection_utils._recent_activities)]
+                expected = None
+                for label, func in runs:
+                    requests, elapsed, activities = measure(server, func, count)
+                    slimmed = json.dumps(slim_activity_list(activities), default=str)
+                    if expected is None:
+                        expected = slimmed
+                    elif slimmed != expected:
+                        print(f"❌ {label}: activities differ from the full list")
+                        sys.exit(1)
+                    print(f"{len(activities):>10} {label:<14} {requests:>8} {elapsed:>8.2f}")
+    finally:
+        collection_utils._activity_store = None
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark: Body Battery event timeline, old dict/set builder vs merge-join.
+
+First checks parity: the merge-join must give the same rows, values and key
+order as the previous dict-based builder on generated events and edge cases
+(exits 1 otherwise). Then times both per event size, calm (30-min buckets)
+and high-stress (full resolution).
+
+    python3 benchmarks/bench_bb_timeline.py
+    python3 benchmarks/bench_bb_timeline.py --min-time 1
+"""
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import config
+import slimmer_inputs as inputs
+from body_battery_slimmer import build_timeline
+
+START = datetime(2025, 3, 14, 1, tzinfo=timezone.utc)
+START_MS = int(START.timestamp() * 1000)
+
+
+def reference_timeline(stress_values, bb_values, event_start_ms, high_stress_threshold):
+    """The builder as it was before the merge-join (dict per series, set union, sort)."""
+    timeline = []
+    stress_dict = {ts: val for ts, val in stress_values}
+    bb_dict = {entry[0]: entry[2] for entry in bb_values if len(entry) > 2}
+    all_ts = sorted(set(stress_dict.keys()) | set(bb_dict.keys()))
+    stress_vals_in_event = [val for val in stress_dict.values() if val is not None]
+    max_stress = max(stress_vals_in_event) if stress_vals_in_event else 0
+    if max_stress > high_stress_threshold:
+        for ts in all_ts:
+            values = {}
+            if ts in bb_dict:
+                values['bb'] = bb_dict[ts]
+            if ts in stress_dict:
+                values['stress'] = stress_dict[ts]
+            timeline.append([(ts - event_start_ms) // 60000, values])
+        return timeline
+    buckets = {}
+    for ts in all_ts:
+        bucket = ((ts - event_start_ms) // 60000 // 30) * 30
+        if bucket not in buckets:
+            buckets[bucket] = {}
+        if ts in bb_dict:
+            buckets[bucket]['bb'] = bb_dict[ts]
+        if ts in stress_dict and stress_dict[ts] is not None:
+            buckets[bucket]['stress'] = stress_dict[ts]
+    return [[offset, values] for offset, values in sorted(buckets.items())]
+
+
+def event_arrays(samples, interval_s=60, high_stress=False, seed=0):
+    event = inputs.body_battery_event(START, samples * interval_s // 60, interval_s=interval_s,
+                                      high_stress=high_stress, seed=seed)
+    stress = event.stress_values_array
+    if not high_stress:
+        # Long calm events can still draw one reading over the threshold
+        stress = [[ts, min(value, config.HIGH_STRESS_THRESHOLD)] for ts, value in stress]
+    return stress, event.body_battery_values_array
+
+
+def parity_inputs():
+    """Generated events of every size and both modes, plus hand-made edge cases."""
+    cases = [event_arrays(samples, interval_s, high, seed)
+             for seed in range(3) for samples in (1, 20, 200, 1500)
+             for interval_s in (60, 180) for high in (False, True)]
+    m = 60000
+    cases += [
+        ([], []),
+        ([[START_MS, 10]], []),
+        ([[START_MS, None]], []),
+        ([], [[START_MS, "MEASURED", 40, 2.0]]),
+        # Timestamps only one series has, offset grids, before the event start
+        ([[START_MS + k * 2 * m, 10] for k in range(40)],
+         [[START_MS + k * 3 * m - 5 * m, "MEASURED", 40 + k, 2.0] for k in range(40)]),
+        # Repeated timestamps: the last value wins, also when it is null
+        ([[START_MS, 12], [START_MS, None], [START_MS + m, 5], [START_MS + m, 7]],
+         [[START_MS, "MEASURED", 30, 2.0], [START_MS, "MEASURED", 31, 2.0]]),
+        # Null stress and null BB level, a short BB entry without a level
+        ([[START_MS + 31 * m, None], [START_MS + 32 * m, 9]],
+         [[START_MS + 32 * m, "MEASURED", None, 2.0], [START_MS + 40 * m, "MEASURED"]]),
+        # Stress seen first in a bucket, BB later in the same bucket
+        ([[START_MS, 10]], [[START_MS + 5 * m, "MEASURED", 50, 2.0]]),
+        # Out of order input and a single high reading
+        ([[START_MS + 5 * m, 10], [START_MS, 80], [START_MS + 2 * m, 3]],
+         [[START_MS + 2 * m, "MEASURED", 50, 2.0], [START_MS, "MEASURED", 49, 2.0]]),
+    ]
+    return cases
+
+
+def check_parity():
+    threshold = config.HIGH_STRESS_THRESHOLD
+    cases = parity_inputs()
+    failures = 0
+    for n, (stress, bb) in enumerate(cases):
+        expected = json.dumps(reference_timeline(stress, bb, START_MS, threshold))
+        actual = json.dumps(build_timeline(stress, bb, START_MS, threshold))
+        if actual != expected:
+            failures += 1
+            print(f"❌ Parity differs on input #{n}\n   expected: {expected[:300]}\n   got:      {actual[:300]}")
+    if failures:
+        return False
+    print(f"✅ Parity: identical timelines on {len(cases)} inputs")
+    return True
+
+
+def ops_per_sec(func, args, min_time):
+    func(*args)
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < min_time:
+        func(*args)
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds per measurement")
+    args = parser.parse_args()
+
+    if not check_parity():
+        sys.exit(1)
+
+    threshold = config.HIGH_STRESS_THRESHOLD
+    print(f"\n{'mode':<6} {'samples':>8} {'old ops/s':>11} {'merge ops/s':>12} {'speedup':>8}")
+    for high in (False, True):
+        for samples in (30, 120, 300, 600, 1200, 2400):
+            stress, bb = event_arrays(samples, high_stress=high)
+            call = (stress, bb, START_MS, threshold)
+            old = ops_per_sec(reference_timeline, call, args.min_time)
+            merge = ops_per_sec(build_timeline, call, args.min_time)
+            print(f"{'high' if high else 'calm':<6} {samples:>8} {old:>11.1f} {merge:>12.1f} {merge / old:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""Benchmark: end-to-end collect_data time, serial vs concurrent.
+
+Each Garmin round-trip is simulated with a fixed sleep so the numbers show
+the collection engine itself, not the network of the day.
+
+    python3 benchmarks/bench_collect.py --latency-ms 400 --workers 6
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import config
+import collection_utils
+
+
+def _simulated_fetch(latency_s):
+    def fetch(name, class_name, days, today, hints=None):
+        time.sleep(latency_s)
+        return [{'calendar_date': today, 'type': name}], []
+    return fetch
+
+
+def run(data_types, workers, latency_s):
+    """Run collect_data once and return elapsed seconds."""
+    original = collection_utils._fetch_and_slim
+    collection_utils._fetch_and_slim = _simulated_fetch(latency_s)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results_dir = Path(tmp)
+            started = time.perf_counter()
+            collection_utils.collect_data(
+                data_types, results_dir / "bench.json", results_dir,
+                config.DAYS_TO_COLLECT, max_workers=workers,
+            )
+            return time.perf_counter() - started
+    finally:
+        collection_utils._fetch_and_slim = original
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=400, help="simulated round-trip per data type")
+    parser.add_argument("--workers", type=int, default=config.FETCH_WORKERS)
+    args = parser.parse_args()
+    latency_s = args.latency_ms / 1000
+    collection_utils.CACHE_ENABLED = False  # no sync probe: measure the collection engine alone
+
+    reports = {
+        'morning': config.DATA_TYPES_MORNING,
+        'weekly': config.DATA_TYPES_WEEKLY,
+        'health': config.DATA_TYPES_HEALTH,
+    }
+    rows = []
+    for name, data_types in reports.items():
+        serial = run(data_types, 1, latency_s)
+        concurrent = run(data_types, args.workers, latency_s)
+        rows.append((name, len(data_types), serial, concurrent))
+
+    print(f"\n{'report':<10} {'types':>5} {'serial s':>9} {'x' + str(args.workers) + ' s':>9} {'speedup':>8}")
+    for name, count, serial, concurrent in rows:
+        print(f"{name:<10} {count:>5} {serial:>9.2f} {concurrent:>9.2f} {serial / concurrent:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
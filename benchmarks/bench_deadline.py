@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark: tail latency with hedged requests, and report deadlines.
+
+Runs against in-process stand-ins. First, the same GETs go out from several
+threads to a server where a fraction of requests straggle (``--tail-rate``,
+``--tail-ms``), without and with hedging; prints latency percentiles and
+how many duplicate requests were sent. Then collects the morning report
+while one endpoint (training status) is slow, without a deadline and with
+``--deadline`` seconds; prints when the report file was written and what
+its ``_collection_status`` says.
+
+    python3 benchmarks/bench_deadline.py --tail-rate 0.02 --tail-ms 1500 --deadline 2
+"""
+import argparse
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+import config
+from fetch_planner import build_plan, run_plan
+from garmin_standin import start_standin
+from http_session import tune_session, use_standin
+from throttle import Throttle, throttle_requests
+
+
+def make_client(server, hedge):
+    """A garth client on the stand-in with the configured throttle, hedging on or off."""
+    import garth
+
+    client = garth.Client()
+    tune_session(client, config.HTTP_POOL_SIZE)
+    throttle = Throttle(1000, 1000, config.THROTTLE_CONCURRENCY, config.THROTTLE_MAX_CONCURRENCY,
+                        config.THROTTLE_ATTEMPTS, config.THROTTLE_BACKOFF_S, config.THROTTLE_MAX_BACKOFF_S,
+                        hedge_percentile=config.HEDGE_PERCENTILE if hedge else None,
+                        hedge_budget=config.HEDGE_BUDGET, hedge_min_samples=config.HEDGE_MIN_SAMPLES)
+    throttle_requests(client, throttle)
+    use_standin(server.url, client)
+    return client, throttle
+
+
+def tail_latency(args):
+    today = date.today()
+    paths = [f"/usersummary-service/usersummary/daily/?calendarDate={today - timedelta(days=i % 365)}"
+             for i in range(args.calls)]
+    print(f"{'client':<10} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'max ms':>7} {'requests':>8} {'hedged':>6}")
+    for hedge in (False, True):
+        server = start_standin(latency_ms=args.latency_ms, tail_rate=args.tail_rate, tail_ms=args.tail_ms, seed=1)
+        client, throttle = make_client(server, hedge)
+
+        def call(path):
+            started = time.perf_counter()
+            client.connectapi(path)
+            return time.perf_counter() - started
+
+        try:
+            with ThreadPoolExecutor(max_workers=args.threads) as executor:
+                latencies = sorted(executor.map(call, paths))
+        finally:
+            server.shutdown()
+        cuts = statistics.quantiles(latencies, n=100)
+        print(f"{'hedged' if hedge else 'plain':<10} {cuts[49] * 1000:>7.0f} {cuts[94] * 1000:>7.0f} "
+              f"{cuts[98] * 1000:>7.0f} {latencies[-1] * 1000:>7.0f} {server.stats['requests']:>8} "
+              f"{throttle.stats['hedged']:>6}")
+
+
+def deadline_run(args):
+    import garth
+
+    collection_utils.CACHE_ENABLED = False
+    slow = {"/mobile-gateway/usersummary/trainingstatus": args.slow_ms}
+    print(f"\nmorning report, training status {args.slow_ms:.0f} ms slower:")
+    for deadline in (None, args.deadline):
+        server = start_standin(latency_ms=args.latency_ms, slow_paths=slow)
+        collection_utils.install_throttle(garth.client)
+        use_standin(server.url)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                started = time.perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    run_plan(build_plan(['morning']), ['morning'], Path(tmp), deadlines={'morning': deadline})
+                elapsed = time.perf_counter() - started
+                report = json.loads((Path(tmp) / "morning_data.json").read_text())
+            collection_utils.wait_for_stopped_fetches()
+        finally:
+            server.shutdown()
+        status = report.get(collection_utils.COLLECTION_STATUS_KEY)
+        label = "no deadline" if deadline is None else f"deadline {deadline:g}s"
+        print(f"  {label:<14} written after {elapsed:5.2f}s, {len(report) - bool(status)} types, "
+              f"status: {json.dumps(status) if status else 'complete'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=40, help="stand-in latency per request")
+    parser.add_argument("--tail-rate", type=float, default=0.02, help="fraction of straggling requests")
+    parser.add_argument("--tail-ms", type=float, default=1500, help="extra latency of a straggler")
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--slow-ms", type=float, default=5000, help="extra latency of the slow endpoint")
+    parser.add_argument("--deadline", type=float, default=2, help="report deadline for the second run")
+    args = parser.parse_args()
+
+    tail_latency(args)
+    deadline_run(args)
+
+
+if __name__ == "__main__":
+    main()
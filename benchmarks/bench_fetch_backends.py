@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark: the garth fetch backend vs the raw-JSON one (FETCH_BACKEND).
+
+Runs against an in-process stand-in (utils/garmin_standin.py). For each data
+type fetches the same window both ways, one call at a time on this thread,
+and prints wall time and this thread's CPU time (parsing and validation; the
+server runs on other threads). Then serves a stress range with one malformed
+row and shows the requests ``fetch_raw`` makes with each backend: garth
+rejects the whole range and refetches day by day, raw skips the row.
+
+    python3 benchmarks/bench_fetch_backends.py
+    python3 benchmarks/bench_fetch_backends.py --days 28 --latency-ms 50
+"""
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+import raw_fetch
+from garmin_standin import start_standin
+from http_session import use_standin
+from synthetic_garmin import SyntheticAccount
+
+TYPES = ['DailyHeartRate', 'DailySleepData', 'TrainingReadinessData', 'DailySummary',
+         'BodyBatteryData', 'DailyHRV', 'DailyStress', 'DailySteps', 'WeightData']
+
+
+class MalformedStressAccount(SyntheticAccount):
+    """Synthetic account whose stress row for ``bad_day`` has no calendar date."""
+
+    def __init__(self, bad_day, **kwargs):
+        super().__init__(**kwargs)
+        self.bad_day = bad_day
+
+    def stress_range(self, start, end):
+        rows = super().stress_range(start, end)
+        return [{**row, "calendarDate": None} if row["calendarDate"] == self.bad_day else row for row in rows]
+
+
+def fetch_garth(class_name, day_list):
+    import garth
+    data_class = getattr(garth, class_name)
+    if class_name in collection_utils.RANGE_KEYED_CLASSES:
+        return data_class.list(day_list[0], len(day_list))
+    items = []
+    for d in day_list:
+        # .get() parses on this thread; .list() would hand it to a thread pool
+        day = data_class.get(d)
+        items.extend(day if isinstance(day, list) else [day] if day else [])
+    return items
+
+
+def fetch_raw(class_name, day_list):
+    if class_name in collection_utils.RANGE_KEYED_CLASSES:
+        return raw_fetch.fetch_range(class_name, day_list[0], len(day_list))
+    return [item for d in day_list for item in raw_fetch.fetch_day(class_name, d)]
+
+
+def measure(func, class_name, day_list, repeat):
+    """Best (wall s, thread CPU s) over ``repeat`` runs, and the item count."""
+    best_wall = best_cpu = float("inf")
+    for _ in range(repeat):
+        wall, cpu = time.perf_counter(), time.thread_time()
+        items = func(class_name, day_list)
+        best_wall = min(best_wall, time.perf_counter() - wall)
+        best_cpu = min(best_cpu, time.thread_time() - cpu)
+    return best_wall, best_cpu, len(items)
+
+
+def malformed_day(day_list):
+    """Requests fetch_raw sends for a stress range with one malformed row, per backend."""
+    server = start_standin(account=MalformedStressAccount(day_list[len(day_list) // 2]))
+    use_standin(server.url)
+    rows = []
+    try:
+        for backend in ('garth', 'raw'):
+            collection_utils.FETCH_BACKEND = backend
+            before = server.stats["requests"]
+            result = collection_utils.fetch_raw('daily_stress', 'DailyStress', len(day_list), day_list[0])
+            rows.append((backend, server.stats["requests"] - before, len(result.raw) if result else 0))
+    finally:
+        server.shutdown()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=14, help="window per data type")
+    parser.add_argument("--latency-ms", type=float, default=0, help="stand-in latency per request")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    collection_utils.CACHE_ENABLED = False
+    day_list = collection_utils._day_list(args.days, date.today().isoformat())
+    server = start_standin(latency_ms=args.latency_ms)
+    use_standin(server.url)
+    try:
+        print(f"{'type':<22} {'items':>5} {'garth ms':>9} {'raw ms':>8} {'garth cpu':>10} {'raw cpu':>8} {'cpu saved':>10}")
+        for class_name in TYPES:
+            g_wall, g_cpu, g_items = measure(fetch_garth, class_name, day_list, args.repeat)
+            r_wall, r_cpu, r_items = measure(fetch_raw, class_name, day_list, args.repeat)
+            items = g_items if g_items == r_items else f"{g_items}/{r_items}"
+            print(f"{class_name:<22} {items:>5} {g_wall * 1000:>9.1f} {r_wall * 1000:>8.1f} "
+                  f"{g_cpu * 1000:>10.1f} {r_cpu * 1000:>8.1f} {1 - r_cpu / g_cpu:>9.0%}")
+    finally:
+        server.shutdown()
+
+    print(f"\nStress range of {args.days} days with one malformed row:")
+    for backend, requests, items in malformed_day(day_list):
+        print(f"  {backend:<6} {requests:>3} requests, {items} days kept")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Benchmark: fetch_raw with and without a remembered fetch strategy.
+
+Uses an in-process stand-in whose account logs weight on few days,
+so a 30-day range comes back sparse and the fallback chain also tries every
+day one by one before settling on the range result. Prints requests and wall
+time for a first run (probe), a second run (strategy remembered) and a run
+after the memory expired (STRATEGY_TTL_S). The day cache is bypassed so
+every run downloads its days.
+
+    python3 benchmarks/bench_fetch_strategy.py --latency-ms 80
+"""
+import argparse
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from garmin_standin import start_standin
+from http_session import use_standin
+from response_cache import ResponseCache
+from synthetic_garmin import SyntheticAccount
+
+
+class SparseWeightAccount(SyntheticAccount):
+    """Synthetic account that weighs in on at most every fourth day."""
+
+    def _weight(self, day):
+        return super()._weight(day) if day.toordinal() % 4 == 0 else None
+
+
+def run(server, name, class_name, days):
+    before = server.stats["requests"]
+    started = time.perf_counter()
+    result = collection_utils.fetch_raw(name, class_name, days, date.today().isoformat())
+    elapsed = time.perf_counter() - started
+    return server.stats["requests"] - before, elapsed, len(result.raw) if result else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=30, help="weight window")
+    parser.add_argument("--latency-ms", type=float, default=40, help="stand-in latency per request")
+    args = parser.parse_args()
+
+    server = start_standin(account=SparseWeightAccount(), latency_ms=args.latency_ms)
+    use_standin(server.url)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            # today_ttl_s=0 and an unreachable settle time: no cached day is ever fresh
+            collection_utils._response_cache = ResponseCache(Path(tmp) / "cache.sqlite", 0, 10 ** 6)
+            print(f"{'run':<12} {'requests':>8} {'seconds':>8} {'items':>6}")
+            for label, ttl_s in (("probe", None), ("remembered", None), ("expired", 0)):
+                if ttl_s is not None:
+                    collection_utils.STRATEGY_TTL_S = ttl_s
+                requests, elapsed, items = run(server, "weight_data", "WeightData", args.days)
+                print(f"{label:<12} {requests:>8} {elapsed:>8.2f} {items:>6}")
+    finally:
+        collection_utils._response_cache = None
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Benchmark: heart-rate slimmer on the pure-Python vs NumPy series backend.
+
+First checks parity: both backends must produce identical slimmer output on
+a spread of generated days and edge cases (exits 1 otherwise). Then times
+both per series length to show where NumPy starts to pay off
+(``NUMPY_MIN_SAMPLES`` in config).
+
+    python3 benchmarks/bench_hr_backends.py
+    python3 benchmarks/bench_hr_backends.py --min-time 1
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import config
+import format_utils
+import slimmer_inputs as inputs
+from heart_rate_slimmer import slim_daily_heart_rate
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    numpy = None
+
+
+def use_backend(name):
+    config.SERIES_BACKEND = name
+    format_utils._series_backend.cache_clear()
+
+
+def parity_inputs():
+    """Generated days across densities and gap rates, plus edge cases."""
+    days = [inputs.heart_rate_day(interval_s=interval, missing=missing, seed=seed)
+            for seed in range(5) for interval in (1, 15, 120) for missing in (0.0, 0.02, 0.4)]
+    edge = inputs.heart_rate_day(seed=99)
+    first_ts = edge.heart_rate_values[0][0]
+    edges = [
+        {**vars(edge), 'heart_rate_values': [[first_ts, None]] * 10},              # all missing
+        {**vars(edge), 'heart_rate_values': [[first_ts, 61]]},                     # single sample
+        {**vars(edge), 'heart_rate_values': [[first_ts + i, 70] for i in range(9)]},  # constant
+        {**vars(edge), 'heart_rate_values': []},
+    ]
+    return days + edges
+
+
+def check_parity():
+    items = parity_inputs()
+    use_backend('python')
+    expected = [json.dumps(slim_daily_heart_rate(item), sort_keys=True) for item in items]
+    use_backend('numpy')
+    actual = [json.dumps(slim_daily_heart_rate(item), sort_keys=True) for item in items]
+    mismatches = [i for i, (a, b) in enumerate(zip(expected, actual)) if a != b]
+    if mismatches:
+        print(f"❌ Parity: {len(mismatches)}/{len(items)} inputs differ (first: #{mismatches[0]})")
+        print(f"   python: {expected[mismatches[0]]}\n   numpy:  {actual[mismatches[0]]}")
+        return False
+    print(f"✅ Parity: identical output on {len(items)} inputs")
+    return True
+
+
+def ops_per_sec(item, min_time):
+    slim_daily_heart_rate(item)
+    calls = 0
+    started = time.perf_counter()
+    while time.perf_counter() - started < min_time:
+        slim_daily_heart_rate(item)
+        calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per measurement")
+    args = parser.parse_args()
+
+    if numpy is None:
+        print("⚠️  NumPy is not installed — only the pure-Python backend is available")
+        return
+    if not check_parity():
+        sys.exit(1)
+
+    print(f"\n{'interval':>8} {'samples':>8} {'python ops/s':>13} {'numpy ops/s':>12} {'speedup':>8}")
+    for interval in (600, 300, 120, 60, 30, 15, 5, 1):
+        item = inputs.heart_rate_day(interval_s=interval)
+        use_backend('python')
+        python_ops = ops_per_sec(item, args.min_time)
+        use_backend('numpy')
+        numpy_ops = ops_per_sec(item, args.min_time)
+        print(f"{interval:>7}s {len(item.heart_rate_values):>8} {python_ops:>13.1f} {numpy_ops:>12.1f} "
+              f"{numpy_ops / python_ops:>7.2f}x")
+    use_backend('auto')
+    print(f"\nNUMPY_MIN_SAMPLES = {config.NUMPY_MIN_SAMPLES} (auto backend uses NumPy from there up)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Benchmark: per-call latency with and without connection reuse and compression.
+
+Runs against an in-process stand-in with per-request latency and a
+per-connection handshake delay (standing in for TCP + TLS setup). Each row
+is one garth client configuration making the same API calls:
+
+- no keep-alive: ``Connection: close``, so every call opens a connection
+- garth pool: garth's default 10-connection pool
+- tuned pool: ``tune_session`` with ``HTTP_POOL_SIZE``
+
+serially and in bursts of ``--threads`` calls at once, as each data type's
+day-by-day fetch does (connections a pool cannot keep between bursts are
+reopened by the next one). Prints mean and p95 per-call latency, wall time
+and connections opened. Then compares response bytes and latency of a large
+payload (a day of intraday heart rate) uncompressed and with the negotiated
+encoding.
+
+    python3 benchmarks/bench_http_pool.py --latency-ms 40 --connect-ms 120
+"""
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+from config import HTTP_POOL_SIZE
+from garmin_standin import start_standin
+from http_session import tune_session, use_standin
+
+
+def make_client(server, label):
+    import garth
+
+    client = garth.Client()
+    if label == "tuned pool":
+        tune_session(client, HTTP_POOL_SIZE)
+    use_standin(server.url, client)
+    if label == "no keep-alive":
+        client.sess.headers["Connection"] = "close"
+    elif label == "identity":
+        client.sess.headers["Accept-Encoding"] = "identity"
+    return client
+
+
+def timed_call(client, path):
+    started = time.perf_counter()
+    client.connectapi(path)
+    return time.perf_counter() - started
+
+
+def run(server, client, paths, threads):
+    """Per-call latencies, wall time, connections opened and bytes sent for ``paths``."""
+    before = dict(server.stats)
+    started = time.perf_counter()
+    latencies = []
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for burst in range(0, len(paths), threads):
+            latencies += executor.map(lambda path: timed_call(client, path), paths[burst:burst + threads])
+    wall = time.perf_counter() - started
+    return (latencies, wall, server.stats["connections"] - before["connections"],
+            server.stats["bytes_sent"] - before["bytes_sent"])
+
+
+def p95(values):
+    return statistics.quantiles(values, n=20)[-1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=40, help="stand-in latency per request")
+    parser.add_argument("--connect-ms", type=float, default=120, help="stand-in handshake per new connection")
+    parser.add_argument("--calls", type=int, default=120)
+    parser.add_argument("--threads", type=int, default=40)
+    args = parser.parse_args()
+
+    today = date.today()
+    days = [(today - timedelta(days=i)).isoformat() for i in range(args.calls)]
+    summary_paths = [f"/usersummary-service/usersummary/daily/?calendarDate={d}" for d in days]
+    server = start_standin(latency_ms=args.latency_ms, connect_ms=args.connect_ms)
+    try:
+        print(f"{'client':<14} {'threads':>7} {'mean ms':>8} {'p95 ms':>7} {'wall s':>7} {'connections':>11}")
+        for label in ("no keep-alive", "garth pool", "tuned pool"):
+            for threads in (1, args.threads):
+                client = make_client(server, label)
+                latencies, wall, connections, _ = run(server, client, summary_paths, threads)
+                print(f"{label:<14} {threads:>7} {statistics.mean(latencies) * 1000:>8.1f} "
+                      f"{p95(latencies) * 1000:>7.1f} {wall:>7.2f} {connections:>11}")
+                client.sess.close()
+
+        heart_rate_paths = [f"/wellness-service/wellness/dailyHeartRate?date={d}" for d in days[:20]]
+        print(f"\n{'encoding':<14} {'KB sent':>8} {'mean ms':>8}")
+        for label, encoding in (("identity", "identity"), ("tuned pool", None)):
+            client = make_client(server, label)
+            encoding = encoding or client.sess.headers["Accept-Encoding"]
+            latencies, _, _, sent = run(server, client, heart_rate_paths, 1)
+            print(f"{encoding:<14} {sent / 1024:>8.0f} {statistics.mean(latencies) * 1000:>8.1f}")
+            client.sess.close()
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
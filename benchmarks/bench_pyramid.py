@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark: picking a resolution from the pre-aggregated buckets vs rescanning the samples.
+
+Stores one day of heart rate in a ``SeriesStore`` for several sampling
+intervals, bucketed at every level of ``LEVELS`` (the collector only builds
+the levels in ``SERIES_BUCKET_MINUTES``), then builds the min/avg/max
+profile of that day at each level twice: by grouping the raw samples in Python (what a slimmer would do
+without the store) and with ``hr_profile`` over the stored buckets. Prints
+the time per profile and what building the buckets costs at ingest.
+Profiles must match (exits 1 otherwise).
+
+    python3 benchmarks/bench_pyramid.py --repeat 50
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import slimmer_inputs as inputs
+from heart_rate_slimmer import hr_profile
+from series_store import SeriesStore, heart_rate_rows
+
+LEVELS = (1, 5, 15, 30, 60)
+
+
+def rescan_profile(item, minutes):
+    """The same profile grouped from the day's samples."""
+    origin = int(item.start_timestamp_gmt.timestamp() * 1000)
+    buckets = {}
+    for ts, bpm in item.heart_rate_values:
+        if bpm is not None:
+            buckets.setdefault((ts - origin) // 60000 // minutes * minutes, []).append(bpm)
+    return [[f"{offset // 60:02d}:{offset % 60:02d}", min(values), round(sum(values) / len(values), 1), max(values)]
+            for offset, values in sorted(buckets.items()) if 0 <= offset < 24 * 60]
+
+
+def timed(repeat, func, *args):
+    """``(result, mean ms per call)``."""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = func(*args)
+    return result, (time.perf_counter() - started) * 1000 / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=50, help="calls per measurement")
+    args = parser.parse_args()
+
+    print(f"{'interval':>8} {'samples':>7} {'level':>5} {'rescan ms':>9} {'buckets ms':>10} {'speedup':>8}")
+    for interval in (120, 15, 1):
+        item = inputs.heart_rate_day(interval_s=interval)
+        day = str(item.calendar_date)
+        rows = heart_rate_rows([item])['heart_rate']
+        with tempfile.TemporaryDirectory() as tmp:
+            _, raw_ms = timed(5, SeriesStore(Path(tmp) / "raw").write, 'heart_rate', day, rows)
+            store = SeriesStore(Path(tmp) / "series", {'heart_rate': LEVELS})
+            _, ingest_ms = timed(5, store.write, 'heart_rate', day, rows)
+            for minutes in LEVELS:
+                expected, rescan_ms = timed(args.repeat, rescan_profile, item, minutes)
+                actual, bucket_ms = timed(args.repeat, hr_profile, store, day, minutes)
+                if actual != expected:
+                    print(f"❌ every {interval}s, {minutes}m: profiles differ")
+                    sys.exit(1)
+                print(f"{interval:>7}s {len(rows):>7} {minutes:>4}m {rescan_ms:>9.3f} {bucket_ms:>10.3f} "
+                      f"{rescan_ms / bucket_ms:>7.1f}x")
+        print(f"{'':>8} writing the day: {raw_ms:.2f} ms samples only, {ingest_ms:.2f} ms with every level\n")
+    print("✅ Identical profiles from the samples and the buckets")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark: garmin_scores_data connectapi fallback, per-day loop vs ranges.
+
+Runs against an in-process stand-in with per-request latency. For each
+window prints requests and wall time of the previous loop (one call per
+day) and of the range fallback (``SCORES_RANGE_DAYS`` per call, up to
+``SCORES_RANGE_WORKERS`` at once). Then serves a window where every range
+touching one day fails, to show that only that chunk goes day by day.
+
+    python3 benchmarks/bench_scores_fallback.py --latency-ms 120
+"""
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from garmin_standin import start_standin
+from http_session import use_standin
+from synthetic_garmin import SyntheticAccount
+
+
+class BrokenRangeAccount(SyntheticAccount):
+    """Synthetic account whose multi-day score ranges fail when they include ``bad_day``."""
+
+    def __init__(self, bad_day, **kwargs):
+        super().__init__(**kwargs)
+        self.bad_day = bad_day
+
+    def daily_scores(self, start, end):
+        if start != end and start <= self.bad_day <= end:
+            raise KeyError(start)  # the stand-in answers 404
+        return super().daily_scores(start, end)
+
+
+def per_day_loop(days, today):
+    """The fallback as it was before ranges: one call per day, errors skipped."""
+    import garth
+
+    raw_list = []
+    for d in collection_utils._day_list(days, today):
+        try:
+            raw = garth.connectapi(f'/wellness-service/wellness/scores/daily/{d}/{d}')
+            if raw and isinstance(raw, list):
+                raw_list.extend(raw)
+            elif raw and isinstance(raw, dict):
+                raw_list.append(raw)
+        except Exception:
+            pass
+    return raw_list
+
+
+def ranges(days, today):
+    result = collection_utils._fetch_scores_api('garmin_scores_data', 'GarminScoresData', days, today)
+    return result.raw if result else []
+
+
+def measure(server, func, days, today):
+    before = server.stats["requests"]
+    started = time.perf_counter()
+    items = func(days, today)
+    return server.stats["requests"] - before, time.perf_counter() - started, len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=60, help="stand-in latency per request")
+    args = parser.parse_args()
+    today = date.today().isoformat()
+
+    server = start_standin(latency_ms=args.latency_ms)
+    use_standin(server.url)
+    try:
+        print(f"{'days':>5} {'loop req':>9} {'loop s':>7} {'range req':>10} {'range s':>8} {'speedup':>8}")
+        for days in (7, 28, 90, 365):
+            loop_req, loop_s, loop_items = measure(server, per_day_loop, days, today)
+            range_req, range_s, range_items = measure(server, ranges, days, today)
+            assert loop_items == range_items, (loop_items, range_items)
+            print(f"{days:>5} {loop_req:>9} {loop_s:>7.2f} {range_req:>10} {range_s:>8.2f} "
+                  f"{loop_s / range_s:>7.1f}x")
+    finally:
+        server.shutdown()
+
+    days = 90
+    bad_day = collection_utils._day_list(days, today)[40]
+    server = start_standin(account=BrokenRangeAccount(bad_day), latency_ms=args.latency_ms)
+    use_standin(server.url)
+    try:
+        requests, elapsed, items = measure(server, ranges, days, today)
+        print(f"\n{days} days, ranges through {bad_day} failing: "
+              f"{requests} requests, {elapsed:.2f}s, {items}/{days} days kept")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Benchmark: 90 days of heart rate zones from cached responses vs the series store.
+
+Fills a response cache and a series store with the same ``--days`` days of
+heart rate, then computes the zone distribution over all of them twice: by
+loading each day's cached response into garth models and summarizing the
+samples (what a slimmer would otherwise need), and with
+``SeriesStore.summary`` over the memory-mapped arrays. Prints wall time and
+peak Python allocation (tracemalloc) for several sampling intervals, and the
+cost of writing a day to the store. Zones must match (exits 1 otherwise).
+
+    python3 benchmarks/bench_series_store.py --days 90
+"""
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import slimmer_inputs as inputs
+from format_utils import SeriesStats
+from heart_rate_slimmer import zone_pct
+from response_cache import ResponseCache, dump_items, load_items
+from series_store import SeriesStore
+
+MAX_HR = 185
+
+
+def from_cache(cache, data_class, day_list):
+    """Zones over ``day_list`` with every sample loaded from the cached responses."""
+    found, _ = cache.lookup("DailyHeartRate", day_list)
+    values = []
+    for payload in found.values():
+        for item in load_items(data_class, payload):
+            values.extend(point[1] for point in item.heart_rate_values)
+    return zone_pct(SeriesStats(values), MAX_HR)
+
+
+def from_store(store, last_day, days):
+    """Zones over the same days read memory-mapped from the series store."""
+    _, stats = store.summary('heart_rate', 'bpm', last_day, days)
+    return zone_pct(stats, MAX_HR)
+
+
+def measure(func, *args):
+    """``(result, seconds, peak MiB allocated)``: one timed call, and one more under tracemalloc."""
+    started = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=90, help="days of heart rate")
+    args = parser.parse_args()
+
+    from garth import DailyHeartRate
+
+    print(f"{'interval':>8} {'samples':>9} {'cache s':>8} {'cache MiB':>9} {'store s':>8} {'store MiB':>9} "
+          f"{'speedup':>8} {'write ms/day':>12}")
+    for interval in (120, 15, 5):
+        items = inputs.heart_rate_days(args.days, interval_s=interval)
+        by_day = {str(item.calendar_date): [item] for item in items}
+        day_list = list(by_day)
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResponseCache(Path(tmp) / "cache.sqlite")
+            cache.store("DailyHeartRate", {day: dump_items(DailyHeartRate, day_items)
+                                           for day, day_items in by_day.items()})
+            store = SeriesStore(Path(tmp) / "series")
+            started = time.perf_counter()
+            store.ingest("DailyHeartRate", by_day)
+            write_ms = (time.perf_counter() - started) * 1000 / len(by_day)
+
+            expected, cache_s, cache_mib = measure(from_cache, cache, DailyHeartRate, day_list)
+            actual, store_s, store_mib = measure(from_store, store, day_list[0], args.days)
+        if actual != expected:
+            print(f"❌ every {interval}s: zones differ: {actual} vs {expected}")
+            sys.exit(1)
+        samples = sum(len(item.heart_rate_values) for item in items)
+        print(f"{interval:>7}s {samples:>9} {cache_s:>8.3f} {cache_mib:>9.1f} {store_s:>8.3f} {store_mib:>9.1f} "
+              f"{cache_s / store_s:>7.1f}x {write_ms:>12.2f}")
+    print("\n✅ Identical zones from the cache and the series store")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Benchmark: slimmer throughput and memory on realistic and extreme inputs.
+
+For every case prints ops/sec (best of --repeat rounds), the tracemalloc peak
+of one call and the memory blocks it leaves allocated (its output), next to
+the stored baseline in benchmarks/baselines/slimmers.json. Baselines are
+machine-specific: refresh them with --update-baseline before comparing.
+
+    python3 benchmarks/bench_slimmers.py
+    python3 benchmarks/bench_slimmers.py --only hr --min-time 1
+    python3 benchmarks/bench_slimmers.py --update-baseline
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import slimmer_inputs as inputs
+from heart_rate_slimmer import slim_daily_heart_rate, slim_daily_heart_rate_list
+from body_battery_slimmer import slim_body_battery_list
+from sleep_data_slimmer import (
+    slim_daily_sleep_data, slim_daily_sleep_data_list,
+    aggregate_sleep_movement, aggregate_sleep_levels,
+)
+
+BASELINE_FILE = Path(__file__).parent / "baselines" / "slimmers.json"
+
+
+def _movement_args(interval_s):
+    night = inputs.sleep_night(movement_interval_s=interval_s)
+    return night.sleep_movement, night.daily_sleep_dto.sleep_start_timestamp_gmt
+
+
+def _levels_args():
+    night = inputs.sleep_night()
+    return night.sleep_levels, night.daily_sleep_dto.sleep_start_timestamp_gmt
+
+
+# name: (input description, build input, call slimmer on input)
+CASES = {
+    'hr_day': ("1 day, 2-min samples", lambda: inputs.heart_rate_day(), slim_daily_heart_rate),
+    'hr_day_1s': ("1 day, per-second samples", lambda: inputs.heart_rate_day(interval_s=1), slim_daily_heart_rate),
+    'hr_14d': ("14 days, 2-min samples", lambda: inputs.heart_rate_days(14), slim_daily_heart_rate_list),
+    'bb_day': ("8 events x 90 min, 3-min samples", lambda: inputs.body_battery_events(8), slim_body_battery_list),
+    'bb_day_1m': ("8 events x 6 h, 1-min samples (360 stress + 360 BB each)",
+                  lambda: inputs.body_battery_events(8, minutes=360, interval_s=60), slim_body_battery_list),
+    'bb_300_events': ("300 events x 6 h, 1-min samples, every 3rd high stress",
+                      lambda: inputs.body_battery_events(300, minutes=360, interval_s=60, high_stress_every=3),
+                      slim_body_battery_list),
+    'sleep_night': ("1 night, 1-min movement", lambda: inputs.sleep_night(), slim_daily_sleep_data),
+    'sleep_90d': ("90 nights, 1-min movement", lambda: inputs.sleep_nights(90), slim_daily_sleep_data_list),
+    'sleep_90d_summary': ("90 nights, no levels timeline (multi-day reports)", lambda: inputs.sleep_nights(90),
+                          lambda items: slim_daily_sleep_data_list(items, include_timeline=False)),
+    'sleep_movement_1s': ("1 night, per-second movement", lambda: _movement_args(1),
+                          lambda args: aggregate_sleep_movement(*args)),
+    'sleep_levels': ("1 night of stage segments", _levels_args, lambda args: aggregate_sleep_levels(*args)),
+}
+
+
+def ops_per_sec(func, arg, min_time, repeat):
+    """Best calls/second over ``repeat`` rounds of at least ``min_time`` seconds."""
+    func(arg)  # warm-up
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        started = time.perf_counter()
+        while True:
+            func(arg)
+            calls += 1
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_time:
+                break
+        best = max(best, calls / elapsed)
+    return best
+
+
+def memory(func, arg):
+    """(peak KiB of one call, blocks still allocated afterwards)."""
+    gc.collect()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    result = func(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(ignore)
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    del result
+    return round((peak - base) / 1024, 1), blocks
+
+
+def _delta(value, base, higher_is_better):
+    """Relative change vs baseline as '+12%' and whether it is a regression."""
+    if not base:
+        return "", 0.0
+    change = (value - base) / base
+    worse = -change if higher_is_better else change
+    return f"{change:+.0%}", worse
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", help="run only cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.3, help="seconds per timing round")
+    parser.add_argument("--repeat", type=int, default=3, help="timing rounds per case")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="regression threshold vs baseline")
+    parser.add_argument("--update-baseline", action="store_true", help=f"store results in {BASELINE_FILE.name}")
+    args = parser.parse_args()
+
+    baseline = json.loads(BASELINE_FILE.read_text()) if BASELINE_FILE.exists() else {}
+    base_cases = baseline.get('cases', {})
+    results = {}
+    regressions = []
+
+    print(f"{'case':<18} {'ops/s':>10} {'vs base':>8} {'peak KiB':>10} {'vs base':>8} {'blocks':>8}  input")
+    for name, (description, build, func) in CASES.items():
+        if args.only and args.only not in name:
+            continue
+        arg = build()
+        ops = ops_per_sec(func, arg, args.min_time, args.repeat)
+        peak_kib, blocks = memory(func, arg)
+        results[name] = {'ops_per_sec': round(ops, 2), 'peak_kib': peak_kib, 'blocks': blocks}
+
+        base = base_cases.get(name, {})
+        ops_delta, ops_worse = _delta(ops, base.get('ops_per_sec'), higher_is_better=True)
+        mem_delta, mem_worse = _delta(peak_kib, base.get('peak_kib'), higher_is_better=False)
+        flag = ""
+        if ops_worse > args.tolerance or mem_worse > args.tolerance:
+            flag = "  ⚠️"
+            regressions.append(name)
+        print(f"{name:<18} {ops:>10.1f} {ops_delta:>8} {peak_kib:>10.1f} {mem_delta:>8} {blocks:>8}  {description}{flag}")
+
+    if args.update_baseline:
+        base_cases.update(results)
+        BASELINE_FILE.parent.mkdir(exist_ok=True)
+        BASELINE_FILE.write_text(json.dumps({
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cases': base_cases,
+        }, indent=2) + "\n")
+        print(f"\n💾 Baseline updated: {BASELINE_FILE}")
+    elif regressions:
+        print(f"\n⚠️  Slower or heavier than baseline by >{args.tolerance:.0%}: {', '.join(regressions)}")
+    elif base_cases:
+        print("\n✅ Within baseline tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Benchmark: cold-start import time of every entry point (python -X importtime).
+
+Each entry point is imported (not run) in a fresh interpreter, so the numbers
+are what a run pays before its first Garmin request.
+
+    python3 benchmarks/bench_startup.py
+    python3 benchmarks/bench_startup.py --repeat 5 --top 3
+"""
+import argparse
+import re
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def entry_points():
+    """(label, directory to put on sys.path, module name) for every entry point."""
+    points = [("run.py", PROJECT_ROOT, "run")]
+    points += [(f"run_{p.stem[4:]}.py", PROJECT_ROOT, p.stem) for p in sorted(PROJECT_ROOT.glob("run_*.py"))]
+    points += [(f"scripts/{p.name}", PROJECT_ROOT / "scripts", p.stem) for p in sorted((PROJECT_ROOT / "scripts").glob("*.py"))]
+    return points
+
+
+def measure(directory, module):
+    """Import ``module`` in a fresh interpreter. Returns (import µs, wall s, {module: cumulative µs})."""
+    code = f"import sys; sys.path.insert(0, {str(directory)!r}); import {module}"
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        capture_output=True, text=True, cwd=str(directory),
+    )
+    wall = time.perf_counter() - started
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    total = 0
+    top_level = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = int(match.group(2)), match.group(3), match.group(4)
+        if len(indent) <= 1:  # top-level import of the -c snippet
+            total += cumulative
+            top_level[name] = top_level.get(name, 0) + cumulative
+    return total, wall, top_level
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per entry point (best is reported)")
+    parser.add_argument("--top", type=int, default=2, help="heaviest top-level imports to show")
+    args = parser.parse_args()
+
+    print(f"{'entry point':<38} {'imports ms':>10} {'wall ms':>8}  heaviest")
+    for label, directory, module in entry_points():
+        try:
+            runs = [measure(directory, module) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{label:<38} {'failed':>10}  {e}")
+            continue
+        total, wall, top_level = min(runs, key=lambda r: r[0])
+        heaviest = sorted(top_level.items(), key=lambda kv: -kv[1])[:args.top]
+        heaviest_str = ", ".join(f"{name} {us / 1000:.0f}ms" for name, us in heaviest)
+        print(f"{label:<38} {total / 1000:>10.1f} {min(r[1] for r in runs) * 1000:>8.0f}  {heaviest_str}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Benchmark: repeated collections with and without a watch sync in between.
+
+Runs against an in-process stand-in whose simulated watch last synced an
+hour ago, with a fresh cache. Collects the reports once, then again with
+nothing synced (the report files are kept after one sync-status request),
+with ``--refresh`` (collected anyway; days still fresh in the cache are
+served from it), after a new sync (today's data is fetched again, settled
+days come from the cache) and once more with nothing synced. Prints wall
+time, requests and which report files were kept or changed.
+
+    python3 benchmarks/bench_sync_probe.py --latency-ms 80 --reports evening,morning
+"""
+import argparse
+import io
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from activity_store import ActivityStore
+from config import CACHE_SETTLE_HOURS, CACHE_TODAY_TTL_S, REPORTS
+from fetch_planner import build_plan, run_plan
+from garmin_standin import start_standin
+from http_session import use_standin
+from response_cache import ResponseCache
+
+
+def change(path, before):
+    """How a report file compares with ``(mtime_ns, content)`` from before the run."""
+    if before is None:
+        return "new"
+    if path.stat().st_mtime_ns == before[0]:
+        return "kept"
+    return "same" if path.read_bytes() == before[1] else "changed"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=80, help="stand-in latency per request")
+    parser.add_argument("--reports", default="evening,morning", help="comma-separated reports to collect")
+    args = parser.parse_args()
+    report_names = [r.strip() for r in args.reports.split(",") if r.strip()]
+
+    import garth
+
+    server = start_standin(latency_ms=args.latency_ms)
+    account = server.account
+    account.synced_at = datetime.now(timezone.utc) - timedelta(hours=1)
+    collection_utils.SYNC_SETTLE_S = 0  # the stand-in has nothing left to compute after a sync
+    collection_utils.install_throttle(garth.client)
+    use_standin(server.url)
+    runs = [
+        ("first run", False, None),
+        ("nothing synced", False, None),
+        ("--refresh", True, None),
+        ("after a sync", False, timedelta(0)),
+        ("nothing synced", False, None),
+    ]
+    print(f"{'run':<16} {'seconds':>7} {'requests':>8}  report files")
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            results_dir = Path(tmp)
+            collection_utils._response_cache = ResponseCache(results_dir / "cache.sqlite", CACHE_TODAY_TTL_S,
+                                                             CACHE_SETTLE_HOURS)
+            collection_utils._activity_store = ActivityStore(results_dir / "cache.sqlite")
+            outputs = [results_dir / REPORTS[report][1] for report in report_names]
+            for label, refresh, sync_ago in runs:
+                if sync_ago is not None:
+                    account.synced_at = datetime.now(timezone.utc) - sync_ago
+                before = {path: (path.stat().st_mtime_ns, path.read_bytes()) if path.exists() else None
+                          for path in outputs}
+                requests = server.stats["requests"]
+                started = time.perf_counter()
+                with redirect_stdout(io.StringIO()):
+                    run_plan(build_plan(report_names), report_names, results_dir, refresh=refresh)
+                elapsed = time.perf_counter() - started
+                files = ", ".join(f"{path.name} {change(path, before[path])}" for path in outputs)
+                print(f"{label:<16} {elapsed:>7.2f} {server.stats['requests'] - requests:>8}  {files}")
+    finally:
+        collection_utils._response_cache = collection_utils._activity_store = None
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark: health report collection under throttling, with and without the client throttle.
+
+Runs against in-process stand-ins that answer 429 at random (``--rate-429``)
+or to requests beyond ``--max-in-flight`` at once. For each, fetches every
+health report data type concurrently, without the throttle (the previous
+behaviour: a throttled day is lost) and with ``install_throttle`` (rate
+limit, AIMD concurrency, backoff and retries). Prints wall time, requests,
+429s and how much of the data arrived compared with an unthrottled server.
+
+    python3 benchmarks/bench_throttle.py --latency-ms 80 --rate-429 0.1 --max-in-flight 6
+"""
+import argparse
+import io
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+import collection_utils
+from config import DATA_TYPES_HEALTH, FETCH_WORKERS, HTTP_POOL_SIZE
+from garmin_standin import start_standin
+from http_session import tune_session, use_standin
+
+
+def collect(today):
+    """Items fetched per data type, all types at once as ``collect_data`` does."""
+    def fetch(entry):
+        name, class_name, days = entry[:3]
+        result = collection_utils.fetch_raw(name, class_name, days, today)
+        return name, len(result.raw) if result else 0
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        return dict(executor.map(fetch, DATA_TYPES_HEALTH))
+
+
+def run(server_kwargs, throttled, today):
+    """``(items per type, seconds, server stats, throttle stats)`` of one collection."""
+    import garth
+
+    server = start_standin(**server_kwargs)
+    tune_session(garth.client, HTTP_POOL_SIZE)
+    garth.client.sess.__dict__.pop("send", None)  # drop a throttle installed by an earlier run
+    throttle = collection_utils.install_throttle(garth.client) if throttled else None
+    use_standin(server.url)
+    collection_utils._breakers.clear()
+    try:
+        started = time.perf_counter()
+        with redirect_stdout(io.StringIO()):  # per-type warnings
+            items = collect(today)
+        return items, time.perf_counter() - started, dict(server.stats), throttle.stats if throttle else None
+    finally:
+        server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency-ms", type=float, default=80, help="stand-in latency per request")
+    parser.add_argument("--rate-429", type=float, default=0.1, help="fraction of requests answered with 429")
+    parser.add_argument("--max-in-flight", type=int, default=6, help="server limit on concurrent requests")
+    args = parser.parse_args()
+
+    collection_utils.CACHE_ENABLED = False
+    logging.disable(logging.WARNING)  # garth logs every body battery day it could not fetch
+    today = date.today().isoformat()
+    expected, *_ = run({"latency_ms": args.latency_ms}, False, today)
+    total = sum(expected.values())
+    scenarios = [
+        (f"random 429 ({args.rate_429:.0%})", {"latency_ms": args.latency_ms, "rate_429": args.rate_429}),
+        (f"max {args.max_in_flight} in flight", {"latency_ms": args.latency_ms, "max_in_flight": args.max_in_flight}),
+    ]
+    print(f"{'server':<22} {'client':<10} {'seconds':>7} {'requests':>8} {'429s':>5} {'retries':>7} {'data':>5}  "
+          f"incomplete types")
+    for label, server_kwargs in scenarios:
+        for throttled in (False, True):
+            items, elapsed, stats, throttle_stats = run(server_kwargs, throttled, today)
+            retries = throttle_stats["retries"] if throttle_stats else 0
+            complete = sum(min(items[name], count) for name, count in expected.items()) / total
+            short = [name for name, count in expected.items() if items[name] < count]
+            print(f"{label:<22} {'throttled' if throttled else 'plain':<10} {elapsed:>7.2f} {stats['requests']:>8} "
+                  f"{stats['throttled']:>5} {retries:>7} {complete:>5.0%}  {', '.join(short) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
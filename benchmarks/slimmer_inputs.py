@@ -0,0 +1,150 @@
+"""Synthetic slimmer inputs for the benchmarks: realistic days and extreme sizes.
+
+Generators return garth model instances built the way garth builds them from
+API responses, so the slimmers see the same objects as in a real run. Every
+generator is deterministic for a given seed.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+
+from garth import BodyBatteryData, DailyHeartRate, DailySleepData
+from garth.data.body_battery import BodyBatteryEvent
+from garth.utils import camel_to_snake_dict
+
+DAY = date(2025, 3, 14)
+TZ_OFFSET_MS = 3 * 3600 * 1000
+
+
+def _ms(dt):
+    return int(dt.timestamp() * 1000)
+
+
+def _midnight_gmt(day):
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc) - timedelta(milliseconds=TZ_OFFSET_MS)
+
+
+def heart_rate_day(day=DAY, interval_s=120, missing=0.02, seed=0):
+    """One DailyHeartRate with a sample every ``interval_s`` seconds (120 = Garmin default)."""
+    rng = random.Random(f"hr:{seed}:{day}")
+    start = _midnight_gmt(day)
+    rhr = 48 + rng.randint(0, 8)
+    hr = rhr + 20
+    values = []
+    for n in range(86400 // interval_s):
+        ts = start + timedelta(seconds=n * interval_s)
+        hour = n * interval_s / 3600
+        target = rhr + 3 if hour < 6.5 else 150 if 17.5 <= hour < 18.5 else rhr + 25
+        hr = max(38, min(195, hr + (target - hr) * 0.05 + rng.uniform(-3, 3)))
+        values.append([_ms(ts), None if rng.random() < missing else int(hr)])
+    valid = [v for _, v in values if v is not None]
+    return DailyHeartRate(
+        user_profile_pk=1, calendar_date=day,
+        start_timestamp_gmt=start, end_timestamp_gmt=start + timedelta(days=1),
+        start_timestamp_local=start, end_timestamp_local=start + timedelta(days=1),
+        max_heart_rate=max(valid), min_heart_rate=min(valid), resting_heart_rate=rhr,
+        last_seven_days_avg_resting_heart_rate=rhr + rng.randint(-2, 2),
+        heart_rate_values=values,
+    )
+
+
+def heart_rate_days(days=14, interval_s=120, seed=0):
+    return [heart_rate_day(DAY - timedelta(days=i), interval_s, seed=seed) for i in range(days)]
+
+
+def body_battery_event(start, minutes, event_type="SLEEP", interval_s=180, high_stress=False, seed=0):
+    """One BodyBatteryData event with stress and BB samples every ``interval_s``."""
+    rng = random.Random(f"bb:{seed}:{start}:{event_type}")
+    stress, battery = [], []
+    level = rng.randint(20, 60)
+    for n in range(minutes * 60 // interval_s):
+        ts = _ms(start) + n * interval_s * 1000
+        if event_type == "ACTIVITY":
+            value = -2
+        else:
+            value = int(abs(rng.gauss(70 if high_stress else 15, 12)))
+        stress.append([ts, -1 if rng.random() < 0.03 else value])  # -1: no reading
+        level = max(0, min(100, level + (1 if event_type == "SLEEP" else -1) * rng.choice([0, 0, 1])))
+        battery.append([ts, "MEASURED", level, 2.0])
+    return BodyBatteryData(
+        event=BodyBatteryEvent(
+            event_type=event_type, event_start_time_gmt=start.replace(tzinfo=None),
+            timezone_offset=TZ_OFFSET_MS, duration_in_milliseconds=minutes * 60000,
+            body_battery_impact=battery[-1][2] - battery[0][2],
+            feedback_type="GOOD_SLEEP", short_feedback="RESTFUL_PERIOD",
+        ),
+        activity_name="Run" if event_type == "ACTIVITY" else None,
+        activity_type="running" if event_type == "ACTIVITY" else None,
+        activity_id=1000 + seed if event_type == "ACTIVITY" else None,
+        average_stress=round(sum(v for _, v in stress if v and v > 0) / len(stress), 1),
+        stress_values_array=stress,
+        body_battery_values_array=battery,
+    )
+
+
+def body_battery_events(count=8, minutes=90, interval_s=180, high_stress_every=0, seed=0):
+    """``count`` events spread over consecutive days (sleep/activity alternating)."""
+    events = []
+    for n in range(count):
+        start = _midnight_gmt(DAY - timedelta(days=n // 2)) + timedelta(hours=1 if n % 2 == 0 else 17)
+        event_type = "SLEEP" if n % 2 == 0 else "ACTIVITY"
+        high = bool(high_stress_every) and n % high_stress_every == 0
+        events.append(body_battery_event(start, minutes, event_type, interval_s,
+                                         high_stress=high, seed=seed + n))
+    return events
+
+
+def sleep_night(day=DAY, movement_interval_s=60, seed=0):
+    """One DailySleepData with movement samples every ``movement_interval_s``."""
+    rng = random.Random(f"sleep:{seed}:{day}")
+    start = _midnight_gmt(day) - timedelta(minutes=rng.randint(60, 150))
+    end = start + timedelta(minutes=rng.randint(400, 520))
+
+    def gmt(dt):
+        return dt.strftime("%Y-%m-%dT%H:%M:%S.0")
+
+    levels, seconds = [], [0, 0, 0, 0]
+    ts = start
+    while ts < end:
+        seg_end = min(ts + timedelta(minutes=rng.randint(5, 40)), end)
+        level = rng.choices([0, 1, 2, 3], weights=[2, 5, 2, 1])[0]
+        levels.append({"startGMT": gmt(ts), "endGMT": gmt(seg_end), "activityLevel": float(level)})
+        seconds[level] += int((seg_end - ts).total_seconds())
+        ts = seg_end
+    movement = []
+    ts = start - timedelta(minutes=30)
+    while ts < end + timedelta(minutes=30):
+        step = timedelta(seconds=movement_interval_s)
+        movement.append({"startGMT": gmt(ts), "endGMT": gmt(ts + step),
+                         "activityLevel": round(abs(rng.gauss(0.4, 0.6)), 6)})
+        ts += step
+
+    def score(key, value=None):
+        return {"qualifierKey": key, "value": value}
+
+    raw = {
+        "dailySleepDTO": {
+            "id": _ms(start), "userProfilePK": 1, "calendarDate": day.isoformat(),
+            "sleepTimeSeconds": sum(seconds) - seconds[3], "napTimeSeconds": 0,
+            "sleepWindowConfirmed": True, "sleepWindowConfirmationType": "enhanced_confirmed_final",
+            "sleepStartTimestampGMT": _ms(start), "sleepEndTimestampGMT": _ms(end),
+            "sleepStartTimestampLocal": _ms(start) + TZ_OFFSET_MS,
+            "sleepEndTimestampLocal": _ms(end) + TZ_OFFSET_MS,
+            "deepSleepSeconds": seconds[0], "lightSleepSeconds": seconds[1],
+            "remSleepSeconds": seconds[2], "awakeSleepSeconds": seconds[3],
+            "deviceRemCapable": True, "retro": False, "awakeCount": rng.randint(0, 4),
+            "avgSleepStress": 14.0, "averageRespirationValue": 14.0,
+            "sleepScores": {key: score("GOOD", 80 if key == "overall" else None) for key in (
+                "totalDuration", "stress", "awakeCount", "overall", "remPercentage",
+                "restlessness", "lightPercentage", "deepPercentage")},
+        },
+        "remSleepData": True,
+        "sleepMovement": movement,
+        "sleepLevels": levels,
+        "restingHeartRate": 50,
+        "bodyBatteryChange": 45,
+    }
+    return DailySleepData(**camel_to_snake_dict(raw))
+
+
+def sleep_nights(days=90, movement_interval_s=60, seed=0):
+    return [sleep_night(DAY - timedelta(days=i), movement_interval_s, seed) for i in range(days)]
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Unified workflow: collect one or more reports and upload them to ChatGPT.
+
+Everything runs in this one process with a single authenticated Garmin
+session; several reports share one de-duplicated fetch plan.
+
+    python3 run.py morning
+    python3 run.py --reports morning,health,weekly
+    python3 run.py weekly --collect-only
+    python3 run.py morning --deadline 20    # save whatever has arrived after 20s
+    python3 run.py evening --refresh        # collect even if the watch has not synced since
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "utils"))
+from config import (
+    GARTH_DIR, RESULTS_DIR, REPORTS,
+    CHATGPT_URL, DELAY_MS, FINDER_WAIT_MS, UPLOAD_WAIT_MS,
+)
+
+
+def collect(report_names, deadline=None, refresh=False):
+    """Collect all requested reports with one Garmin session.
+
+    ``deadline`` (seconds) replaces every report's ``REPORT_DEADLINES_S``; 0 means none.
+    Report files collected since the watch last synced are kept unless ``refresh`` is set.
+    """
+    from collection_utils import authenticate, collect_latest_activity
+    from fetch_planner import build_plan, run_plan
+
+    authenticate(GARTH_DIR)
+    planned = [r for r in report_names if REPORTS[r][0] is not None]
+    if planned:
+        deadlines = None if deadline is None else {r: deadline or None for r in planned}
+        run_plan(build_plan(planned), planned, RESULTS_DIR, deadlines=deadlines, refresh=refresh)
+    if 'activity' in report_names:
+        collect_latest_activity(RESULTS_DIR / REPORTS['activity'][1], RESULTS_DIR)
+
+
+def upload(report_names):
+    """Upload each report's data file with its prompt."""
+    import config
+    from upload_utils import upload_to_chatgpt
+
+    for report in report_names:
+        _, output_name, prompt_name = REPORTS[report]
+        prompt = getattr(config, prompt_name)
+        data_file = RESULTS_DIR / output_name
+        if not data_file.exists():
+            print(f"\n❌ Data file not found: {data_file}")
+            sys.exit(1)
+        print(f"\n📤 Uploading {report} report to ChatGPT...")
+        upload_to_chatgpt(data_file, prompt, CHATGPT_URL, DELAY_MS, FINDER_WAIT_MS, UPLOAD_WAIT_MS)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Collect Garmin reports and upload them to ChatGPT.")
+    parser.add_argument("report", nargs="?", choices=list(REPORTS), help="report to run")
+    parser.add_argument("--reports", help="comma-separated list of reports to run together")
+    step = parser.add_mutually_exclusive_group()
+    step.add_argument("--collect-only", action="store_true", help="collect data, skip ChatGPT upload")
+    step.add_argument("--upload-only", action="store_true", help="upload existing results, skip collection")
+    parser.add_argument("--deadline", type=float, metavar="SECONDS",
+                        help="save each report after this long even if data is missing (0: wait for all)")
+    parser.add_argument("--refresh", action="store_true", help="collect even if nothing synced since the last run")
+    args = parser.parse_args(argv)
+
+    report_names = [args.report] if args.report else []
+    if args.reports:
+        report_names += [r.strip() for r in args.reports.split(",") if r.strip()]
+    report_names = list(dict.fromkeys(report_names))
+    if not report_names:
+        parser.error("choose a report or pass --reports")
+    unknown = [r for r in report_names if r not in REPORTS]
+    if unknown:
+        parser.error(f"unknown report(s): {', '.join(unknown)}")
+
+    try:
+        print(f"🚀 Reports: {', '.join(report_names)}\n")
+        if not args.upload_only:
+            print("📊 Step 1: Collecting data...")
+            collect(report_names, args.deadline, args.refresh)
+        if not args.collect_only:
+            print("\n📤 Step 2: Uploading to ChatGPT...")
+            upload(report_names)
+        print("\n✅ Workflow complete!")
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
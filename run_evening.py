@@ -1,47 +1,13 @@
 #!/usr/bin/env python3
-import subprocess
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent / "utils"))
-from config import RESULTS_DIR
-
-DATA_FILE = RESULTS_DIR / "evening_data.json"
-VENV_PYTHON = Path(__file__).parent / "venv" / "bin" / "python3"
+"""Evening Workflow: Collect data and upload to ChatGPT.
 
+Shortcut for ``python3 run.py evening`` (same process, no subprocesses).
+"""
+import sys
 
-def main():
-    python_cmd = str(VENV_PYTHON) if VENV_PYTHON.exists() else sys.executable
-    
-    print("🌙 Starting evening workflow...\n")
-    
-    print("📊 Step 1: Collecting evening data...")
-    try:
-        subprocess.run([python_cmd, "scripts/collect_evening.py"], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Failed to collect data: {e}")
-        sys.exit(1)
-    
-    if not DATA_FILE.exists():
-        print(f"\n❌ Data file not found: {DATA_FILE}")
-        sys.exit(1)
-    
-    print("\n📤 Step 2: Uploading to ChatGPT...")
-    try:
-        subprocess.run([python_cmd, "scripts/upload_evening.py"], check=True)
-    except subprocess.CalledProcessError as e:
-        print(f"\n❌ Failed to upload: {e}")
-        sys.exit(1)
-    
-    print("\n✅ Evening workflow complete!")
+from run import main
 
 
 if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\n⚠️  Interrupted by user")
-        sys.exit(1)
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        sys.exit(1)
+    print("🌙 Starting evening workflow...\n")
+    main(["evening"] + sys.argv[1:])
@@ -3,14 +3,15 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
-from config import GARTH_DIR, RESULTS_DIR, DAYS_TO_COLLECT, DATA_TYPES_EVENING
+from config import GARTH_DIR, RESULTS_DIR, DAYS_TO_COLLECT, DATA_TYPES_EVENING, REPORT_DEADLINES_S
 from collection_utils import authenticate, collect_data
 
 
 def main():
     try:
         authenticate(GARTH_DIR)
-        collect_data(DATA_TYPES_EVENING, RESULTS_DIR / "evening_data.json", RESULTS_DIR, DAYS_TO_COLLECT)
+        collect_data(DATA_TYPES_EVENING, RESULTS_DIR / "evening_data.json", RESULTS_DIR, DAYS_TO_COLLECT,
+                     deadline_s=REPORT_DEADLINES_S.get('evening'))
     except KeyboardInterrupt:
         print("\n⚠️  Interrupted by user")
         sys.exit(1)
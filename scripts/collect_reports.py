@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Collect several reports at once with a shared, de-duplicated fetch plan.
+
+    python3 scripts/collect_reports.py morning,health,weekly
+    python3 scripts/collect_reports.py morning,health,weekly --dry-run
+    python3 scripts/collect_reports.py morning,weekly --deadline 30
+    python3 scripts/collect_reports.py morning,weekly --refresh    # even if nothing synced
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "utils"))
+from config import GARTH_DIR, RESULTS_DIR, REPORTS
+from collection_utils import authenticate
+from fetch_planner import build_plan, print_plan, run_plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect several reports with one shared fetch plan.")
+    parser.add_argument("reports", help=f"comma-separated report names: {','.join(r for r in REPORTS if REPORTS[r][0])}")
+    parser.add_argument("--dry-run", action="store_true", help="print the plan, expected API calls and cache hits")
+    parser.add_argument("--deadline", type=float, metavar="SECONDS",
+                        help="save each report after this long even if data is missing (0: wait for all)")
+    parser.add_argument("--refresh", action="store_true", help="collect even if nothing synced since the last run")
+    args = parser.parse_args()
+
+    report_names = [r.strip() for r in args.reports.split(",") if r.strip()]
+    unknown = [r for r in report_names if r not in REPORTS or REPORTS[r][0] is None]
+    if unknown:
+        parser.error(f"unknown report(s): {', '.join(unknown)}")
+
+    try:
+        plan = build_plan(report_names)
+        if args.dry_run:
+            print_plan(plan)
+            return
+        authenticate(GARTH_DIR)
+        deadlines = None if args.deadline is None else {r: args.deadline or None for r in report_names}
+        run_plan(plan, report_names, RESULTS_DIR, deadlines=deadlines, refresh=args.refresh)
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted by user")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Local store of finished activities, synced incrementally from the activity list.
+
+Lives in the response cache database. Activities are keyed by
+``activity_id`` and never refetched: a sync pages the newest-first list only
+until it reaches an activity it already has, and pages further back only
+when a report asks for more history than is stored. Detail and splits
+payloads of an activity are kept forever too (finished activities do not
+change).
+
+Payloads are stored as JSON strings; callers serialize them (see
+``response_cache.dump_items``).
+"""
+import sqlite3
+import time
+from contextlib import contextmanager
+
+
+class ActivityStore:
+    """Activities by ID, newest first, plus their per-activity payloads."""
+
+    def __init__(self, db_path):
+        self.db_path = str(db_path)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS activities ("
+                " activity_id INTEGER PRIMARY KEY,"
+                " start_time_gmt TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " synced_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS activities_by_start ON activities (start_time_gmt DESC, activity_id DESC)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS activity_payloads ("
+                " activity_id INTEGER NOT NULL,"
+                " kind TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " PRIMARY KEY (activity_id, kind))"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS activity_sync (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def count(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM activities").fetchone()[0]
+
+    def known(self, activity_ids):
+        """The subset of ``activity_ids`` already stored."""
+        activity_ids = list(activity_ids)
+        if not activity_ids:
+            return set()
+        placeholders = ",".join("?" * len(activity_ids))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT activity_id FROM activities WHERE activity_id IN ({placeholders})", activity_ids
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def add(self, rows):
+        """Store ``(activity_id, start_time_gmt, payload)`` rows; known IDs are left as they are."""
+        if not rows:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO activities (activity_id, start_time_gmt, payload, synced_at) VALUES (?, ?, ?, ?)",
+                [(activity_id, str(start), payload, now) for activity_id, start, payload in rows],
+            )
+
+    def recent(self, limit):
+        """Payloads of the newest ``limit`` activities, newest first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT payload FROM activities ORDER BY start_time_gmt DESC, activity_id DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    @property
+    def history_complete(self):
+        """True once a sync reached the account's oldest activity."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT value FROM activity_sync WHERE key = 'history_complete'").fetchone()
+        return row is not None and row[0] == "1"
+
+    def mark_history_complete(self):
+        with self._connect() as conn:
+            conn.execute("INSERT OR REPLACE INTO activity_sync (key, value) VALUES ('history_complete', '1')")
+
+    def payload(self, activity_id, kind):
+        """Stored ``kind`` payload (e.g. ``'detail'``, ``'splits'``) of an activity, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload FROM activity_payloads WHERE activity_id = ? AND kind = ?", (activity_id, kind)
+            ).fetchone()
+        return row[0] if row else None
+
+    def store_payload(self, activity_id, kind, payload):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO activity_payloads (activity_id, kind, payload) VALUES (?, ?, ?)",
+                (activity_id, kind, payload),
+            )
+
+
+def sync(store, wanted, list_page, page_size, probe_size=10):
+    """Bring ``store`` up to date and hold at least ``wanted`` activities if the account has them.
+
+    ``list_page(start, limit)`` returns one page of the newest-first activity
+    list as ``(activity_id, start_time_gmt, payload)`` rows. New activities are
+    paged in from the top until a stored one shows up (or, on an empty
+    store, until ``wanted`` are in); older history is paged in from offset
+    ``store.count()`` since the stored activities are the top of the list.
+    A store that is already filled starts with a ``probe_size`` page, as
+    usually only a few activities are new. Returns the number of pages requested.
+    """
+    pages = 0
+    was_empty = store.count() == 0
+    new_rows = []
+    complete = False
+    start = 0
+    limit = min(page_size, max(wanted, probe_size)) if was_empty else probe_size
+    while True:
+        page = list_page(start, limit)
+        pages += 1
+        known = store.known(row[0] for row in page)
+        new_rows += [row for row in page if row[0] not in known]
+        if len(page) < limit:
+            complete = True
+            break
+        if known or (was_empty and len(new_rows) >= wanted):
+            break
+        start, limit = start + limit, page_size
+    # New activities are added together, so an interrupted sync leaves no gap below them
+    store.add(new_rows)
+    if complete:
+        store.mark_history_complete()
+
+    count = store.count()
+    while count < wanted and not store.history_complete:
+        page = list_page(count, page_size)
+        pages += 1
+        store.add(page)
+        if len(page) < page_size:
+            store.mark_history_complete()
+        previous, count = count, store.count()
+        if count == previous:
+            break  # nothing new at this offset (activities deleted upstream); try again next run
+    return pages
@@ -1,21 +1,137 @@
-from format_utils import to_dict, gmt_iso_to_local_iso, ms_to_local_iso, percentile
+from bisect import bisect_left
+from datetime import datetime
+from operator import lt
 
+from format_utils import to_dict, gmt_iso_to_local_iso, ms_to_local_iso, SeriesStats
 
-def slim_body_battery_item(item):
-    """Convert BodyBatteryData to compact analysis-ready dict."""
+def series_columns(points, value_index):
+    """(timestamps, values) of ``[[ts, ..., value, ...], ...]`` with unique, increasing timestamps.
+
+    Points too short to hold a value are skipped. Input arrives time-ordered,
+    so this is normally two list comprehensions and a linear check; otherwise
+    points are sorted stably and, as before, the last value of a repeated
+    timestamp wins.
+    """
+    try:
+        ts = [point[0] for point in points]
+        values = [point[value_index] for point in points]
+    except IndexError:
+        points = [point for point in points if len(point) > value_index]
+        ts = [point[0] for point in points]
+        values = [point[value_index] for point in points]
+    if not all(map(lt, ts, ts[1:])):
+        order = sorted(range(len(ts)), key=ts.__getitem__)
+        last = dict(zip([ts[k] for k in order], [values[k] for k in order]))
+        ts, values = list(last), list(last.values())
+    return ts, values
+
+
+def _full_timeline(s_ts, s_vals, b_ts, b_vals, event_start_ms):
+    """One row per timestamp of either series, merge-joined."""
+    if s_ts == b_ts:
+        # Usual case: both series are sampled on the same clock
+        return [[(ts - event_start_ms) // 60000, {'bb': bb, 'stress': stress}]
+                for ts, bb, stress in zip(s_ts, b_vals, s_vals)]
+    timeline = []
+    i = j = 0
+    n_stress, n_bb = len(s_ts), len(b_ts)
+    while i < n_stress or j < n_bb:
+        if j == n_bb or (i < n_stress and s_ts[i] < b_ts[j]):
+            ts, values = s_ts[i], {'stress': s_vals[i]}
+            i += 1
+        elif i == n_stress or b_ts[j] < s_ts[i]:
+            ts, values = b_ts[j], {'bb': b_vals[j]}
+            j += 1
+        else:
+            ts, values = s_ts[i], {'bb': b_vals[j], 'stress': s_vals[i]}
+            i += 1
+            j += 1
+        timeline.append([(ts - event_start_ms) // 60000, values])
+    return timeline
+
+
+def _bucketed_timeline(s_ts, s_vals, b_ts, b_vals, event_start_ms):
+    """30-minute buckets with the last BB level and the last non-null stress.
+
+    Walks bucket by bucket, finding each bucket's end in both series with a
+    bisect, so only buckets that hold samples are visited.
+    """
+    timeline = []
+    i = j = 0
+    n_stress, n_bb = len(s_ts), len(b_ts)
+    while i < n_stress or j < n_bb:
+        if j == n_bb or (i < n_stress and s_ts[i] < b_ts[j]):
+            first_ts = s_ts[i]
+        else:
+            first_ts = b_ts[j]
+        bucket = (first_ts - event_start_ms) // 60000 // 30 * 30
+        edge = event_start_ms + (bucket + 30) * 60000
+        i_end = bisect_left(s_ts, edge, i)
+        j_end = bisect_left(b_ts, edge, j)
+        first = next((k for k in range(i, i_end) if s_vals[k] is not None), None)
+        values = {}
+        # Keys in the order the bucket first sees them (BB first on a shared
+        # timestamp): reserve the stress slot when stress came first
+        if first is not None and (j == j_end or s_ts[first] < b_ts[j]):
+            values['stress'] = None
+        if j < j_end:
+            values['bb'] = b_vals[j_end - 1]
+        if first is not None:
+            last = i_end - 1
+            while s_vals[last] is None:
+                last -= 1
+            values['stress'] = s_vals[last]
+        timeline.append([bucket, values])
+        i, j = i_end, j_end
+    return timeline
+
+
+def build_timeline(stress_values, bb_values, event_start_ms, high_stress_threshold):
+    """Event timeline as ``[offset_min, {'bb', 'stress'}]`` rows.
+
+    Full resolution when stress went above ``high_stress_threshold``,
+    otherwise 30-minute buckets holding the last BB level and the last
+    non-null stress.
+    """
+    s_ts, s_vals = series_columns(stress_values, 1)
+    b_ts, b_vals = series_columns(bb_values, 2)
+    try:
+        high_stress = max(s_vals, default=0) > high_stress_threshold
+    except TypeError:  # null readings
+        high_stress = max([v for v in s_vals if v is not None], default=0) > high_stress_threshold
+    if high_stress:
+        return _full_timeline(s_ts, s_vals, b_ts, b_vals, event_start_ms)
+    return _bucketed_timeline(s_ts, s_vals, b_ts, b_vals, event_start_ms)
+
+
+def event_type(item):
+    """Event type of a BodyBatteryData (or dict) without converting it."""
+    return to_dict(to_dict(item).get('event')).get('event_type')
+
+
+def slim_body_battery_item(item, include_timeline=True):
+    """Convert BodyBatteryData to compact analysis-ready dict.
+
+    With ``include_timeline=False`` the stress/BB timeline is not built and
+    ``timeline_stress_30m`` is left out.
+    """
     from config import HIGH_STRESS_THRESHOLD
     
     data = to_dict(item)
 
     # Extract event data
-    event = data.get('event', {})
-    if not isinstance(event, dict):
-        event = event.dict() if hasattr(event, 'dict') else vars(event) if hasattr(event, '__dict__') else {}
+    event = to_dict(data.get('event'))
     
     # Format event start time — convert GMT to local
     event_start_gmt = event.get('event_start_time_gmt')
     timezone_offset_ms = event.get('timezone_offset', 0)
     timezone_offset_min = timezone_offset_ms // 60000 if timezone_offset_ms else None
+    if isinstance(event_start_gmt, str):
+        # Raw backend: parse the ISO string as garth's model would have
+        try:
+            event_start_gmt = datetime.fromisoformat(event_start_gmt.replace('Z', '+00:00'))
+        except ValueError:
+            pass
 
     if event_start_gmt:
         if hasattr(event_start_gmt, 'strftime'):
@@ -38,17 +154,16 @@ def slim_body_battery_item(item):
     stress_values = data.get('stress_values_array', [])
     if stress_values is None:
         stress_values = []
-    stress_samples = len(stress_values)
-    valid_stress = [(ts, val) for ts, val in stress_values if val is not None]
-    stress_missing = stress_samples - len(valid_stress)
-    
-    if valid_stress:
-        stress_vals = [val for _, val in valid_stress]
-        stress_avg = round(sum(stress_vals) / len(stress_vals), 2)
-        stress_p95 = round(percentile(stress_vals, 0.95), 2) if percentile(stress_vals, 0.95) is not None else None
-        stress_min = min(stress_vals)
-        stress_max = max(stress_vals)
-        stress_peak_ts, stress_peak_val = next((ts, val) for ts, val in valid_stress if val == stress_max)
+    stress_stats = SeriesStats.of_points(stress_values)
+    stress_samples = stress_stats.samples
+    stress_missing = stress_stats.missing
+
+    if stress_stats.count:
+        stress_avg = round(stress_stats.mean, 2)
+        stress_p95 = round(stress_stats.quantile(0.95), 2)
+        stress_min = stress_stats.min
+        stress_max = stress_stats.max
+        stress_peak_ts, stress_peak_val = stress_values[stress_stats.peak_index][0], stress_max
     else:
         stress_avg = stress_p95 = stress_min = stress_max = None
         stress_peak_ts = stress_peak_val = None
@@ -58,65 +173,27 @@ def slim_body_battery_item(item):
     if bb_values is None:
         bb_values = []
     bb_samples = len(bb_values)
-    
-    if bb_values:
-        # Extract bb values (index 2 in each entry)
-        bb_vals = [entry[2] for entry in bb_values if len(entry) > 2 and entry[2] is not None]
-        
-        if bb_vals:
-            bb_min = min(bb_vals)
-            bb_max = max(bb_vals)
-            bb_start = bb_vals[0]
-            bb_end = bb_vals[-1]
-            bb_delta = bb_end - bb_start
-            
-            # Find peak and lowest
-            bb_peak_idx = bb_vals.index(bb_max)
-            bb_peak_ts = bb_values[bb_peak_idx][0]
-            
-            bb_lowest_idx = bb_vals.index(bb_min)
-            bb_lowest_ts = bb_values[bb_lowest_idx][0]
-        else:
-            bb_min = bb_max = bb_start = bb_end = bb_delta = None
-            bb_peak_ts = bb_lowest_ts = None
+
+    # BB level is index 2 in each entry
+    bb_stats = SeriesStats.of_points(bb_values, value_index=2)
+    if bb_stats.count:
+        bb_min = bb_stats.min
+        bb_max = bb_stats.max
+        bb_start = bb_stats.first
+        bb_end = bb_stats.last
+        bb_delta = bb_end - bb_start
+
+        # Find peak and lowest
+        bb_peak_ts = bb_values[bb_stats.peak_index][0]
+        bb_lowest_ts = bb_values[bb_stats.trough_index][0]
     else:
         bb_min = bb_max = bb_start = bb_end = bb_delta = None
         bb_peak_ts = bb_lowest_ts = None
     
     # Build timeline (full if stress, 30m buckets otherwise)
     timeline_stress_30m = []
-    if event_start_ms:
-        stress_dict = {ts: val for ts, val in stress_values}
-        bb_dict = {entry[0]: entry[2] for entry in bb_values if len(entry) > 2}
-        all_ts = sorted(set(stress_dict.keys()) | set(bb_dict.keys()))
-        
-        stress_vals_in_event = [val for val in stress_dict.values() if val is not None]
-        max_stress = max(stress_vals_in_event) if stress_vals_in_event else 0
-        has_high_stress = max_stress > HIGH_STRESS_THRESHOLD
-        
-        if has_high_stress:
-            # Include all timestamps when stress exists
-            for ts in all_ts:
-                offset_min = (ts - event_start_ms) // 60000
-                values = {}
-                if ts in bb_dict:
-                    values['bb'] = bb_dict[ts]
-                if ts in stress_dict:
-                    values['stress'] = stress_dict[ts]
-                timeline_stress_30m.append([offset_min, values])
-        else:
-            # Use 30-minute buckets when no high stress
-            buckets = {}
-            for ts in all_ts:
-                offset_min = (ts - event_start_ms) // 60000
-                bucket = (offset_min // 30) * 30
-                if bucket not in buckets:
-                    buckets[bucket] = {}
-                if ts in bb_dict:
-                    buckets[bucket]['bb'] = bb_dict[ts]
-                if ts in stress_dict and stress_dict[ts] is not None:
-                    buckets[bucket]['stress'] = stress_dict[ts]
-            timeline_stress_30m = [[offset, values] for offset, values in sorted(buckets.items())]
+    if event_start_ms and include_timeline:
+        timeline_stress_30m = build_timeline(stress_values, bb_values, event_start_ms, HIGH_STRESS_THRESHOLD)
     
     # Build activity dict without nulls
     activity_dict = {}
@@ -196,8 +273,9 @@ def slim_body_battery_item(item):
         'event': event_dict,
         'stress_series_summary': stress_summary,
         'body_battery_series_summary': bb_summary,
-        'timeline_stress_30m': timeline_stress_30m
     }
+    if include_timeline:
+        result['timeline_stress_30m'] = timeline_stress_30m
     
     # Charge/drain rate per hour
     if bb_delta is not None and duration_s is not None and duration_s > 0:
@@ -224,21 +302,18 @@ def slim_body_battery_item(item):
     return result
 
 
-def slim_body_battery_list(items):
+def slim_body_battery_list(items, event_types=('SLEEP', 'ACTIVITY'), timeline_skip=('SLEEP',)):
     """Convert list of BodyBatteryData to compact analysis-ready dicts.
 
-    Keeps only SLEEP and ACTIVITY events (most useful for analysis).
-    Removes timeline from SLEEP events (summary is sufficient).
+    Keeps only ``event_types`` events (SLEEP and ACTIVITY are the most useful
+    for analysis; events without a type are always kept) and builds no
+    timeline for ``timeline_skip`` events (the summary covers sleep).
+    Both are checked before slimming, so dropped work is never done.
     """
     results = []
     for item in items:
-        slimmed = slim_body_battery_item(item)
-        event_type = slimmed.get('event', {}).get('type')
-        # Keep only sleep and activity events
-        if event_type not in ('SLEEP', 'ACTIVITY', None):
+        kind = event_type(item)
+        if kind is not None and kind not in event_types:
             continue
-        # Remove verbose timeline from sleep events (summary covers it)
-        if event_type == 'SLEEP':
-            slimmed.pop('timeline_stress_30m', None)
-        results.append(slimmed)
+        results.append(slim_body_battery_item(item, include_timeline=kind not in timeline_skip))
     return results
@@ -1,45 +1,93 @@
 #!/usr/bin/env python3
-import garth
+import hashlib
 import json
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import date
+from functools import lru_cache, partial
 from getpass import getpass
-from garth.exc import GarthException
-from sleep_data_slimmer import slim_daily_sleep_data_list
-from hrv_slimmer import slim_daily_hrv_list
-from heart_rate_slimmer import slim_daily_heart_rate_list
-from training_readiness_slimmer import slim_training_readiness_list
-from activity_slimmer import slim_activity_list
-from body_battery_slimmer import slim_body_battery_list
-from daily_stress_slimmer import slim_daily_stress_list
-from daily_steps_slimmer import slim_daily_steps_list
-from daily_summary_slimmer import slim_daily_summary_list
-from training_status_slimmer import slim_training_status_list
-from garmin_scores_slimmer import slim_garmin_scores_list
-from weight_data_slimmer import slim_weight_data_list
-
-# Registry: data_type_name → slimmer function
+from importlib import import_module
+from config import (
+    FETCH_WORKERS, DAY_BY_DAY_WORKERS, DAY_BY_DAY_WORKERS_BY_TYPE, ACTIVITY_DETAIL_WORKERS,
+    CACHE_ENABLED, CACHE_FILE, CACHE_TODAY_TTL_S, CACHE_SETTLE_HOURS, STRATEGY_TTL_S, ACTIVITY_PAGE_SIZE,
+    SERIES_STORE, SERIES_DIR, SERIES_BUCKET_MINUTES,
+    SCORES_RANGE_DAYS, SCORES_RANGE_WORKERS, HTTP_POOL_SIZE, TOKEN_REFRESH_MARGIN_S,
+    THROTTLE_RATE_PER_S, THROTTLE_BURST, THROTTLE_CONCURRENCY, THROTTLE_MAX_CONCURRENCY,
+    THROTTLE_ATTEMPTS, THROTTLE_BACKOFF_S, THROTTLE_MAX_BACKOFF_S, CIRCUIT_FAILURES, CIRCUIT_COOLDOWN_S,
+    HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES, HEDGE_BUDGET, SKIP_UNCHANGED_REPORTS, SYNC_SETTLE_S,
+    GARMIN_STANDIN_URL, GARMIN_RECORD_DIR, FETCH_BACKEND,
+)
+from response_cache import ResponseCache, dump_item, dump_items, load_items
+import activity_store
+import raw_fetch
+from throttle import CircuitBreaker, Throttle, describe_error, throttle_requests
+
+# garth (and with it pydantic/requests) is imported inside the functions that
+# talk to Garmin, and slimmer modules are imported on first use, so importing
+# this module stays cheap for entry points that only need part of it.
+
+# Registry: data_type_name → (slimmer module, slimmer function)
 SLIMMER_REGISTRY = {
-    'daily_sleep_data': slim_daily_sleep_data_list,
-    'daily_hrv': slim_daily_hrv_list,
-    'daily_heart_rate': slim_daily_heart_rate_list,
-    'training_readiness_data': slim_training_readiness_list,
-    'activity': slim_activity_list,
-    'body_battery_data': slim_body_battery_list,
-    'daily_stress': slim_daily_stress_list,
-    'daily_steps': slim_daily_steps_list,
-    'daily_summary': slim_daily_summary_list,
-    'daily_training_status': slim_training_status_list,
-    'garmin_scores_data': slim_garmin_scores_list,
-    'weight_data': slim_weight_data_list,
+    'daily_sleep_data': ('sleep_data_slimmer', 'slim_daily_sleep_data_list'),
+    'daily_hrv': ('hrv_slimmer', 'slim_daily_hrv_list'),
+    'daily_heart_rate': ('heart_rate_slimmer', 'slim_daily_heart_rate_list'),
+    'training_readiness_data': ('training_readiness_slimmer', 'slim_training_readiness_list'),
+    'activity': ('activity_slimmer', 'slim_activity_list'),
+    'body_battery_data': ('body_battery_slimmer', 'slim_body_battery_list'),
+    'daily_stress': ('daily_stress_slimmer', 'slim_daily_stress_list'),
+    'daily_steps': ('daily_steps_slimmer', 'slim_daily_steps_list'),
+    'daily_summary': ('daily_summary_slimmer', 'slim_daily_summary_list'),
+    'daily_training_status': ('training_status_slimmer', 'slim_training_status_list'),
+    'garmin_scores_data': ('garmin_scores_slimmer', 'slim_garmin_scores_list'),
+    'weight_data': ('weight_data_slimmer', 'slim_weight_data_list'),
 }
 
 
+# garth classes whose intraday series are kept in the series store (series_store.SOURCES),
+# and slimmers that take ``series=`` (a SeriesStore) for statistics over stored days
+SERIES_CLASSES = {'DailyHeartRate', 'BodyBatteryData', 'DailySleepData'}
+SERIES_TYPES = {'daily_heart_rate'}
+
+
+@lru_cache(maxsize=None)
+def get_slimmer(name):
+    """Resolve the slimmer function for a data type, importing its module on first use."""
+    entry = SLIMMER_REGISTRY.get(name)
+    if entry is None:
+        return None
+    module_name, func_name = entry
+    return getattr(import_module(module_name), func_name)
+
+
 def authenticate(garth_dir):
     """Authenticate with Garmin or resume existing session."""
+    import garth
+    from garth.exc import GarthException
+    from http_session import (per_thread_last_response, refresh_token_if_expiring,
+                              single_flight_token_refresh, tune_session)
+
+    per_thread_last_response()  # data types are fetched from several threads
+    single_flight_token_refresh()
+    tune_session(garth.client, HTTP_POOL_SIZE)
+    install_throttle(garth.client)
+    if GARMIN_STANDIN_URL:
+        from http_session import use_standin
+        use_standin(GARMIN_STANDIN_URL)
+        print(f"🧪 Using stand-in Garmin server at {GARMIN_STANDIN_URL} as: {garth.client.username}")
+        return
+    if GARMIN_RECORD_DIR:
+        from http_session import record_responses
+        record_responses(GARMIN_RECORD_DIR)
+        print(f"📼 Recording API responses to {GARMIN_RECORD_DIR}")
+    
     if garth_dir.exists():
         try:
             garth.resume(str(garth_dir))
             garth.client.username
+            if refresh_token_if_expiring(garth.client, TOKEN_REFRESH_MARGIN_S):
+                print("🔑 Refreshed access token ahead of expiry")
             print(f"✅ Resumed session as: {garth.client.username}")
             return
         except GarthException:
@@ -52,28 +100,355 @@ def authenticate(garth_dir):
     print(f"✅ Login successful as: {garth.client.username}")
 
 
-def collect_data(data_types, output_file, results_dir, days_to_collect):
-    """Collect Garmin data with robust error handling."""
+_throttle = None
+
+
+def install_throttle(client):
+    """Throttle every request of ``client`` with the configured limits. Returns the Throttle."""
+    global _throttle
+    _throttle = Throttle(THROTTLE_RATE_PER_S, THROTTLE_BURST, THROTTLE_CONCURRENCY, THROTTLE_MAX_CONCURRENCY,
+                         THROTTLE_ATTEMPTS, THROTTLE_BACKOFF_S, THROTTLE_MAX_BACKOFF_S,
+                         hedge_percentile=HEDGE_PERCENTILE, hedge_budget=HEDGE_BUDGET,
+                         hedge_min_samples=HEDGE_MIN_SAMPLES, hedge_workers=2 * HTTP_POOL_SIZE)
+    throttle_requests(client, _throttle)
+    return _throttle
+
+
+def set_request_deadline(seconds):
+    """Stop Garmin requests from going out ``seconds`` from now (None lifts the deadline).
+
+    Fetches still running then fail fast instead of finishing in the
+    background. Needs the throttle (``install_throttle``).
+    """
+    if _throttle is not None:
+        _throttle.deadline = None if seconds is None else time.monotonic() + seconds
+
+
+_draining = []
+_draining_lock = threading.Lock()
+
+
+def stop_fetches(executor, futures):
+    """Shut ``executor`` down without waiting for ``futures`` still running on it.
+
+    They fail fast on their next request: the request deadline is moved to
+    now, and lifted once they are done (``wait_for_stopped_fetches``).
+    """
+    if all(future.done() for future in futures):
+        executor.shutdown()
+        with _draining_lock:
+            if not _draining:
+                set_request_deadline(None)
+        return
+    set_request_deadline(0)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    def drain():
+        executor.shutdown(wait=True)
+        with _draining_lock:
+            _draining.remove(thread)
+            if not _draining:
+                set_request_deadline(None)
+
+    thread = threading.Thread(target=drain, daemon=True)
+    with _draining_lock:
+        _draining.append(thread)
+    thread.start()
+
+
+def wait_for_stopped_fetches():
+    """Wait until fetches cut off by a deadline are done, so requests can go out again."""
+    with _draining_lock:
+        threads = list(_draining)
+    for thread in threads:
+        thread.join()
+
+
+# Key of the marker a report file gets when data is missing or incomplete;
+# uploads add a note about it to the prompt
+COLLECTION_STATUS_KEY = '_collection_status'
+
+
+def collection_status(missing, partial, deadline_s=None):
+    """The ``_collection_status`` marker of a report, or None when everything arrived.
+
+    ``missing`` lists data types that did not finish (in time), ``partial``
+    maps data types to the days that could not be fetched.
+    """
+    if not missing and not partial:
+        return None
+    status = {'complete': False, 'missing': list(missing), 'partial': dict(partial)}
+    if deadline_s is not None:
+        status['deadline_s'] = deadline_s
+    return status
+
+
+def missing_days(result, days, today):
+    """Days of the last ``days`` up to ``today`` that a finished fetch has nothing for (they failed)."""
+    if result is None or result.by_day is None:
+        return []
+    return [d for d in _day_list(days, today) if d not in result.by_day]
+
+
+# Garmin's record of the last used device; its upload time moves on every sync
+SYNC_STATUS_PATH = '/device-service/deviceservice/mylastused'
+
+
+def check_sync():
+    """When the watch last uploaded to Garmin (epoch seconds), or None when it cannot be told.
+
+    Today's cached days fetched before that upload are refetched from now on
+    (``ResponseCache.synced_at``). Needs the cache; without it nothing is asked.
+    """
+    import garth
+
+    cache = _get_cache()
+    if cache is None:
+        return None
+    try:
+        status = garth.connectapi(SYNC_STATUS_PATH)
+    except Exception as e:
+        print(f"⚠️  sync status: {describe_error(e)}")
+        return None
+    upload_ms = status.get('lastUsedDeviceUploadTime') if isinstance(status, dict) else None
+    if upload_ms is None:
+        return None
+    cache.synced_at = upload_ms / 1000
+    return cache.synced_at
+
+
+def _job(item, days_to_collect):
+    """``(name, class_name, days, hints)`` of a DATA_TYPES entry."""
+    name, class_name = item[0], item[1]
+    days = item[2] if len(item) > 2 else days_to_collect
+    hints = item[3] if len(item) > 3 else None
+    return name, class_name, days, hints
+
+
+def _report_fingerprint(data_types, days_to_collect):
+    """Hash of what a report collects, so a report whose data types changed is collected afresh."""
+    jobs = [_job(item, days_to_collect) for item in data_types]
+    return hashlib.sha1(json.dumps([jobs, FETCH_BACKEND], sort_keys=True, default=str).encode()).hexdigest()
+
+
+def report_is_current(output_file, data_types, days_to_collect, synced_at, today):
+    """True if ``output_file`` was collected today after the sync at ``synced_at``, and can be kept.
+
+    The file must be unchanged since, collected with the same data types, and
+    at least ``SYNC_SETTLE_S`` after the sync.
+    """
+    cache = _get_cache()
+    if not SKIP_UNCHANGED_REPORTS or cache is None or synced_at is None or not output_file.exists():
+        return False
+    row = cache.recall_report(str(output_file.resolve()))
+    if row is None:
+        return False
+    fingerprint, collected_after, day, mtime_ns, recorded_at = row
+    return (collected_after == synced_at and day == today and recorded_at - synced_at >= SYNC_SETTLE_S
+            and mtime_ns == output_file.stat().st_mtime_ns
+            and fingerprint == _report_fingerprint(data_types, days_to_collect))
+
+
+def remember_report(output_file, data_types, days_to_collect, synced_at, today):
+    """Record a complete report file just written as collected after the sync at ``synced_at``."""
+    cache = _get_cache()
+    if cache is None or synced_at is None:
+        return
+    cache.remember_report(str(output_file.resolve()), _report_fingerprint(data_types, days_to_collect),
+                          synced_at, today, output_file.stat().st_mtime_ns)
+
+
+def print_kept(output_file, synced_at):
+    """Say that a report file is kept because nothing synced since it was collected."""
+    print(f"♻️  {output_file.name}: nothing synced since it was collected "
+          f"(last sync {time.strftime('%H:%M', time.localtime(synced_at))}), keeping it")
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def _breaker(name):
+    """The CircuitBreaker of a data type, shared by all its fetch strategies in this process."""
+    with _breakers_lock:
+        if name not in _breakers:
+            _breakers[name] = CircuitBreaker(CIRCUIT_FAILURES, CIRCUIT_COOLDOWN_S)
+        return _breakers[name]
+
+
+def collect_data(data_types, output_file, results_dir, days_to_collect, max_workers=None, deadline_s=None):
+    """Collect Garmin data with robust error handling.
+
+    All data types are fetched concurrently on a bounded thread pool
+    (``FETCH_WORKERS`` by default). Each type keeps its own fallback chain in
+    ``_fetch_and_slim``; the output file lists types in ``data_types`` order.
+    With ``deadline_s`` the file is written after that many seconds at the
+    latest; types still being fetched are listed as missing in its
+    ``_collection_status`` (days that failed to fetch, as partial).
+    When nothing has synced since ``output_file`` was collected, it is kept
+    as it is (see ``report_is_current``).
+    """
     results_dir.mkdir(exist_ok=True)
     today = date.today().isoformat()
-    all_data = {}
+    if max_workers is None:
+        max_workers = FETCH_WORKERS
     
-    for item in data_types:
-        name, class_name = item[0], item[1]
-        days = item[2] if len(item) > 2 else days_to_collect
+    jobs = [_job(item, days_to_collect) for item in data_types]
+    
+    results, failed, partial = {}, [], {}
+    wait_for_stopped_fetches()
+    synced_at = check_sync()
+    if report_is_current(output_file, data_types, days_to_collect, synced_at, today):
+        print_kept(output_file, synced_at)
+        return
+    set_request_deadline(deadline_s)
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs) or 1)))
+    futures = {
+        executor.submit(_fetch_and_slim, name, class_name, days, today, hints): (name, days)
+        for name, class_name, days, hints in jobs
+    }
+    try:
+        try:
+            for future in as_completed(futures, timeout=deadline_s):
+                name, days = futures[future]
+                try:
+                    data, gaps = future.result()
+                except Exception as e:
+                    print(f"⚠️  {name}: {describe_error(e)}")
+                    failed.append(name)
+                    continue
+                results[name] = data
+                if gaps:
+                    partial[name] = gaps
+                if data:
+                    print(f"✅ {name} ({days}d)")
+                else:
+                    print(f"⚠️  {name}: No data available")
+        except FuturesTimeout:
+            print(f"⏱️  Deadline of {deadline_s}s reached, saving what has arrived")
         
-        data = _fetch_and_slim(name, class_name, days, today)
+        # Keep the report's declared order regardless of completion order
+        all_data = {name: results[name] for name, *_ in jobs if results.get(name)}
+        missing = [name for name, *_ in jobs if name not in results]
+        status = collection_status(missing, partial, deadline_s if set(missing) - set(failed) else None)
+        if status:
+            all_data[COLLECTION_STATUS_KEY] = status
         
-        if data:
-            all_data[name] = data
-            print(f"✅ {name} ({days}d)")
-        else:
-            print(f"⚠️  {name}: No data available")
+        with open(output_file, "w") as f:
+            json.dump(all_data, f, indent=2, default=str)
+        if status is None:
+            remember_report(output_file, data_types, days_to_collect, synced_at, today)
+        
+        print(f"\n✅ Data saved to {output_file}")
+    finally:
+        stop_fetches(executor, futures)
+
+
+def collect_latest_activity(output_file, results_dir, count=1):
+    """Collect the latest activity (or the last ``count``) with full details and coaching info.
+
+    Detail, splits and the coaching lookup of every activity go out together
+    on one pool of ``ACTIVITY_DETAIL_WORKERS`` threads; detail and splits
+    already in the activity store are not requested again. With ``count=1``
+    the output file holds one activity dict, otherwise a list, newest first.
+    """
+    from detailed_activity_slimmer import activity_id_of, fetch_activity_payloads, slim_detailed_activity
+
+    results_dir.mkdir(exist_ok=True)
+    wait_for_stopped_fetches()
+    
+    print("Collecting latest activity..." if count == 1 else f"Collecting last {count} activities...")
+    activities = _recent_activities(count)
+    store = _get_activity_store()
+    fetch = _stored_payload_fetch(store) if store is not None else None
+    
+    if not activities or len(activities) == 0:
+        print("⚠️  No activities found")
+        return None
+    
+    with ThreadPoolExecutor(max_workers=ACTIVITY_DETAIL_WORKERS) as executor:
+        coaching_future = executor.submit(_fetch_coaching, activities)
+        payloads = [fetch_activity_payloads(activity_id_of(a), executor, fetch) if activity_id_of(a) else None
+                    for a in activities]
+        detailed = [slim_detailed_activity(a, p) for a, p in zip(activities, payloads)]
+        try:
+            coaching = coaching_future.result()
+        except Exception as e:
+            print(f"⚠️  Could not fetch coaching data: {e}")
+            coaching = {}
+    
+    for activity in detailed:
+        if activity.get('activity_id') in coaching:
+            activity['coaching'] = coaching[activity['activity_id']]
     
     with open(output_file, "w") as f:
-        json.dump(all_data, f, indent=2, default=str)
+        json.dump(detailed[0] if count == 1 else detailed, f, indent=2, default=str)
     
-    print(f"\n✅ Data saved to {output_file}")
+    if count == 1:
+        latest_activity = detailed[0]
+        print(f"✅ Latest activity saved to {output_file}")
+        print(f"   Activity: {latest_activity.get('activity_name', 'N/A')}")
+        print(f"   Type: {latest_activity.get('type_key', 'N/A')}")
+        print(f"   Date: {latest_activity.get('start_time_local', 'N/A')}")
+        return latest_activity
+    print(f"✅ {len(detailed)} activities saved to {output_file}")
+    for activity in detailed:
+        print(f"   {activity.get('start_time_local', 'N/A')}  {activity.get('activity_name', 'N/A')}")
+    return detailed
+
+
+def _recent_activities(count):
+    """The newest ``count`` activities as garth models, from the activity store when caching is on."""
+    import garth
+
+    store = _get_activity_store()
+    if store is None:
+        return garth.Activity.list(limit=count)
+
+    def list_page(start, limit):
+        page = garth.Activity.list(limit=limit, start=start)
+        return [(a.activity_id, a.start_time_gmt, dump_item(garth.Activity, a)) for a in page]
+
+    pages = activity_store.sync(store, count, list_page, ACTIVITY_PAGE_SIZE)
+    payloads = store.recent(count)
+    print(f"💾 activity: {len(payloads)} from store, {pages} list page(s) fetched")
+    return load_items(garth.Activity, "[" + ",".join(payloads) + "]")
+
+
+def _stored_payload_fetch(store):
+    """``fetch`` for fetch_activity_payloads that keeps every payload in the activity store."""
+    import garth
+
+    def fetch(activity_id, kind, path):
+        stored = store.payload(activity_id, kind)
+        if stored is not None:
+            return json.loads(stored)
+        payload = garth.connectapi(path)
+        if payload:
+            store.store_payload(activity_id, kind, json.dumps(payload))
+        return payload
+    return fetch
+
+
+def _fetch_coaching(activities):
+    """Coaching info by activity ID, from one fitness-stats call covering ``activities``."""
+    import garth
+
+    today = date.today()
+    starts = [a.start_time_local.date() for a in activities if getattr(a, 'start_time_local', None)]
+    days = max(7, (today - min(starts)).days + 1) if starts else 7
+    coaching = {}
+    for fa in garth.FitnessActivity.list(today.isoformat(), days=days):
+        coaching_data = {}
+        if fa.workout_type:
+            coaching_data['workout_type'] = fa.workout_type
+        if fa.adaptive_coaching_workout_status:
+            coaching_data['coaching_status'] = fa.adaptive_coaching_workout_status
+        if fa.workout_group_enumerator:
+            coaching_data['workout_group'] = fa.workout_group_enumerator
+        if coaching_data:
+            coaching[fa.activity_id] = coaching_data
+    return coaching
 
 
 # Data types that return only 1 entry from .list() regardless of days parameter.
@@ -81,101 +456,454 @@ def collect_data(data_types, output_file, results_dir, days_to_collect):
 DAY_BY_DAY_TYPES = {'daily_training_status'}
 
 
-def _fetch_and_slim(name, class_name, days, today):
-    """Fetch data from Garmin and run through slimmer. Returns slimmed data or None."""
-    from datetime import timedelta
-    
+# Raw result of one data type's fetch chain.
+# by_day is {ISO day: [items]} for day-keyed fetches (None for activity lists
+# and the scores fallback); ascending tells in which day order raw was built.
+FetchResult = namedtuple('FetchResult', ['raw', 'by_day', 'ascending'])
+
+
+def _fetch_and_slim(name, class_name, days, today, hints=None):
+    """Fetch data from Garmin and run through slimmer.
+
+    Returns ``(slimmed data or None, days that could not be fetched)``.
+    """
+    result = fetch_raw(name, class_name, days, today)
+    if result is None:
+        return None, []
+    return _slim_data(name, result.raw, hints), missing_days(result, days, today)
+
+
+def fetch_raw(name, class_name, days, today):
+    """Fetch raw garth items for one data type, following the fallback chain.
+
+    The strategy that last worked for this type (``range``, ``day_by_day`` or
+    ``scores_api``) is tried on its own first; the full chain only runs when
+    none is remembered (or remembered for longer than ``STRATEGY_TTL_S``) or
+    it came back empty (or, for ``range``, sparse enough that the chain would
+    try day-by-day), and whatever wins is remembered for next time.
+
+    Returns a FetchResult, or None when nothing could be fetched.
+    """
+    breaker = _breaker(name)
+    if not breaker.allow():
+        print(f"⚠️  {name}: skipped, its requests keep failing")
+        return None
+    strategy_key = _strategy_key(name, class_name)
+    cache = _get_cache()
+    remembered = cache.recall_strategy(strategy_key, STRATEGY_TTL_S) if cache is not None else None
+    if remembered in FETCH_STRATEGIES:
+        try:
+            result = FETCH_STRATEGIES[remembered](name, class_name, days, today)
+        except Exception as e:
+            breaker.record(e)
+            result = None
+        if result is not None and result.raw and not (remembered == 'range' and _is_sparse(result.raw, days)):
+            return result
+
+    result, strategy = _probe_strategies(name, class_name, days, today)
+    if result and cache is not None:
+        cache.remember_strategy(strategy_key, strategy)
+    return result
+
+
+def _is_sparse(raw, days):
+    """True when a range fetch returned much fewer items than days asked for."""
+    return isinstance(raw, list) and len(raw) < max(2, days // 3)
+
+
+def _probe_strategies(name, class_name, days, today):
+    """Run the full fallback chain. Returns ``(FetchResult, strategy)`` or ``(None, None)``."""
     # Some types always need day-by-day fetching
     if name in DAY_BY_DAY_TYPES:
         collected = _fetch_day_by_day(name, class_name, days, today)
         if collected:
-            return collected
+            return collected, 'day_by_day'
 
     # Try primary fetch
     try:
-        data_class = getattr(garth, class_name)
-        if class_name == "Activity":
-            raw = data_class.list(limit=days)
-        else:
-            raw = data_class.list(today, days)
+        result = _fetch_range(name, class_name, days, today)
+        raw = result.raw
 
         # If we got much fewer results than expected, try day-by-day
-        if raw and isinstance(raw, list) and len(raw) < max(2, days // 3):
+        if raw and _is_sparse(raw, days):
             day_by_day = _fetch_day_by_day(name, class_name, days, today)
-            if day_by_day and isinstance(day_by_day, list) and len(day_by_day) > len(raw):
-                return day_by_day
+            if day_by_day and len(day_by_day.raw) > len(raw):
+                return day_by_day, 'day_by_day'
 
-        return _slim_data(name, raw, days=days)
+        return (result, 'range') if raw else (None, None)
     except Exception as e:
+        _breaker(name).record(e)
+        error = e
         error_str = str(e)
-    
+
     # Pydantic validation errors → try day-by-day collection
     if "validation error" in error_str.lower():
         collected = _fetch_day_by_day(name, class_name, days, today)
         if collected:
-            return collected
-    
+            return collected, 'day_by_day'
+
     # Special fallback for garmin_scores_data via connectapi
     if name == "garmin_scores_data":
         try:
-            raw_list = []
-            for d_offset in range(days):
-                d = (date.today() - timedelta(days=d_offset)).isoformat()
-                try:
-                    raw = garth.connectapi(f'/wellness-service/wellness/scores/daily/{d}/{d}')
-                    if raw and isinstance(raw, list):
-                        raw_list.extend(raw)
-                    elif raw and isinstance(raw, dict):
-                        raw_list.append(raw)
-                except Exception:
-                    pass
-            if raw_list:
-                slimmer = SLIMMER_REGISTRY.get(name)
-                return slimmer(raw_list) if slimmer else raw_list
+            collected = _fetch_scores_api(name, class_name, days, today)
+            if collected:
+                return collected, 'scores_api'
         except Exception:
             pass
-    
+
     # Log the original error
-    short_err = error_str.split('\n')[0][:100]
-    print(f"⚠️  {name}: {short_err}")
-    return None
+    print(f"⚠️  {name}: {describe_error(error)}")
+    return None, None
+
+
+def _fetch_range(name, class_name, days, today):
+    """Primary fetch: one ``.list()`` over the window (cached per day). Raises on failure."""
+    if class_name == "Activity":
+        return FetchResult(_recent_activities(days), None, False)
+    day_list = _day_list(days, today)
+    by_day = _fetch_days(name, class_name, day_list)
+    ascending = class_name in ASCENDING_CLASSES
+    return FetchResult(_flatten_days(by_day, day_list, ascending), by_day, ascending)
+
+
+def _fetch_scores_api(name, class_name, days, today):
+    """Garmin scores straight from the wellness endpoint.
+
+    The window goes out as ranges of up to ``SCORES_RANGE_DAYS`` days, several
+    at once when there is more than one; only a range that fails is retried
+    one day at a time. Entries get snake_case keys like garth's models.
+    """
+    day_list = _day_list(days, today)
+    chunks = [day_list[i:i + SCORES_RANGE_DAYS] for i in range(0, len(day_list), SCORES_RANGE_DAYS)]
+    by_day = {}
+    workers = max(1, min(SCORES_RANGE_WORKERS, len(chunks)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk_by_day in executor.map(partial(_fetch_scores_chunk, _breaker(name)), chunks):
+            by_day.update(chunk_by_day)
+    raw_list = _flatten_days(by_day, day_list)
+    return FetchResult(raw_list, by_day, False) if raw_list else None
+
+
+def _fetch_scores_chunk(breaker, chunk):
+    """``{day: [entries]}`` for newest-first consecutive days, one range call if it works.
+
+    Days are left out once ``breaker`` opens.
+    """
+    import garth
+
+    path = '/wellness-service/wellness/scores/daily/{}/{}'
+    try:
+        entries = _scores_entries(garth.connectapi(path.format(chunk[-1], chunk[0])))
+    except Exception:
+        entries = None
+    if entries is not None:
+        by_day = {d: [] for d in chunk}
+        for entry in entries:
+            day = _item_day(entry) or (str(entry['date']) if entry.get('date') is not None else None)
+            if day in chunk:
+                by_day.setdefault(day, []).append(entry)
+        return by_day
+
+    by_day = {}
+    for d in chunk:
+        if not breaker.allow():
+            break
+        try:
+            by_day[d] = _scores_entries(garth.connectapi(path.format(d, d))) or []
+            breaker.record()
+        except Exception as e:
+            breaker.record(e)  # Skip days that fail on their own too
+    return by_day
+
+
+def _scores_entries(response):
+    """Snake_case entries of a scores response (a list, or one dict)."""
+    if isinstance(response, dict):
+        response = [response]
+    elif not isinstance(response, list):
+        return []
+    return [raw_fetch.snake_keys(entry) for entry in response if isinstance(entry, dict)]
 
 
 def _fetch_day_by_day(name, class_name, days, today):
-    """Fetch data one day at a time, skipping days with validation errors."""
-    from datetime import timedelta
+    """Fetch data one day at a time, skipping days with validation errors.
+
+    Per-day requests run concurrently (capped per data type, see
+    ``DAY_BY_DAY_WORKERS``); results are merged in the same day order as the
+    serial loop, newest day first. Returns a FetchResult, or None when no day
+    had data.
+    """
+    import garth
     
-    data_class = getattr(garth, class_name, None)
-    if not data_class:
+    if not getattr(garth, class_name, None):
         return None
-    
-    collected_raw = []
-    for d_offset in range(days):
-        d = (date.today() - timedelta(days=d_offset)).isoformat()
-        try:
-            day_data = data_class.list(d, 1)
-            if day_data:
-                collected_raw.extend(day_data)
-        except Exception:
-            pass  # Skip days with validation errors
-    
+
+    day_list = _day_list(days, today)
+    by_day = _fetch_days(name, class_name, day_list, per_day=True)
+    collected_raw = _flatten_days(by_day, day_list)
+
     if collected_raw:
-        return _slim_data(name, collected_raw, days=days)
+        return FetchResult(collected_raw, by_day, False)
     return None
 
 
-def _slim_data(name, raw, days=None):
-    """Run raw data through the appropriate slimmer."""
+# Named steps of the fallback chain, as remembered per data type
+FETCH_STRATEGIES = {
+    'range': _fetch_range,
+    'day_by_day': _fetch_day_by_day,
+    'scores_api': _fetch_scores_api,
+}
+
+
+def slim_window(name, result, days, today, hints=None):
+    """Slim the last ``days`` days up to ``today`` out of a wider FetchResult.
+
+    Lets one wide fetch serve several reports with different windows (and
+    different slimmer hints).
+    """
+    if result.by_day is not None:
+        raw = _flatten_days(result.by_day, _day_list(days, today), result.ascending)
+    elif isinstance(result.raw, list):
+        raw = result.raw[:days]
+    else:
+        raw = result.raw
+    return _slim_data(name, raw, hints)
+
+
+def estimate_api_calls(name, class_name, days, today):
+    """Estimate the Garmin calls ``fetch_raw`` will make. Returns ``(calls, cached_days)``.
+
+    Follows the remembered strategy for the type, else assumes the primary
+    path succeeds (no fallbacks).
+    """
+    if class_name == "Activity":
+        return 1, 0
+    day_list = _day_list(days, today)
+    missing = day_list
+    cache = _get_cache()
+    strategy = None
+    if cache is not None:
+        strategy = cache.recall_strategy(_strategy_key(name, class_name), STRATEGY_TTL_S)
+        if strategy == 'scores_api':
+            return len(day_list), 0  # not cached
+        _, missing = cache.lookup(_cache_key(class_name), day_list)
+    if strategy == 'day_by_day' or name in DAY_BY_DAY_TYPES:
+        calls = len(missing)
+    elif class_name == "WeightData":
+        calls = len(_contiguous_runs(missing))  # weight range endpoint is not paged
+    elif class_name in RANGE_KEYED_CLASSES:
+        calls = sum(-(-len(run) // STATS_PAGE_DAYS) for run in _contiguous_runs(missing))
+    else:
+        calls = len(missing)
+    return calls, len(day_list) - len(missing)
+
+
+def _strategy_key(name, class_name):
+    """Strategies are remembered per data type and fetch backend."""
+    return f"{name}@raw" if _uses_raw_backend(class_name) else name
+
+
+# garth classes whose range endpoint returns one row per calendar_date, so a
+# single call covers any run of missing days.
+RANGE_KEYED_CLASSES = {'DailyHRV', 'DailySteps', 'DailyStress', 'WeightData'}
+
+# garth pages stats ranges longer than this into several requests
+STATS_PAGE_DAYS = 28
+
+# garth sorts these oldest-first in .list(); everything else comes back newest-first.
+ASCENDING_CLASSES = RANGE_KEYED_CLASSES | {
+    'DailyHeartRate', 'DailySleepData', 'GarminScoresData', 'TrainingReadinessData',
+}
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def _get_cache():
+    """Return the shared ResponseCache, or None when caching is disabled."""
+    global _response_cache
+    if not CACHE_ENABLED:
+        return None
+    with _response_cache_lock:
+        if _response_cache is None:
+            CACHE_FILE.parent.mkdir(exist_ok=True)
+            _response_cache = ResponseCache(CACHE_FILE, CACHE_TODAY_TTL_S, CACHE_SETTLE_HOURS)
+    return _response_cache
+
+
+_activity_store = None
+
+
+def _get_activity_store():
+    """Return the shared ActivityStore (same database as the cache), or None when caching is disabled."""
+    global _activity_store
+    if not CACHE_ENABLED:
+        return None
+    with _response_cache_lock:
+        if _activity_store is None:
+            CACHE_FILE.parent.mkdir(exist_ok=True)
+            _activity_store = activity_store.ActivityStore(CACHE_FILE)
+    return _activity_store
+
+
+_series_store = None
+_series_store_loaded = False
+
+
+def _get_series_store():
+    """Return the shared SeriesStore, or None when caching is disabled or NumPy is not installed."""
+    global _series_store, _series_store_loaded
+    if not (CACHE_ENABLED and SERIES_STORE):
+        return None
+    with _response_cache_lock:
+        if not _series_store_loaded:
+            _series_store_loaded = True
+            try:
+                from series_store import SeriesStore
+            except ImportError:
+                return None
+            _series_store = SeriesStore(SERIES_DIR, SERIES_BUCKET_MINUTES)
+    return _series_store
+
+
+def _day_list(days, today):
+    """ISO dates of the window ending at ``today``, newest first."""
+    from datetime import timedelta
+    end = date.fromisoformat(today)
+    return [(end - timedelta(days=d_offset)).isoformat() for d_offset in range(days)]
+
+
+def _item_day(item):
+    """Calendar date (ISO string) a raw garth item belongs to, if it carries one."""
+    value = item.get('calendar_date') if isinstance(item, dict) else getattr(item, 'calendar_date', None)
+    return str(value) if value is not None else None
+
+
+def _contiguous_runs(day_list):
+    """Split newest-first ISO dates into runs of consecutive days."""
+    from datetime import timedelta
+    runs = []
+    for d in day_list:
+        if runs and date.fromisoformat(runs[-1][-1]) - timedelta(days=1) == date.fromisoformat(d):
+            runs[-1].append(d)
+        else:
+            runs.append([d])
+    return runs
+
+
+# How one garth class is fetched: the cache key its days are stored under, the
+# model class (None: raw dicts), and callables for a range and a single day.
+DaySource = namedtuple('DaySource', ['cache_key', 'data_class', 'list_range', 'list_day'])
+
+
+def _uses_raw_backend(class_name):
+    return FETCH_BACKEND == "raw" and class_name in raw_fetch.RAW_SOURCES
+
+
+def _cache_key(class_name):
+    """Raw dicts and garth models are cached apart, so switching backends is safe."""
+    return f"{class_name}@raw" if _uses_raw_backend(class_name) else class_name
+
+
+def _day_source(class_name):
+    """DaySource for ``class_name`` under the configured ``FETCH_BACKEND``."""
+    if _uses_raw_backend(class_name):
+        return DaySource(_cache_key(class_name), None,
+                         partial(raw_fetch.fetch_range, class_name), partial(raw_fetch.fetch_day, class_name))
+    import garth
+    data_class = getattr(garth, class_name)
+    return DaySource(class_name, data_class, data_class.list, lambda d: data_class.list(d, 1))
+
+
+def _fetch_days(name, class_name, day_list, per_day=False):
+    """Fetch raw items for every day in ``day_list``, serving what it can from cache.
+
+    Returns ``{day: [items]}``. Days that failed to fetch are left out. Missing
+    days of range-keyed classes are requested as contiguous ranges (one call
+    per run) unless ``per_day`` is set; all other days go out as concurrent
+    single-day requests.
+    """
+    source = _day_source(class_name)
+    cache = _get_cache()
+    by_day = {}
+    missing = list(day_list)
+    if cache is not None:
+        found, missing = cache.lookup(source.cache_key, day_list)
+        by_day = {d: load_items(source.data_class, payload) for d, payload in found.items()}
+    
+    fetched = {}
+    if missing and class_name in RANGE_KEYED_CLASSES and not per_day:
+        for run in _contiguous_runs(missing):
+            buckets = {d: [] for d in run}
+            for entry in source.list_range(run[0], len(run)):
+                day = _item_day(entry)
+                if day in buckets:
+                    buckets[day].append(entry)
+            fetched.update(buckets)
+    elif missing:
+        breaker = _breaker(name)
+        failures = []
+
+        def fetch_day(d):
+            if not breaker.allow():
+                return None  # the type is failing; leave the day for the next run
+            try:
+                day_data = source.list_day(d) or []
+            except Exception as e:
+                breaker.record(e)
+                failures.append(e)
+                return None  # Skip days with validation errors
+            breaker.record()
+            return day_data
+        
+        workers = max(1, min(DAY_BY_DAY_WORKERS_BY_TYPE.get(name, DAY_BY_DAY_WORKERS), len(missing)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for d, day_data in zip(missing, executor.map(fetch_day, missing)):
+                if day_data is not None:
+                    fetched[d] = day_data
+        if len(fetched) < len(missing):
+            reason = f" (last error: {describe_error(failures[-1])})" if failures else ""
+            print(f"⚠️  {name}: {len(missing) - len(fetched)} of {len(missing)} days not fetched{reason}")
+    
+    if cache is not None:
+        cache.store(source.cache_key, {d: dump_items(source.data_class, items) for d, items in fetched.items()})
+        print(f"💾 {name}: {len(day_list) - len(missing)} cached, {len(missing)} fetched")
+    
+    by_day.update(fetched)
+    series = _get_series_store() if class_name in SERIES_CLASSES else None
+    if series is not None:
+        try:
+            series.ingest(class_name, by_day, refresh=fetched)
+        except Exception as e:  # a full disk or bad item must not cost the report its data
+            print(f"⚠️  {name}: series not stored ({describe_error(e)})")
+    return by_day
+
+
+def _flatten_days(by_day, day_list, ascending=False):
+    """Concatenate per-day items in the order garth's .list() would return them."""
+    ordered_days = reversed(day_list) if ascending else day_list
+    raw = []
+    for d in ordered_days:
+        raw.extend(by_day.get(d, []))
+    return raw
+
+
+def _slim_data(name, raw, hints=None):
+    """Run raw data through the appropriate slimmer.
+
+    ``hints`` are the report's keyword arguments for the slimmer (the optional
+    4th element of a DATA_TYPES entry), e.g. ``{'include_timeline': False}``.
+    """
     if not raw or (isinstance(raw, list) and len(raw) == 0):
         return None
     
-    slimmer = SLIMMER_REGISTRY.get(name)
+    slimmer = get_slimmer(name)
     if slimmer:
-        # For sleep data with many days, strip verbose timeline to save tokens
-        if name == 'daily_sleep_data' and days and days > 5:
-            data = slimmer(raw, include_timeline=False)
-        else:
-            data = slimmer(raw)
+        kwargs = dict(hints or {})
+        series = _get_series_store() if name in SERIES_TYPES else None
+        if series is not None:
+            kwargs['series'] = series
+        data = slimmer(raw, **kwargs)
     else:
         # Generic conversion
         if hasattr(raw, '__iter__') and not isinstance(raw, (str, dict)):
@@ -1,10 +1,44 @@
-import garth
+from concurrent.futures import ThreadPoolExecutor
 
 
-def slim_detailed_activity(item):
+# (kind, endpoint) of the per-activity payloads slim_detailed_activity reads
+ACTIVITY_PAYLOADS = (
+    ('detail', '/activity-service/activity/{activity_id}'),
+    ('splits', '/activity-service/activity/{activity_id}/splits'),
+)
+
+
+def fetch_activity_payloads(activity_id, executor, fetch=None):
+    """Submit the detail and splits requests for one activity. Returns their futures.
+
+    ``fetch(activity_id, kind, path)`` stands in for ``garth.connectapi(path)``,
+    e.g. to serve payloads stored earlier.
+    """
+    if fetch is None:
+        import garth
+
+        def fetch(activity_id, kind, path):
+            return garth.connectapi(path)
+
+    return tuple(
+        executor.submit(fetch, activity_id, kind, path.format(activity_id=activity_id))
+        for kind, path in ACTIVITY_PAYLOADS
+    )
+
+
+def activity_id_of(item):
+    """Activity ID of a garth Activity or an activity dict."""
+    if isinstance(item, dict):
+        return item.get('activity_id')
+    return getattr(item, 'activity_id', None)
+
+
+def slim_detailed_activity(item, payloads=None):
     """
     Convert Activity to detailed dict with maximum parameters.
-    Uses Garmin Connect API to fetch comprehensive activity data.
+    Uses Garmin Connect API to fetch comprehensive activity data: the detail
+    and splits requests go out together, or come in as ``payloads`` futures
+    from ``fetch_activity_payloads`` when a caller batches several activities.
     
     Extracts:
     - Basic info (type, name, location, timestamps)
@@ -19,20 +53,18 @@ def slim_detailed_activity(item):
     - Coordinates
     - Water estimation
     """
-    # Get activity ID
-    if hasattr(item, 'activity_id'):
-        activity_id = item.activity_id
-    elif isinstance(item, dict):
-        activity_id = item.get('activity_id')
-    else:
-        activity_id = getattr(item, 'activity_id', None)
-    
+    activity_id = activity_id_of(item)
     if not activity_id:
         return {}
     
+    if payloads is None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            return slim_detailed_activity(item, fetch_activity_payloads(activity_id, executor))
+    detail_future, splits_future = payloads
+
     # Fetch detailed data from API
     try:
-        detailed = garth.connectapi(f'/activity-service/activity/{activity_id}')
+        detailed = detail_future.result()
     except Exception as e:
         print(f"⚠️  Could not fetch detailed data: {e}")
         # Fallback to basic data
@@ -225,7 +257,7 @@ def slim_detailed_activity(item):
 
     # Splits/Laps
     try:
-        splits_data = garth.connectapi(f'/activity-service/activity/{activity_id}/splits')
+        splits_data = splits_future.result()
         if splits_data and isinstance(splits_data, dict):
             laps = splits_data.get('lapDTOs') or splits_data.get('splitDTOs') or []
             if laps:
@@ -257,6 +289,17 @@ def slim_detailed_activity(item):
     return result
 
 
-def slim_detailed_activity_list(items):
-    """Convert list of Activity to detailed dicts."""
-    return [slim_detailed_activity(item) for item in items]
+def slim_detailed_activity_list(items, max_workers=None):
+    """Convert list of Activity to detailed dicts.
+
+    All detail and splits requests are issued up front on one pool of
+    ``ACTIVITY_DETAIL_WORKERS`` threads, so N activities cost about one
+    round-trip when the pool is wide enough.
+    """
+    from config import ACTIVITY_DETAIL_WORKERS
+
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=max_workers or ACTIVITY_DETAIL_WORKERS) as executor:
+        payloads = [fetch_activity_payloads(activity_id_of(item), executor) if activity_id_of(item) else None
+                    for item in items]
+        return [slim_detailed_activity(item, p) for item, p in zip(items, payloads)]
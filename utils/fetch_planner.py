@@ -0,0 +1,158 @@
+"""Cross-report fetch planner.
+
+The DATA_TYPES_* lists overlap heavily (HRV is wanted by almost every report,
+weight for 30 days by four of them). The planner merges a set of reports into
+one fetch per data type over its widest window, runs that plan once and slices
+each report's own window out of the shared result. A report with a deadline
+is written with whatever has arrived by then; a report file collected since
+the watch last synced is kept, and its types are left out of the plan.
+"""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import date
+
+from config import REPORTS, DAYS_TO_COLLECT, FETCH_WORKERS, REPORT_DEADLINES_S
+from collection_utils import (
+    fetch_raw, slim_window, estimate_api_calls, missing_days, collection_status, COLLECTION_STATUS_KEY,
+    set_request_deadline, stop_fetches, wait_for_stopped_fetches,
+    check_sync, report_is_current, remember_report, print_kept,
+)
+from throttle import describe_error
+
+
+def build_plan(report_names):
+    """Merge reports into ``{name: {'class_name', 'days', 'windows'}}``.
+
+    ``days`` is the widest window any report asks for; ``windows`` maps each
+    report to its own window. Types keep the order they are first seen in.
+    Reports without a DATA_TYPES list (activity) must be collected separately.
+    """
+    plan = {}
+    for report in report_names:
+        data_types = REPORTS[report][0]
+        for item in data_types:
+            name, class_name = item[0], item[1]
+            days = item[2] if len(item) > 2 else DAYS_TO_COLLECT
+            entry = plan.setdefault(name, {'class_name': class_name, 'days': days, 'windows': {}})
+            entry['days'] = max(entry['days'], days)
+            entry['windows'][report] = days
+    return plan
+
+
+def print_plan(plan, today=None):
+    """Print the plan with expected API calls and cache hits (dry run)."""
+    today = today or date.today().isoformat()
+    planned_calls = separate_calls = 0
+    print(f"{'data type':<24} {'window':>6} {'cached':>6} {'calls':>5}  reports")
+    for name, entry in plan.items():
+        calls, cached = estimate_api_calls(name, entry['class_name'], entry['days'], today)
+        planned_calls += calls
+        separate_calls += sum(
+            estimate_api_calls(name, entry['class_name'], days, today)[0]
+            for days in entry['windows'].values()
+        )
+        windows = ", ".join(f"{report} {days}d" for report, days in entry['windows'].items())
+        print(f"{name:<24} {entry['days']:>5}d {cached:>6} {calls:>5}  {windows}")
+    print(f"\n📋 {len(plan)} data types, ~{planned_calls} API calls "
+          f"(~{separate_calls} if each report ran on its own)")
+
+
+def run_plan(plan, report_names, results_dir, max_workers=None, deadlines=None, refresh=False):
+    """Fetch every planned type once, then write each report's output file.
+
+    ``deadlines`` maps reports to seconds (``REPORT_DEADLINES_S`` by default).
+    Reports are written in deadline order, each as soon as its own types are
+    in or its deadline passes; types not in by then are listed as missing in
+    its ``_collection_status``. Requests stop once no report waits any longer;
+    fetches cut off that way are not waited for.
+
+    Reports whose file is still current (nothing synced since it was
+    collected, see ``report_is_current``) are kept unless ``refresh`` is set.
+    """
+    results_dir.mkdir(exist_ok=True)
+    today = date.today().isoformat()
+    wait_for_stopped_fetches()
+    synced_at = check_sync()
+    if not refresh:
+        current = [report for report in report_names
+                   if report_is_current(results_dir / REPORTS[report][1], REPORTS[report][0], DAYS_TO_COLLECT,
+                                        synced_at, today)]
+        for report in current:
+            print_kept(results_dir / REPORTS[report][1], synced_at)
+        report_names = [report for report in report_names if report not in current]
+        if not report_names:
+            return
+        plan = {name: dict(entry, days=max(days for report, days in entry['windows'].items()
+                                           if report in report_names))
+                for name, entry in plan.items() if any(report in entry['windows'] for report in report_names)}
+    max_workers = max_workers or FETCH_WORKERS
+    deadlines = {report: (REPORT_DEADLINES_S if deadlines is None else deadlines).get(report)
+                 for report in report_names}
+    started = time.monotonic()
+
+    def fetch(name):
+        entry = plan[name]
+        return fetch_raw(name, entry['class_name'], entry['days'], today)
+
+    fetched, failed = {}, []
+
+    def settle(names, timeout):
+        """Wait up to ``timeout`` seconds for ``names`` and record the ones that finished."""
+        wait([futures[name] for name in names], timeout=timeout)
+        for name in names:
+            if name in fetched or name in failed or not futures[name].done():
+                continue
+            try:
+                fetched[name] = futures[name].result()
+            except Exception as e:
+                print(f"⚠️  {name}: {describe_error(e)}")
+                failed.append(name)
+                continue
+            if fetched[name] is None:
+                print(f"⚠️  {name}: No data available")
+            else:
+                print(f"✅ {name} ({plan[name]['days']}d)")
+
+    if all(seconds is not None for seconds in deadlines.values()):
+        set_request_deadline(max(deadlines.values(), default=None))
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(plan) or 1)))
+    futures = {name: executor.submit(fetch, name) for name in plan}
+    try:
+        for report in sorted(report_names, key=lambda r: float('inf') if deadlines[r] is None else deadlines[r]):
+            data_types, output_name, _ = REPORTS[report]
+            names = [item[0] for item in data_types]
+            deadline = deadlines[report]
+            settle(names, None if deadline is None else max(0.0, started + deadline - time.monotonic()))
+
+            all_data, missing, partial = {}, [], {}
+            for item in data_types:
+                name = item[0]
+                window = plan[name]['windows'][report]
+                if name not in fetched:
+                    missing.append(name)
+                    continue
+                if fetched[name] is None:
+                    continue
+                hints = item[3] if len(item) > 3 else None
+                data = slim_window(name, fetched[name], window, today, hints)
+                if data:
+                    all_data[name] = data
+                gaps = missing_days(fetched[name], window, today)
+                if gaps:
+                    partial[name] = gaps
+            late = [name for name in missing if name not in failed]
+            if late:
+                print(f"⏱️  {report}: deadline of {deadline}s reached before {', '.join(late)}")
+            status = collection_status(missing, partial, deadline if late else None)
+            if status:
+                all_data[COLLECTION_STATUS_KEY] = status
+
+            output_file = results_dir / output_name
+            with open(output_file, "w") as f:
+                json.dump(all_data, f, indent=2, default=str)
+            if not status:
+                remember_report(output_file, data_types, DAYS_TO_COLLECT, synced_at, today)
+            print(f"✅ {report}: saved to {output_file}")
+    finally:
+        stop_fetches(executor, futures.values())
@@ -1,5 +1,7 @@
 """Shared formatting utilities for all slimmers."""
+from bisect import bisect_left
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 
 
 def to_dict(item):
@@ -15,6 +17,20 @@ def to_dict(item):
     return {}
 
 
+def epoch_ms(value):
+    """ms epoch of a datetime, a GMT ISO string or a number (None when unknown)."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp() * 1000
+
+
 def ms_to_local_iso(ms, tz_offset_ms=None):
     """Convert millisecond epoch to local ISO string (YYYY-MM-DDTHH:MM:SS).
 
@@ -65,7 +81,11 @@ def percentile(data, p):
     """Calculate percentile without numpy using linear interpolation."""
     if not data:
         return None
-    sorted_data = sorted(data)
+    return _interpolate(sorted(data), p)
+
+
+def _interpolate(sorted_data, p):
+    """Percentile ``p`` (0..1) of already sorted data, linear interpolation."""
     k = (len(sorted_data) - 1) * p
     f = int(k)
     c = f + 1
@@ -73,3 +93,104 @@ def percentile(data, p):
         return sorted_data[-1]
     return sorted_data[f] + (k - f) * (sorted_data[c] - sorted_data[f])
 
+
+
+class SeriesStats:
+    """Summary of one series, shared by all series slimmers.
+
+    ``values`` is the raw series in time order; None entries count as missing.
+    The values are picked out in one Python-level pass and reduced with C
+    builtins. Quantiles, zone histograms and threshold counts all come from
+    a single sort, which only happens when one of them is asked for.
+
+    ``peak_index`` / ``trough_index`` are positions of the first max / min in
+    the raw series, so callers can look up the matching timestamp.
+    """
+
+    __slots__ = ('samples', 'missing', 'count', 'mean', 'min', 'max', 'first', 'last',
+                 'peak_index', 'trough_index', '_valid', '_sorted')
+
+    def __init__(self, values):
+        self.samples = len(values)
+        self.missing = values.count(None)
+        valid = [v for v in values if v is not None] if self.missing else values
+        self.count = len(valid)
+        self._valid = valid
+        self._sorted = None
+        if valid:
+            self.mean = sum(valid) / self.count
+            self.min = min(valid)
+            self.max = max(valid)
+            self.first = valid[0]
+            self.last = valid[-1]
+            self.peak_index = values.index(self.max)
+            self.trough_index = values.index(self.min)
+        else:
+            self.mean = self.min = self.max = self.first = self.last = None
+            self.peak_index = self.trough_index = None
+
+    @classmethod
+    def of_points(cls, points, value_index=1):
+        """Stats of ``point[value_index]`` over ``[[ts, ..., value, ...], ...]``.
+
+        Points too short to hold a value count as missing.
+        """
+        points = points or []
+        try:
+            values = [point[value_index] for point in points]
+        except IndexError:
+            values = [point[value_index] if len(point) > value_index else None for point in points]
+        return cls(values)
+
+    @property
+    def sorted(self):
+        if self._sorted is None:
+            self._sorted = sorted(self._valid)
+        return self._sorted
+
+    def quantile(self, p):
+        """Percentile ``p`` (0..1), same interpolation as ``percentile()``."""
+        if not self.count:
+            return None
+        return _interpolate(self.sorted, p)
+
+    def count_below(self, threshold):
+        """Number of values strictly below ``threshold``."""
+        return bisect_left(self.sorted, threshold)
+
+    def histogram(self, thresholds):
+        """Counts per zone for ascending ``thresholds``.
+
+        Zone 0 holds values below ``thresholds[0]``, zone i values in
+        ``[thresholds[i-1], thresholds[i])`` and the last zone the rest.
+        """
+        edges = [0] + [bisect_left(self.sorted, t) for t in thresholds] + [self.count]
+        return [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
+
+
+@lru_cache(maxsize=None)
+def _series_backend():
+    """(NumPy stats class or None, minimum series length to use it)."""
+    from config import SERIES_BACKEND, NUMPY_MIN_SAMPLES
+    if SERIES_BACKEND == 'python':
+        return None, 0
+    if SERIES_BACKEND == 'numpy':
+        from series_numpy import ArraySeriesStats
+        return ArraySeriesStats, 0
+    try:
+        from series_numpy import ArraySeriesStats
+    except ImportError:
+        return None, 0
+    return ArraySeriesStats, NUMPY_MIN_SAMPLES
+
+
+def integer_series_stats(points, value_index=1):
+    """SeriesStats of an integer series, computed with NumPy for long series.
+
+    Falls back to the pure-Python SeriesStats when NumPy is not installed or
+    SERIES_BACKEND is "python"; both give identical results.
+    """
+    backend, min_samples = _series_backend()
+    if backend is not None and points and len(points) >= min_samples:
+        return backend.of_points(points, value_index)
+    return SeriesStats.of_points(points, value_index)
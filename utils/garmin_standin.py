@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Local stand-in for the Garmin Connect API (offline end-to-end benchmarks).
+
+Serves the endpoints garth and the slimmers hit, either from a synthetic
+multi-year account (synthetic_garmin.py) or by replaying responses recorded
+from the real API (see http_session.record_responses). Latency, jitter and
+HTTP 429 injection (at random, or past a number of requests in flight) make
+throughput work reproducible, as do stragglers (a fraction of requests with
+extra latency) and slow endpoints; a per-connection
+handshake delay stands in for TCP + TLS setup, so connection reuse shows.
+Responses are gzip-compressed (brotli if installed) when the client accepts it.
+
+    python3 utils/garmin_standin.py --port 8765 --latency-ms 120 --jitter-ms 40
+    GARMIN_STANDIN_URL=http://127.0.0.1:8765 python3 run.py morning --collect-only
+
+Benchmarks can run it in-process with ``start_standin()``.
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+from synthetic_garmin import SyntheticAccount
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies below this size are sent as they are
+COMPRESS_MIN_BYTES = 512
+
+# (pattern, handler(account, match, query)) — first match wins
+ROUTES = [
+    (r"/userprofile-service/socialProfile", lambda a, m, q: a.social_profile()),
+    (r"/device-service/deviceservice/mylastused", lambda a, m, q: a.last_used_device()),
+    (r"/wellness-service/wellness/dailyHeartRate/?", lambda a, m, q: a.daily_heart_rate(q["date"])),
+    (r"/sleep-service/sleep/dailySleepData", lambda a, m, q: a.daily_sleep(q["date"])),
+    (r"/hrv-service/hrv/daily/([\d-]+)/([\d-]+)", lambda a, m, q: a.hrv_range(*m.groups())),
+    (r"/usersummary-service/stats/stress/daily/([\d-]+)/([\d-]+)", lambda a, m, q: a.stress_range(*m.groups())),
+    (r"/usersummary-service/stats/steps/daily/([\d-]+)/([\d-]+)", lambda a, m, q: a.steps_range(*m.groups())),
+    (r"/wellness-service/wellness/bodyBattery/events/([\d-]+)", lambda a, m, q: a.body_battery_events(m.group(1))),
+    (r"/metrics-service/metrics/trainingreadiness/([\d-]+)", lambda a, m, q: a.training_readiness(m.group(1))),
+    (r"/metrics-service/metrics/hillscore", lambda a, m, q: a.hill_score(q["calendarDate"])),
+    (r"/metrics-service/metrics/endurancescore", lambda a, m, q: a.endurance_score(q["calendarDate"])),
+    (r"/wellness-service/wellness/scores/daily/([\d-]+)/([\d-]+)", lambda a, m, q: a.daily_scores(*m.groups())),
+    (r"/usersummary-service/usersummary/daily/?", lambda a, m, q: a.daily_summary(q["calendarDate"])),
+    (r"/mobile-gateway/usersummary/trainingstatus/latest/([\d-]+)", lambda a, m, q: a.training_status(m.group(1))),
+    (r"/weight-service/weight/range/([\d-]+)/([\d-]+)", lambda a, m, q: a.weight_range(*m.groups())),
+    (r"/weight-service/weight/dayview/([\d-]+)", lambda a, m, q: a.weight_dayview(m.group(1))),
+    (r"/activitylist-service/activities/search/activities",
+     lambda a, m, q: a.activities(q.get("start", 0), q.get("limit", 20))),
+    (r"/activity-service/activity/(\d+)/splits", lambda a, m, q: a.activity_splits(m.group(1))),
+    (r"/activity-service/activity/(\d+)", lambda a, m, q: a.activity_detail(m.group(1))),
+    (r"/fitnessstats-service/activity/all", lambda a, m, q: a.fitness_activities(q["startDate"], q["endDate"])),
+]
+ROUTES = [(re.compile(pattern + "$"), handler) for pattern, handler in ROUTES]
+
+
+def recording_key(path, query=""):
+    """File name of a recorded response: readable path plus a hash of the query."""
+    params = sorted((k, v) for k, vs in parse_qs(query).items() for v in vs)
+    digest = hashlib.sha1(json.dumps(params).encode()).hexdigest()[:10] if params else "noquery"
+    return f"{path.strip('/').replace('/', '__') or 'root'}--{digest}.json"
+
+
+class StandinServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer carrying the stand-in's settings and counters."""
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, account=None, replay_dir=None,
+                 latency_ms=0, jitter_ms=0, rate_429=0.0, seed=0, connect_ms=0, compress=True,
+                 max_in_flight=0, tail_rate=0.0, tail_ms=0, slow_paths=None):
+        super().__init__(address, StandinHandler)
+        self.account = account or SyntheticAccount(seed=seed)
+        self.replay_dir = Path(replay_dir) if replay_dir else None
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_429 = rate_429
+        self.connect_ms = connect_ms
+        self.compress = compress
+        self.max_in_flight = max_in_flight
+        self.tail_rate = tail_rate
+        self.tail_ms = tail_ms
+        self.slow_paths = dict(slow_paths or {})  # path prefix → extra ms
+        self.in_flight = 0
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "throttled": 0, "not_found": 0, "connections": 0, "bytes_sent": 0}
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key, amount=1):
+        with self.lock:
+            self.stats[key] += amount
+
+    def delay(self, path):
+        """Simulated server latency for one request in seconds, and whether to answer 429.
+
+        Counts the request as in flight until ``done()``.
+        """
+        extra = sum(ms for prefix, ms in self.slow_paths.items() if path.startswith(prefix))
+        with self.lock:
+            jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+            if self.tail_rate and self.rng.random() < self.tail_rate:
+                extra += self.tail_ms
+            throttle = self.rate_429 and self.rng.random() < self.rate_429
+            self.in_flight += 1
+            throttle = throttle or bool(self.max_in_flight and self.in_flight > self.max_in_flight)
+        return max(0.0, self.latency_ms + jitter + extra) / 1000, throttle
+
+    def done(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def payload(self, path, query):
+        """Response body for a request, or raise KeyError when nothing matches."""
+        if self.replay_dir is not None:
+            recorded = self.replay_dir / recording_key(path, query)
+            if not recorded.exists():
+                raise KeyError(path)
+            return json.loads(recorded.read_text())
+        flat_query = {k: v[0] for k, v in parse_qs(query).items()}
+        for pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match:
+                return handler(self.account, match, flat_query)
+        raise KeyError(path)
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """Keep-alive JSON handler; every response carries a Content-Length."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+        if self.server.connect_ms:
+            time.sleep(self.server.connect_ms / 1000)  # handshake of a new connection
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output readable
+
+    def _encode(self, body):
+        """``(body, Content-Encoding)`` for what the client accepts, or ``(body, None)``."""
+        if not self.server.compress or len(body) < COMPRESS_MIN_BYTES:
+            return body, None
+        accepted = {part.split(";")[0].strip() for part in self.headers.get("Accept-Encoding", "").split(",")}
+        if brotli is not None and "br" in accepted:
+            return brotli.compress(body, quality=5), "br"
+        if "gzip" in accepted:
+            return gzip.compress(body, compresslevel=5), "gzip"
+        return body, None
+
+    def _send(self, status, body=b"", headers=None):
+        body, encoding = self._encode(body)
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if self.close_connection:
+            self.send_header("Connection", "close")  # so the client does not pool the socket
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+            self.server.count("bytes_sent", len(body))
+
+    def _handle(self):
+        server = self.server
+        server.count("requests")
+        if self.command in ("POST", "PUT") and self.headers.get("Content-Length"):
+            self.rfile.read(int(self.headers["Content-Length"]))
+
+        url = urlsplit(self.path)
+        delay, throttle = server.delay(url.path)
+        try:
+            if delay:
+                time.sleep(delay)
+        finally:
+            server.done()
+        if throttle:
+            server.count("throttled")
+            self._send(429, b'{"message": "Too Many Requests"}',
+                       {"Content-Type": "application/json", "Retry-After": "1"})
+            return
+
+        try:
+            payload = server.payload(url.path, url.query)
+        except KeyError:
+            server.count("not_found")
+            self._send(404, b'{"message": "Not Found"}', {"Content-Type": "application/json"})
+            return
+        if payload is None:
+            self._send(204)
+            return
+        self._send(200, json.dumps(payload).encode(), {"Content-Type": "application/json"})
+
+    do_GET = do_POST = do_PUT = _handle
+
+
+def start_standin(host="127.0.0.1", port=0, **kwargs):
+    """Start a stand-in server on a background thread. Returns the server.
+
+    ``port=0`` picks a free port (see ``server.url``); stop it with
+    ``server.shutdown()``.
+    """
+    server = StandinServer((host, port), **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in Garmin Connect API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--replay", metavar="DIR", help="serve recorded responses from DIR instead of synthetic data")
+    parser.add_argument("--years", type=float, default=3, help="history of the synthetic account")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sync-interval-min", type=float, default=15,
+                        help="the synthetic watch syncs this often (today's data ends at the last sync)")
+    parser.add_argument("--latency-ms", type=float, default=0, help="added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="uniform ± jitter on the latency")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="fraction of requests answered with 429")
+    parser.add_argument("--max-in-flight", type=int, default=0,
+                        help="answer 429 to requests beyond this many at once (0: no limit)")
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="fraction of requests that straggle")
+    parser.add_argument("--tail-ms", type=float, default=0, help="extra latency of a straggling request")
+    parser.add_argument("--slow", action="append", default=[], metavar="PREFIX=MS",
+                        help="extra latency for paths starting with PREFIX (repeatable)")
+    parser.add_argument("--connect-ms", type=float, default=0, help="added handshake delay per new connection")
+    parser.add_argument("--no-compress", action="store_true", help="never compress response bodies")
+    args = parser.parse_args()
+
+    server = StandinServer(
+        (args.host, args.port),
+        account=SyntheticAccount(seed=args.seed, years=args.years, sync_interval_min=args.sync_interval_min),
+        replay_dir=args.replay,
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429, seed=args.seed,
+        connect_ms=args.connect_ms, compress=not args.no_compress, max_in_flight=args.max_in_flight,
+        tail_rate=args.tail_rate, tail_ms=args.tail_ms,
+        slow_paths={prefix: float(ms) for prefix, ms in (item.rsplit("=", 1) for item in args.slow)},
+    )
+    source = f"replaying {args.replay}" if args.replay else f"synthetic {args.years:g}y account"
+    print(f"🧪 Garmin stand-in on {server.url} ({source})")
+    print(f"   export GARMIN_STANDIN_URL={server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,54 @@
-from format_utils import to_dict, format_timestamp, ms_to_local_iso, percentile
+from format_utils import to_dict, format_timestamp, ms_to_local_iso, integer_series_stats, epoch_ms
+
+ZONE_NAMES = ['below_z1', 'z1', 'z2', 'z3', 'z4', 'z5']
+
+
+def zone_thresholds(max_hr):
+    """Zone starts for zones 1 (50-60% of ``max_hr``) to 5 (90-100%)."""
+    return [max_hr * 0.5, max_hr * 0.6, max_hr * 0.7, max_hr * 0.8, max_hr * 0.9]
+
+
+def zone_pct(stats, max_hr):
+    """Share of ``stats``'s samples in each zone, in percent (empty zones left out)."""
+    zones = dict(zip(ZONE_NAMES, stats.histogram(zone_thresholds(max_hr))))
+    return {k: round(v / stats.count * 100, 1) for k, v in zones.items() if v > 0}
+
+
+def zone_history(series, day, max_hr, days):
+    """Zone distribution over the ``days`` days up to ``day`` read from ``series`` (a ``SeriesStore``).
+
+    The stored days are read memory-mapped, without loading their samples.
+    None when no sample of the window is stored.
+    """
+    stored, stats = series.summary('heart_rate', 'bpm', day, days)
+    if not stats.count:
+        return None
+    return {'days_covered': stored, 'samples_count': stats.count, 'zone_pct': zone_pct(stats, max_hr)}
+
+
+def day_minutes(data):
+    """Minutes from the day's local midnight to the next one: 1380 or 1500 when DST changes, else 1440."""
+    start, end = epoch_ms(data.get('start_timestamp_gmt')), epoch_ms(data.get('end_timestamp_gmt'))
+    if start is None or end is None or end <= start:
+        return 24 * 60
+    return round((end - start) / 60000)
+
+
+def hr_profile(series, day, minutes, length=24 * 60):
+    """``['HH:MM', min, avg, max]`` per ``minutes`` of ``day`` from ``series``'s pre-aggregated buckets.
+
+    Buckets count elapsed minutes from local midnight, and ``length`` is the
+    day's length in minutes (``day_minutes``), so the 25th hour of a DST
+    fall-back day is kept, labelled "24:00". None when the day is not stored.
+    """
+    buckets = series.buckets('heart_rate', day, minutes)
+    if buckets is None or not len(buckets):
+        return None
+    profile = []
+    for _, offset, _, low, high, mean, _ in buckets.tolist():
+        if 0 <= offset < length:
+            profile.append([f"{int(offset) // 60:02d}:{int(offset) % 60:02d}", int(low), round(mean, 1), int(high)])
+    return profile
 
 
 def slim_daily_heart_rate(item):
@@ -19,19 +69,18 @@ def slim_daily_heart_rate(item):
         heart_rate_values = []
     
     # Aggregate series
-    samples_count = len(heart_rate_values)
-    valid_hrs = [(ts, hr) for ts, hr in heart_rate_values if hr is not None]
-    missing_count = samples_count - len(valid_hrs)
-    
-    if valid_hrs:
-        hrs_only = [hr for _, hr in valid_hrs]
-        avg_hr = round(sum(hrs_only) / len(hrs_only), 2)
-        p95_hr = round(percentile(hrs_only, 0.95), 2) if percentile(hrs_only, 0.95) is not None else None
-        min_hr = min(hrs_only)
-        max_hr = max(hrs_only)
-        
+    stats = integer_series_stats(heart_rate_values)
+    samples_count = stats.samples
+    missing_count = stats.missing
+
+    if stats.count:
+        avg_hr = round(stats.mean, 2)
+        p95_hr = round(stats.quantile(0.95), 2)
+        min_hr = stats.min
+        max_hr = stats.max
+
         # Find peak (first occurrence of max)
-        peak_ts, peak_hr = next((ts, hr) for ts, hr in valid_hrs if hr == max_hr)
+        peak_ts, peak_hr = heart_rate_values[stats.peak_index][0], max_hr
     else:
         avg_hr = p95_hr = min_hr = max_hr = None
         peak_ts = peak_hr = None
@@ -64,33 +113,8 @@ def slim_daily_heart_rate(item):
     # HR zone distribution (estimated from series)
     # Zones: 1 (50-60% max), 2 (60-70%), 3 (70-80%), 4 (80-90%), 5 (90-100%)
     max_hr_val = data.get('max_heart_rate')
-    if valid_hrs and max_hr_val and max_hr_val > 0:
-        zone_thresholds = [
-            max_hr_val * 0.5,  # zone 1 start
-            max_hr_val * 0.6,  # zone 2 start
-            max_hr_val * 0.7,  # zone 3 start
-            max_hr_val * 0.8,  # zone 4 start
-            max_hr_val * 0.9,  # zone 5 start
-        ]
-        zones = {'below_z1': 0, 'z1': 0, 'z2': 0, 'z3': 0, 'z4': 0, 'z5': 0}
-        for _, hr in valid_hrs:
-            if hr < zone_thresholds[0]:
-                zones['below_z1'] += 1
-            elif hr < zone_thresholds[1]:
-                zones['z1'] += 1
-            elif hr < zone_thresholds[2]:
-                zones['z2'] += 1
-            elif hr < zone_thresholds[3]:
-                zones['z3'] += 1
-            elif hr < zone_thresholds[4]:
-                zones['z4'] += 1
-            else:
-                zones['z5'] += 1
-        total_samples = len(valid_hrs)
-        if total_samples > 0:
-            series_summary['zone_pct'] = {
-                k: round(v / total_samples * 100, 1) for k, v in zones.items() if v > 0
-            }
+    if stats.count and max_hr_val and max_hr_val > 0:
+        series_summary['zone_pct'] = zone_pct(stats, max_hr_val)
     
     result['series_summary'] = series_summary
 
@@ -105,24 +129,47 @@ def slim_daily_heart_rate(item):
             )
 
     # Time below resting HR (indicates good rest periods)
-    if valid_hrs and resting_hr is not None:
-        below_resting = sum(1 for _, hr in valid_hrs if hr < resting_hr)
+    if stats.count and resting_hr is not None:
+        below_resting = stats.count_below(resting_hr)
         if below_resting > 0:
-            result['time_below_resting_pct'] = round(below_resting / len(valid_hrs) * 100, 1)
+            result['time_below_resting_pct'] = round(below_resting / stats.count * 100, 1)
 
     return result
 
 
-def slim_daily_heart_rate_list(items):
-    """Convert list of DailyHeartRate to compact analysis-ready dicts."""
+def slim_daily_heart_rate_list(items, series=None, zone_history_days=None, profile_minutes=None):
+    """Convert list of DailyHeartRate to compact analysis-ready dicts.
+
+    With ``zone_history_days`` and ``series`` (a ``SeriesStore``) the newest
+    day also gets ``zone_history``: the zones of the highest daily max in
+    ``items`` (today's max is still partial) applied to every stored day of
+    that window, as a baseline for the daily ``zone_pct``. With
+    ``profile_minutes`` (a level of the store's buckets) it also gets
+    ``hr_profile_<N>m``, its min/avg/max per ``N`` minutes.
+    """
     if not items:
         return []
-    
+
     # Filter out None results
     results = []
+    items_by_day = {}
     for item in items:
         slimmed = slim_daily_heart_rate(item)
         if slimmed is not None:
             results.append(slimmed)
-    
+            items_by_day[slimmed.get('calendar_date')] = item
+
+    newest = max(results, key=lambda r: r.get('calendar_date', ''), default={})
+    if series is not None and newest.get('calendar_date'):
+        max_hr = max((r['max_heart_rate'] for r in results if r.get('max_heart_rate')), default=None)
+        if zone_history_days and max_hr and max_hr > 0:
+            history = zone_history(series, newest['calendar_date'], max_hr, zone_history_days)
+            if history:
+                newest['zone_history'] = history
+        if profile_minutes:
+            length = day_minutes(to_dict(items_by_day[newest['calendar_date']]))
+            profile = hr_profile(series, newest['calendar_date'], profile_minutes, length)
+            if profile:
+                newest[f'hr_profile_{profile_minutes}m'] = profile
+
     return results
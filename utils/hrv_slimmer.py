@@ -5,9 +5,7 @@ def slim_daily_hrv(item):
     """Convert DailyHRV to compact analysis-ready dict with trend analysis."""
     data = to_dict(item)
 
-    baseline = data.get('baseline', {})
-    if not isinstance(baseline, dict):
-        baseline = baseline.dict() if hasattr(baseline, 'dict') else vars(baseline) if hasattr(baseline, '__dict__') else {}
+    baseline = to_dict(data.get('baseline'))
     
     result = {}
     if data.get('calendar_date') is not None:
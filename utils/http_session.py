@@ -0,0 +1,152 @@
+"""HTTP session plumbing for garth: pool tuning, token refresh, stand-in redirection and response recording."""
+import json
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+
+
+class StandinAdapter(HTTPAdapter):
+    """Sends every https:// request to the stand-in server instead.
+
+    Scheme and host are swapped for ``base_url``; path and query are kept, so
+    ``https://connectapi.garmin.com/hrv-service/...`` becomes
+    ``http://127.0.0.1:8765/hrv-service/...``.
+    """
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url.rstrip("/")
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        url = urlsplit(request.url)
+        request.url = self.base_url + url.path + (f"?{url.query}" if url.query else "")
+        return super().send(request, **kwargs)
+
+
+_last_responses = threading.local()
+
+
+def per_thread_last_response():
+    """Give each thread its own ``last_resp`` on garth clients.
+
+    ``Client.request`` stores every response on the shared client and returns
+    ``self.last_resp``, so two threads requesting at once can each get the
+    other's response. Safe to call more than once.
+    """
+    from garth.http import Client
+
+    if isinstance(Client.__dict__.get("last_resp"), property):
+        return
+
+    def get(client):
+        return getattr(_last_responses, "by_client", {}).get(id(client))
+
+    def set_(client, response):
+        if not hasattr(_last_responses, "by_client"):
+            _last_responses.by_client = {}
+        _last_responses.by_client[id(client)] = response
+
+    Client.last_resp = property(get, set_)
+
+
+def tune_session(client, pool_size):
+    """Size the client's keep-alive pool for ``pool_size`` requests in flight and ask for compressed responses.
+
+    garth mounts a 10-connection pool; past ten threads each extra request
+    opens (and TLS-handshakes) a connection of its own and closes it after.
+    Accept-Encoding lists every encoding urllib3 can decode here, so brotli
+    and zstd are negotiated when their packages are installed, gzip otherwise.
+    """
+    from urllib3.util.request import ACCEPT_ENCODING
+
+    if client.pool_maxsize != pool_size:
+        client.configure(pool_maxsize=pool_size)  # remounts https://; call before use_standin
+    client.sess.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+
+_token_refresh_lock = threading.Lock()
+
+
+def single_flight_token_refresh():
+    """Let one thread refresh an expired OAuth2 token while the others wait for it.
+
+    ``Client.request`` refreshes an expired token itself, so every thread that
+    sees it expire would otherwise exchange a token of its own. Safe to call
+    more than once.
+    """
+    from garth.http import Client
+
+    if getattr(Client.refresh_oauth2, "single_flight", False):
+        return
+    refresh = Client.refresh_oauth2
+
+    def refresh_once(client):
+        with _token_refresh_lock:
+            token = client.oauth2_token
+            if token is None or token.expired:  # not refreshed by another thread meanwhile
+                refresh(client)
+
+    refresh_once.single_flight = True
+    refresh_once.__wrapped__ = refresh
+    Client.refresh_oauth2 = refresh_once
+
+
+def refresh_token_if_expiring(client, margin_s):
+    """Refresh the OAuth2 token now if it expires within ``margin_s`` seconds. Returns True if refreshed.
+
+    Holds the single-flight lock, so threads refreshing an expired token wait
+    for this one instead of exchanging their own.
+    """
+    refresh = type(client).refresh_oauth2
+    refresh = getattr(refresh, "__wrapped__", refresh)  # the single-flight wrapper skips unexpired tokens
+    with _token_refresh_lock:
+        token = client.oauth2_token
+        if token is None or getattr(token, "expires_at", 0) - time.time() > margin_s:
+            return False
+        refresh(client)
+    return True
+
+
+def use_standin(base_url, client=None):
+    """Point a garth client (the global one by default) at a stand-in server with dummy tokens."""
+    import garth
+    from garth.auth_tokens import OAuth1Token, OAuth2Token
+
+    per_thread_last_response()
+    client = client or garth.client
+    far_future = int(time.time()) + 365 * 24 * 3600
+    client.oauth1_token = OAuth1Token(oauth_token="standin", oauth_token_secret="standin", domain="garmin.com")
+    client.oauth2_token = OAuth2Token(
+        scope="standin", jti="standin", token_type="Bearer",
+        access_token="standin", refresh_token="standin",
+        expires_in=far_future, expires_at=far_future,
+        refresh_token_expires_in=far_future, refresh_token_expires_at=far_future,
+    )
+    client.sess.mount("https://", StandinAdapter(
+        base_url, pool_connections=client.pool_connections, pool_maxsize=client.pool_maxsize,
+    ))
+
+
+def record_responses(record_dir):
+    """Save every successful JSON API response for later replay by the stand-in."""
+    import garth
+    from garmin_standin import recording_key
+
+    record_dir = Path(record_dir)
+    record_dir.mkdir(parents=True, exist_ok=True)
+
+    def save(response, *args, **kwargs):
+        if response.request.method != "GET" or response.status_code not in (200, 204):
+            return
+        try:
+            payload = response.json() if response.status_code == 200 else None
+        except ValueError:
+            return
+        url = urlsplit(response.url)
+        with open(record_dir / recording_key(url.path, url.query), "w") as f:
+            json.dump(payload, f)
+
+    garth.client.sess.hooks["response"].append(save)
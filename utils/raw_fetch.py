@@ -0,0 +1,159 @@
+"""Raw-JSON fetch backend (``FETCH_BACKEND = "raw"`` in config).
+
+Calls the endpoints garth's data classes use through ``garth.connectapi`` and
+keeps every entry as a snake_case dict instead of validating it into a
+pydantic model. A malformed entry is dropped on its own, so one bad day no
+longer fails a whole range response (and no longer sends ``fetch_raw`` into
+its day-by-day refetch). Slimmers read dicts and models alike (``to_dict``).
+
+Entries keep every field Garmin sends, including ones garth's models drop.
+Classes without a RawSource here always go through garth's models.
+"""
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+
+# day_path: endpoint for one day ({day}); range_path: endpoint for
+# {start}..{end} (range-keyed classes only); page_days: longest range per call
+# (None: not paged); entries: response -> list of camelCase entries.
+RawSource = namedtuple('RawSource', ['day_path', 'range_path', 'page_days', 'entries'])
+
+
+def _one(response):
+    return [response] if isinstance(response, dict) and response else []
+
+
+def _many(response):
+    return response if isinstance(response, list) else []
+
+
+def _sleep(response):
+    if not isinstance(response, dict) or not (response.get('dailySleepDTO') or {}).get('id'):
+        return []
+    return [response]
+
+
+def _stats(response):
+    """Usersummary stats rows, with their ``values`` merged in (as garth does)."""
+    rows = [row for row in _many(response) if isinstance(row, dict)]
+    return [{**row, **row['values']} if isinstance(row.get('values'), dict) else row for row in rows]
+
+
+def _hrv(response):
+    return _many(response.get('hrvSummaries')) if isinstance(response, dict) else []
+
+
+def _weight(response):
+    """Metrics of a weight range response, or the first of a day view (as garth does)."""
+    if not isinstance(response, dict):
+        return []
+    if 'dateWeightList' in response:
+        return _many(response['dateWeightList'])[:1]
+    summaries = _many(response.get('dailyWeightSummaries'))
+    return list(chain.from_iterable(_many(s.get('allWeightMetrics')) for s in summaries if isinstance(s, dict)))
+
+
+RAW_SOURCES = {
+    'DailyHeartRate': RawSource('/wellness-service/wellness/dailyHeartRate/?date={day}', None, None, _one),
+    'DailySleepData': RawSource('/sleep-service/sleep/dailySleepData?date={day}', None, None, _sleep),
+    'TrainingReadinessData': RawSource('/metrics-service/metrics/trainingreadiness/{day}', None, None, _many),
+    'DailySummary': RawSource('/usersummary-service/usersummary/daily/?calendarDate={day}', None, None, _one),
+    'BodyBatteryData': RawSource('/wellness-service/wellness/bodyBattery/events/{day}', None, None, _many),
+    'DailyHRV': RawSource(None, '/hrv-service/hrv/daily/{start}/{end}', 28, _hrv),
+    'DailyStress': RawSource(None, '/usersummary-service/stats/stress/daily/{start}/{end}', 28, _stats),
+    'DailySteps': RawSource(None, '/usersummary-service/stats/steps/daily/{start}/{end}', 28, _stats),
+    'WeightData': RawSource('/weight-service/weight/dayview/{day}',
+                            '/weight-service/weight/range/{start}/{end}?includeAll=true', None, _weight),
+}
+
+# Fields an entry must carry to be usable; entries missing one are skipped
+REQUIRED_FIELDS = {
+    'DailyHRV': ('calendar_date',),
+    'DailyStress': ('calendar_date',),
+    'DailySteps': ('calendar_date',),
+    'WeightData': ('calendar_date',),
+}
+
+# garth sorts these within a response; raw entries are put in the same order
+SORT_FIELDS = {'WeightData': 'timestamp_gmt', 'TrainingReadinessData': 'timestamp'}
+
+
+def _valid(class_name, entry):
+    """True if a snake_case entry is well-formed enough for its slimmer."""
+    if any(entry.get(field) is None for field in REQUIRED_FIELDS.get(class_name, ())):
+        return False
+    if class_name == 'BodyBatteryData':
+        # garth drops events whose start time is missing or unparsable too
+        event = entry.get('event')
+        if event is not None:
+            start = event.get('event_start_time_gmt') if isinstance(event, dict) else None
+            try:
+                datetime.fromisoformat(start.replace('Z', '+00:00'))
+            except (AttributeError, ValueError):
+                return False
+    return True
+
+
+@lru_cache(maxsize=4096)
+def _snake(key):
+    from garth.utils import camel_to_snake
+    return camel_to_snake(key)
+
+
+def snake_keys(entry):
+    """garth's ``camel_to_snake_dict``, converting each distinct key only once.
+
+    Sleep payloads repeat the same few keys across thousands of small dicts.
+    Like garth, lists are only walked for dicts (sample arrays are kept as is).
+    """
+    snake = {}
+    for k, v in entry.items():
+        if isinstance(v, dict):
+            v = snake_keys(v)
+        elif isinstance(v, list):
+            v = [snake_keys(i) if isinstance(i, dict) else i for i in v]
+        snake[_snake(k)] = v
+    return snake
+
+
+def _parse(class_name, entries):
+    parsed = []
+    for entry in entries:
+        if not isinstance(entry, dict):
+            continue
+        entry = snake_keys(entry)
+        if _valid(class_name, entry):
+            parsed.append(entry)
+    sort_field = SORT_FIELDS.get(class_name)
+    if sort_field:
+        parsed.sort(key=lambda e: (e.get(sort_field) is not None, e.get(sort_field) or 0))
+    return parsed
+
+
+def fetch_day(class_name, day):
+    """Raw entries of ``class_name`` for one ISO day (``[]`` when it has none)."""
+    import garth
+
+    source = RAW_SOURCES[class_name]
+    if source.day_path is None:
+        return fetch_range(class_name, day, 1)
+    return _parse(class_name, source.entries(garth.connectapi(source.day_path.format(day=day))))
+
+
+def fetch_range(class_name, end, days):
+    """Raw entries of a range-keyed class for ``days`` days up to ``end``, paged like garth."""
+    import garth
+
+    source = RAW_SOURCES[class_name]
+    end = date.fromisoformat(str(end))
+    page = source.page_days or days
+    entries = []
+    while days > 0:
+        span = min(page, days)
+        start = end - timedelta(days=span - 1)
+        response = garth.connectapi(source.range_path.format(start=start, end=end))
+        entries = _parse(class_name, source.entries(response)) + entries
+        end = start - timedelta(days=1)
+        days -= span
+    return entries
@@ -0,0 +1,184 @@
+"""Persistent on-disk cache of raw Garmin responses, keyed by type and calendar day.
+
+Entries live in a small SQLite database under ``results/`` so several
+``collect_*`` processes can share it safely. A cached day is:
+
+- immutable once it was fetched at least ``settle_hours`` after the day ended
+  (late syncs have landed by then, the data will not change again);
+- otherwise fresh only for ``today_ttl_s`` seconds (today, and days fetched
+  before they settled, keep changing), and only until the watch syncs again
+  (``synced_at``).
+
+The same database remembers which fetch strategy last worked for each data
+type (``recall_strategy`` / ``remember_strategy``), and which sync each
+report file was collected after (``recall_report`` / ``remember_report``).
+"""
+import json
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(data_class):
+    from pydantic import TypeAdapter
+    return TypeAdapter(data_class)
+
+
+def dump_items(data_class, items):
+    """Serialize garth models (or plain dicts) to a JSON string."""
+    if data_class is None or all(isinstance(item, dict) for item in items):
+        return json.dumps(items, default=str)
+    return "[" + ",".join(dump_item(data_class, item) for item in items) + "]"
+
+
+def dump_item(data_class, item):
+    """Serialize one garth model (or plain dict); a list of these joined in ``[...]`` loads with ``load_items``."""
+    if data_class is None or isinstance(item, dict):
+        return json.dumps(item, default=str)
+    return _type_adapter(data_class).dump_json(item, by_alias=True).decode()
+
+
+def load_items(data_class, payload):
+    """Rebuild garth models from a JSON string written by ``dump_items``."""
+    raw = json.loads(payload)
+    if data_class is None:
+        return raw
+    adapter = _type_adapter(data_class)
+    return [adapter.validate_python(entry) if isinstance(entry, dict) else entry for entry in raw]
+
+
+class ResponseCache:
+    """Day-keyed cache of raw responses for one garth class at a time."""
+
+    def __init__(self, db_path, today_ttl_s=900, settle_hours=12):
+        self.db_path = str(db_path)
+        self.today_ttl_s = today_ttl_s
+        self.settle_hours = settle_hours
+        self.synced_at = None  # epoch seconds of the watch's last upload, when known
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS day_cache ("
+                " class_name TEXT NOT NULL,"
+                " day TEXT NOT NULL,"
+                " payload TEXT NOT NULL,"
+                " fetched_at REAL NOT NULL,"
+                " synced_at REAL,"
+                " PRIMARY KEY (class_name, day))"
+            )
+            if 'synced_at' not in {row[1] for row in conn.execute("PRAGMA table_info(day_cache)")}:
+                conn.execute("ALTER TABLE day_cache ADD COLUMN synced_at REAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetch_strategy ("
+                " data_type TEXT PRIMARY KEY,"
+                " strategy TEXT NOT NULL,"
+                " recorded_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS report_sync ("
+                " output TEXT PRIMARY KEY,"
+                " fingerprint TEXT NOT NULL,"
+                " synced_at REAL NOT NULL,"
+                " day TEXT NOT NULL,"
+                " mtime_ns INTEGER NOT NULL,"
+                " recorded_at REAL NOT NULL)"
+            )
+            # Running intraday stats kept by an earlier version; nothing reads them any more
+            conn.execute("DROP TABLE IF EXISTS intraday_series")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def is_fresh(self, day, fetched_at, now=None, synced_at=None, empty=False):
+        """Return True if an entry for ``day`` fetched at ``fetched_at`` can be reused.
+
+        ``synced_at`` is the watch's last upload known when the entry was
+        fetched. The entry is settled (reused for good) when it was fetched
+        ``settle_hours`` after the day ended and that upload came after the
+        day ended; a watch that has not synced since may still hold the day.
+        Without a known upload only non-empty entries settle, on age alone.
+        """
+        now = time.time() if now is None else now
+        day_end = datetime.combine(date.fromisoformat(day) + timedelta(days=1), datetime.min.time()).timestamp()
+        if fetched_at >= day_end + self.settle_hours * 3600:
+            if synced_at is not None:
+                if synced_at >= day_end:
+                    return True
+            elif not empty:
+                return True
+        if self.synced_at is not None and fetched_at < self.synced_at:
+            return False
+        return now - fetched_at < self.today_ttl_s
+
+    def lookup(self, class_name, days):
+        """Return ``({day: payload}, [missing days])`` for the requested days."""
+        if not days:
+            return {}, []
+        placeholders = ",".join("?" * len(days))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT day, payload, fetched_at, synced_at FROM day_cache"
+                f" WHERE class_name = ? AND day IN ({placeholders})",
+                [class_name, *days],
+            ).fetchall()
+        now = time.time()
+        found = {day: payload for day, payload, fetched_at, synced_at in rows
+                 if self.is_fresh(day, fetched_at, now, synced_at, payload == "[]")}
+        missing = [day for day in days if day not in found]
+        return found, missing
+
+    def store(self, class_name, payloads):
+        """Store ``{day: payload}`` entries fetched just now, with the last upload known (``synced_at``)."""
+        if not payloads:
+            return
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO day_cache (class_name, day, payload, fetched_at, synced_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(class_name, day, payload, now, self.synced_at) for day, payload in payloads.items()],
+            )
+
+    def recall_strategy(self, data_type, ttl_s):
+        """Strategy recorded for ``data_type`` less than ``ttl_s`` seconds ago, else None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT strategy, recorded_at FROM fetch_strategy WHERE data_type = ?", (data_type,)
+            ).fetchone()
+        if row is None or time.time() - row[1] >= ttl_s:
+            return None
+        return row[0]
+
+    def remember_strategy(self, data_type, strategy):
+        """Record the strategy that just worked for ``data_type``."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO fetch_strategy (data_type, strategy, recorded_at) VALUES (?, ?, ?)",
+                (data_type, strategy, time.time()),
+            )
+
+    def recall_report(self, output):
+        """``(fingerprint, synced_at, day, mtime_ns, recorded_at)`` stored for a report file, or None."""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT fingerprint, synced_at, day, mtime_ns, recorded_at FROM report_sync WHERE output = ?",
+                (output,),
+            ).fetchone()
+
+    def remember_report(self, output, fingerprint, synced_at, day, mtime_ns):
+        """Record that the report file ``output`` was just written with data up to the sync at ``synced_at``."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO report_sync (output, fingerprint, synced_at, day, mtime_ns, recorded_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (output, fingerprint, synced_at, day, mtime_ns, time.time()),
+            )
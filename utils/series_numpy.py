@@ -0,0 +1,66 @@
+"""NumPy backend for SeriesStats (optional dependency).
+
+Same interface and results as ``format_utils.SeriesStats`` for integer
+series such as heart rate: the values are loaded into one float array (None
+becomes NaN), reductions and the sort are vectorized, zones and threshold
+counts use ``searchsorted``. Everything returned is a plain Python int/float
+so slimmer output stays JSON-identical to the pure-Python backend.
+"""
+import numpy as np
+
+from format_utils import SeriesStats
+
+
+class ArraySeriesStats(SeriesStats):
+    """SeriesStats computed with NumPy. Exact for integer-valued series."""
+
+    __slots__ = ()
+
+    def __init__(self, values):
+        column = np.array(values, dtype=float)
+        present = ~np.isnan(column)
+        valid = column[present]
+        self.samples = len(column)
+        self.count = len(valid)
+        self.missing = self.samples - self.count
+        self._valid = valid
+        self._sorted = None
+        if self.count:
+            # Sums of integers stay exact in float64 far beyond any series length we see
+            self.mean = float(valid.sum()) / self.count
+            self.min = int(valid.min())
+            self.max = int(valid.max())
+            self.first = int(valid[0])
+            self.last = int(valid[-1])
+            # Missing entries are NaN and never compare equal, so this is the raw position
+            self.peak_index = int(np.argmax(column == self.max))
+            self.trough_index = int(np.argmax(column == self.min))
+        else:
+            self.mean = self.min = self.max = self.first = self.last = None
+            self.peak_index = self.trough_index = None
+
+    @property
+    def sorted(self):
+        if self._sorted is None:
+            self._sorted = np.sort(self._valid)
+        return self._sorted
+
+    def quantile(self, p):
+        if not self.count:
+            return None
+        sorted_data = self.sorted
+        k = (self.count - 1) * p
+        f = int(k)
+        c = f + 1
+        if c >= self.count:
+            return int(sorted_data[-1])
+        low, high = int(sorted_data[f]), int(sorted_data[c])
+        return low + (k - f) * (high - low)
+
+    def count_below(self, threshold):
+        return int(np.searchsorted(self.sorted, threshold, side='left'))
+
+    def histogram(self, thresholds):
+        edges = np.searchsorted(self.sorted, thresholds, side='left')
+        edges = [0] + [int(e) for e in edges] + [self.count]
+        return [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
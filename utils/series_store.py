@@ -0,0 +1,308 @@
+"""Columnar store of intraday series: one NumPy array per metric and day.
+
+Heart rate, the stress and Body Battery arrays of Body Battery events, and
+sleep movement and levels are written here by the collector for every day it
+fetches (and every cached day not stored yet). Readers open the files
+memory-mapped, so statistics over months of samples (90 days of heart rate
+zones) run on the arrays in place instead of loading every sample into Python
+objects. Needs NumPy.
+
+Sampled series can also be pre-aggregated at ingest into buckets of the
+levels ``bucket_minutes`` lists for their metric (e.g. 60 minutes of heart
+rate), counted from the series' origin: local midnight for heart rate, the
+event start for stress and Body Battery, the sleep start for sleep movement.
+A report reads a level by opening one file instead of rescanning the samples.
+
+Layout: ``<root>/<metric>/<YYYY-MM-DD>.npy``, a float64 array with one row per
+sample and the metric's ``COLUMNS``, and ``<root>/<metric>/<N>m/<YYYY-MM-DD>.npy``
+with one row per bucket and ``BUCKET_COLUMNS``. Missing values are NaN;
+timestamps are ms epochs (exact in float64).
+"""
+import os
+import threading
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import date, timedelta
+from itertools import accumulate
+from pathlib import Path
+
+import numpy as np
+
+from format_utils import SeriesStats, epoch_ms, to_dict
+
+# Columns of each metric's rows: the origin buckets count from (several Body
+# Battery events fall on one day), the sample time, ..., the value
+COLUMNS = {
+    'heart_rate': ('day_start', 'ts', 'bpm'),
+    'stress': ('event_start', 'ts', 'stress'),
+    'body_battery': ('event_start', 'ts', 'level'),
+    'sleep_movement': ('sleep_start', 'start', 'activity_level'),
+    'sleep_levels': ('sleep_start', 'start', 'end', 'activity_level'),
+}
+
+# Metrics that can be pre-aggregated into buckets (sleep levels are stage intervals, not samples),
+# and the columns of a bucket: its origin, its start in minutes from the origin,
+# and the count, min, max, mean and last of the values that fell into it
+BUCKETED = {'heart_rate', 'stress', 'body_battery', 'sleep_movement'}
+BUCKET_COLUMNS = ('origin', 'offset_min', 'count', 'min', 'max', 'mean', 'last')
+
+
+class CountedStats(SeriesStats):
+    """SeriesStats kept as counts per value, for series too long to hold as samples.
+
+    Quantiles, threshold counts and zone histograms come from the counts, so
+    they stay exact (and match SeriesStats) without the samples.
+    """
+
+    __slots__ = ('counts', 'total')
+
+    def __init__(self):
+        self.samples = self.missing = self.count = self.total = 0
+        self.mean = self.min = self.max = self.first = self.last = None
+        self.peak_index = self.trough_index = None
+        self.counts = Counter()
+        self._valid = None
+        self._sorted = None
+
+    @property
+    def sorted(self):
+        """``(distinct values ascending, count of values below each and of all)``."""
+        if self._sorted is None:
+            keys = sorted(self.counts)
+            self._sorted = keys, [0, *accumulate(self.counts[k] for k in keys)]
+        return self._sorted
+
+    def _nth(self, n):
+        """The ``n``-th smallest value (0-based)."""
+        keys, below = self.sorted
+        return keys[bisect_right(below, n) - 1]
+
+    def quantile(self, p):
+        if not self.count:
+            return None
+        k = (self.count - 1) * p
+        f = int(k)
+        if f + 1 >= self.count:
+            return self._nth(self.count - 1)
+        low = self._nth(f)
+        return low + (k - f) * (self._nth(f + 1) - low)
+
+    def count_below(self, threshold):
+        keys, below = self.sorted
+        return below[bisect_left(keys, threshold)]
+
+    def histogram(self, thresholds):
+        keys, below = self.sorted
+        edges = [0] + [below[bisect_left(keys, t)] for t in thresholds] + [self.count]
+        return [edges[i + 1] - edges[i] for i in range(len(edges) - 1)]
+
+
+def _point_rows(points, value_index, *prefix):
+    """``(*prefix, ts, value)`` rows of ``[[ts, ..., value, ...], ...]``; short points have no value."""
+    try:
+        return [(*prefix, point[0], point[value_index]) for point in points]
+    except IndexError:
+        return [(*prefix, point[0], point[value_index] if len(point) > value_index else None)
+                for point in points if point]
+
+
+def heart_rate_rows(items):
+    rows = []
+    for item in items:
+        data = to_dict(item)
+        rows.extend(_point_rows(data.get('heart_rate_values') or [], 1, epoch_ms(data.get('start_timestamp_gmt'))))
+    return {'heart_rate': rows}
+
+
+def body_battery_rows(items):
+    stress, battery = [], []
+    for item in items:
+        data = to_dict(item)
+        event_start = epoch_ms(to_dict(data.get('event')).get('event_start_time_gmt'))
+        stress.extend(_point_rows(data.get('stress_values_array') or [], 1, event_start))
+        battery.extend(_point_rows(data.get('body_battery_values_array') or [], 2, event_start))
+    return {'stress': stress, 'body_battery': battery}
+
+
+def sleep_rows(items):
+    movement, levels = [], []
+    for item in items:
+        data = to_dict(item)
+        sleep_start = to_dict(data.get('daily_sleep_dto')).get('sleep_start_timestamp_gmt')
+        for entry in data.get('sleep_movement') or []:
+            entry = to_dict(entry)
+            movement.append((sleep_start, epoch_ms(entry.get('start_gmt')), entry.get('activity_level')))
+        for entry in data.get('sleep_levels') or []:
+            entry = to_dict(entry)
+            levels.append((sleep_start, epoch_ms(entry.get('start_gmt')), epoch_ms(entry.get('end_gmt')),
+                           entry.get('activity_level')))
+    return {'sleep_movement': movement, 'sleep_levels': levels}
+
+
+# garth class → function turning one day of its raw items into {metric: rows}
+SOURCES = {
+    'DailyHeartRate': heart_rate_rows,
+    'BodyBatteryData': body_battery_rows,
+    'DailySleepData': sleep_rows,
+}
+
+
+def _group(origin, offset, count, low, high, total, last, minutes):
+    """Merge rows sorted by ``(origin, offset)`` into ``minutes``-wide buckets (``BUCKET_COLUMNS`` array)."""
+    offset = np.floor_divide(offset, minutes) * minutes
+    if not len(offset):
+        return np.empty((0, len(BUCKET_COLUMNS)))
+    starts = np.flatnonzero(np.r_[True, (origin[1:] != origin[:-1]) | (offset[1:] != offset[:-1])])
+    ends = np.r_[starts[1:], len(offset)] - 1
+    counts = np.add.reduceat(count, starts)
+    return np.column_stack([
+        origin[starts], offset[starts], counts,
+        np.minimum.reduceat(low, starts), np.maximum.reduceat(high, starts),
+        np.add.reduceat(total, starts) / counts, last[ends],
+    ])
+
+
+def bucket_levels(array, levels):
+    """``{minutes: buckets}`` of a ``COLUMNS`` array for every level in ``levels`` (ascending).
+
+    Samples without a value, time or origin are left out. The finest level is
+    built from the samples, every other level from the coarsest one already
+    built that divides it, so the whole pyramid costs about one pass.
+    """
+    origin, ts, values = array[:, 0], array[:, 1], array[:, -1]
+    present = ~(np.isnan(origin) | np.isnan(ts) | np.isnan(values))
+    origin, ts, values = origin[present], ts[present], values[present]
+    offset = np.floor((ts - origin) / 60000)
+    order = np.lexsort((ts, offset, origin))
+    origin, offset, values = origin[order], offset[order], values[order]
+    built = {}
+    for minutes in levels:
+        source = max((m for m in built if minutes % m == 0), default=None)
+        if source is None:
+            built[minutes] = _group(origin, offset, np.ones_like(values), values, values, values, values, minutes)
+        else:
+            b = built[source]
+            built[minutes] = _group(b[:, 0], b[:, 1], b[:, 2], b[:, 3], b[:, 4], b[:, 5] * b[:, 2], b[:, 6], minutes)
+    return built
+
+
+class SeriesStore:
+    """Typed arrays of intraday series, partitioned by metric and day under ``root``.
+
+    ``bucket_minutes`` maps metrics of ``BUCKETED`` to the levels they are
+    pre-aggregated into, e.g. ``{'heart_rate': (60,)}``; other metrics get none.
+    """
+
+    def __init__(self, root, bucket_minutes=None):
+        self.root = Path(root)
+        self.bucket_minutes = {metric: tuple(sorted(levels)) for metric, levels in (bucket_minutes or {}).items()}
+        unknown = set(self.bucket_minutes) - BUCKETED
+        if unknown:
+            raise ValueError(f"no buckets for {', '.join(sorted(unknown))} (bucketed: {', '.join(sorted(BUCKETED))})")
+
+    def path(self, metric, day, minutes=None):
+        """File of ``day`` of ``metric``: its samples, or its buckets at the ``minutes`` level."""
+        if minutes is None:
+            return self.root / metric / f"{day}.npy"
+        return self.root / metric / f"{minutes}m" / f"{day}.npy"
+
+    def _files(self, metric, day):
+        """Files of ``day`` of ``metric`` in the order ``write`` replaces them."""
+        levels = self.bucket_minutes.get(metric, ())
+        return [self.path(metric, day)] + [self.path(metric, day, minutes) for minutes in levels]
+
+    def _save(self, path, array):
+        """Replace ``path`` atomically, so readers never see half of it."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_name(f".{path.stem}.{os.getpid()}.{threading.get_ident()}.npy")
+        np.save(partial, array)
+        os.replace(partial, path)
+
+    def write(self, metric, day, rows):
+        """Store ``rows`` (tuples in ``COLUMNS[metric]`` order, None for missing) as ``day`` of ``metric``.
+
+        Metrics with levels in ``bucket_minutes`` also get their buckets.
+        """
+        array = np.array(rows, dtype=float).reshape(-1, len(COLUMNS[metric]))
+        self._save(self.path(metric, day), array)
+        levels = self.bucket_minutes.get(metric)
+        if levels:
+            for minutes, buckets in bucket_levels(array, levels).items():
+                self._save(self.path(metric, day, minutes), buckets)
+
+    def ingest(self, class_name, by_day, refresh=()):
+        """Store the series of ``by_day`` (``{day: raw items of class_name}``). Returns the days written.
+
+        Days in ``refresh`` (just fetched) are always written, the others only
+        when not stored yet. Classes without series are ignored.
+        """
+        rows_of = SOURCES.get(class_name)
+        if rows_of is None:
+            return []
+        last_metric = list(rows_of([]))[-1]  # a day is stored once its last file is written
+        written = []
+        for day, items in by_day.items():
+            if day not in refresh and self._files(last_metric, day)[-1].exists():
+                continue
+            for metric, rows in rows_of(items).items():
+                self.write(metric, day, rows)
+            written.append(day)
+        return written
+
+    def read(self, metric, day):
+        """``day`` of ``metric`` as a read-only memory-mapped array, or None when it is not stored.
+
+        Arrays of another layout count as not stored.
+        """
+        try:
+            array = np.load(self.path(metric, day), mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        return array if array.ndim == 2 and array.shape[1] == len(COLUMNS[metric]) else None
+
+    def buckets(self, metric, day, minutes):
+        """Buckets (``BUCKET_COLUMNS``) of ``day`` of ``metric`` at the ``minutes`` level, memory-mapped.
+
+        One file is opened whatever the level; None when the day is not stored.
+        """
+        levels = self.bucket_minutes.get(metric, ())
+        if minutes not in levels:
+            raise ValueError(f"{metric} has no {minutes}-minute buckets (levels: {levels})")
+        try:
+            return np.load(self.path(metric, day, minutes), mmap_mode='r')
+        except FileNotFoundError:
+            return None
+
+    def window(self, metric, last_day, days):
+        """``(day, array)`` for the stored days among the ``days`` days up to ``last_day``, oldest first."""
+        end = date.fromisoformat(str(last_day))
+        for offset in range(days - 1, -1, -1):
+            day = (end - timedelta(days=offset)).isoformat()
+            array = self.read(metric, day)
+            if array is not None:
+                yield day, array
+
+    def summary(self, metric, column, last_day, days):
+        """``(days stored, CountedStats)`` of one column over the ``days`` days up to ``last_day``.
+
+        Each day is reduced to counts per value in place; only the distinct
+        values reach Python. Samples, missing, count, mean, min and max,
+        quantiles, threshold counts and histograms are exact; positions and
+        first/last values are not kept.
+        """
+        index = COLUMNS[metric].index(column)
+        state, stored = CountedStats(), 0
+        for _, array in self.window(metric, last_day, days):
+            stored += 1
+            values = array[:, index]
+            valid = values[~np.isnan(values)]
+            keys, counts = np.unique(valid, return_counts=True)
+            state.counts.update(dict(zip(keys.tolist(), counts.tolist())))
+            state.samples += len(values)
+            state.count += len(valid)
+            state.total += float(valid.sum())
+        if state.count:
+            state.min, state.max = min(state.counts), max(state.counts)
+            state.mean = state.total / state.count
+        state.missing = state.samples - state.count
+        return stored, state
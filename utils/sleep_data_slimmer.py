@@ -1,6 +1,5 @@
-import statistics
 from typing import Any, Dict, List, Optional
-from format_utils import to_dict, ms_to_local_iso, percentile
+from format_utils import to_dict, ms_to_local_iso, SeriesStats
 
 
 
@@ -10,8 +9,9 @@ def aggregate_sleep_movement(movements: List[Dict], sleep_start_gmt_ms: Optional
         return None
     
     levels = [m['activity_level'] for m in movements]
-    p90 = percentile(levels, 0.90)
-    p95 = percentile(levels, 0.95)
+    stats = SeriesStats(levels)
+    p90 = stats.quantile(0.90)
+    p95 = stats.quantile(0.95)
     
     # Find longest consecutive high block
     high_blocks = []
@@ -27,8 +27,8 @@ def aggregate_sleep_movement(movements: List[Dict], sleep_start_gmt_ms: Optional
         high_blocks.append(current_block)
     
     # Find peak and calculate offset from sleep start
-    max_level = max(levels)
-    max_idx = levels.index(max_level)
+    max_level = stats.max
+    max_idx = stats.peak_index
     peak_start_gmt = movements[max_idx].get('start_gmt')
     
     # Calculate offset in minutes from sleep start
@@ -57,10 +57,10 @@ def aggregate_sleep_movement(movements: List[Dict], sleep_start_gmt_ms: Optional
             pass
     
     return {
-        'avg': round(statistics.mean(levels), 2),
+        'avg': round(stats.mean, 2),
         'p95': round(p95, 2),
         'max': round(max_level, 2),
-        'high_minutes': sum(1 for l in levels if l >= p90),
+        'high_minutes': stats.count - stats.count_below(p90),
         'longest_high_block_minutes': max(high_blocks) if high_blocks else 0,
         **({'peak_start_offset_min': peak_start_offset_min} if peak_start_offset_min is not None else {}),
     }
@@ -112,12 +112,13 @@ def aggregate_sleep_levels(levels: List[Dict], sleep_start_gmt: Optional[int]) -
     return {'timeline_10m': compressed}
 
 
-def slim_daily_sleep_data(item: Any) -> Dict:
+def slim_daily_sleep_data(item: Any, include_timeline: bool = True) -> Dict:
     """
     Convert DailySleepData to compact dict with aggregated summaries.
     
     Args:
         item: DailySleepData instance or dict with same structure
+        include_timeline: If False, levels_timeline is not built
         
     Returns:
         Compact dict with core fields and aggregated summaries
@@ -230,7 +231,7 @@ def slim_daily_sleep_data(item: Any) -> Dict:
         result['movement_summary'] = aggregate_sleep_movement(movements, sleep_start_gmt_ms)
     
     # Levels timeline
-    if levels:
+    if levels and include_timeline:
         levels_data = aggregate_sleep_levels(levels, sleep_start_gmt_ms)
         if levels_data:
             result['levels_timeline'] = levels_data
@@ -244,15 +245,11 @@ def slim_daily_sleep_data_list(items: List[Any], include_timeline: bool = True)
     
     Args:
         items: List of DailySleepData instances or dicts
-        include_timeline: If False, strips levels_timeline to save tokens (for multi-day reports)
+        include_timeline: If False, skips levels_timeline to save tokens (for multi-day reports)
 
     Returns:
         List of compact dicts with core fields and aggregated summaries
     """
-    results = [slim_daily_sleep_data(item) for item in items]
-    if not include_timeline:
-        for r in results:
-            r.pop('levels_timeline', None)
-    return results
+    return [slim_daily_sleep_data(item, include_timeline) for item in items]
 
 
@@ -0,0 +1,696 @@
+"""Synthetic Garmin Connect account for the local stand-in server.
+
+Generates raw (camelCase) API payloads for every endpoint the collectors hit,
+shaped so garth's models validate them. Values are deterministic per
+(seed, endpoint, day), so two runs against the same account see the same data.
+Today's intraday series stop at the watch's last sync (every
+``sync_interval_min`` minutes, or ``synced_at`` when set), like a real account.
+"""
+import math
+import random
+from datetime import date, datetime, time, timedelta, timezone
+
+USER_PROFILE_PK = 1000001
+DEVICE_ID = 3400000001
+ACTIVITY_ID_BASE = 15000000000
+
+ACTIVITY_KINDS = [
+    # (typeKey, typeId, parentTypeId, name, minutes, avg speed m/s, avg HR)
+    ("running", 1, 17, "Easy Run", 45, 2.9, 142),
+    ("running", 1, 17, "Tempo Run", 50, 3.4, 158),
+    ("cycling", 2, 17, "Road Ride", 90, 7.5, 132),
+    ("strength_training", 13, 29, "Strength", 40, 0.0, 110),
+    ("walking", 9, 17, "Walk", 35, 1.4, 98),
+]
+
+
+def _gmt_str(dt):
+    """Garmin's GMT string format: naive ISO with one fractional digit."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.0")
+
+
+def _ms(dt):
+    return int(dt.timestamp() * 1000)
+
+
+class SyntheticAccount:
+    """A multi-year synthetic account ending at ``today``."""
+
+    def __init__(self, seed=0, years=3, today=None, tz_offset_min=180, sync_interval_min=15):
+        self.seed = seed
+        self.today = date.fromisoformat(str(today)) if today else date.today()
+        self.first_day = self.today - timedelta(days=int(years * 365))
+        self.tz = timedelta(minutes=tz_offset_min)
+        self.sync_interval = timedelta(minutes=sync_interval_min)
+        self.synced_at = None  # aware UTC datetime of a sync to simulate; None follows the interval
+
+    # ── helpers ──────────────────────────────────────────────
+
+    def _rng(self, kind, day):
+        return random.Random(f"{self.seed}:{kind}:{day}")
+
+    def has_day(self, day):
+        day = date.fromisoformat(str(day))
+        return self.first_day <= day <= self.today
+
+    def _days(self, start, end):
+        start, end = date.fromisoformat(str(start)), date.fromisoformat(str(end))
+        return [start + timedelta(days=i) for i in range((end - start).days + 1)
+                if self.has_day(start + timedelta(days=i))]
+
+    def _day_start_gmt(self, day):
+        """Local midnight of ``day`` as an aware UTC datetime."""
+        return datetime.combine(day, time(), tzinfo=timezone.utc) - self.tz
+
+    def last_sync(self):
+        """When the watch last uploaded (aware UTC): ``synced_at``, else the last full sync interval."""
+        if self.synced_at is not None:
+            return self.synced_at
+        epoch = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        return epoch + (datetime.now(timezone.utc) - epoch) // self.sync_interval * self.sync_interval
+
+    def _now_cutoff(self, day):
+        """Intraday series end: end of day, or the last sync for today."""
+        end = self._day_start_gmt(day) + timedelta(days=1)
+        return min(end, self.last_sync())
+
+    def _fitness(self, day):
+        """Slow seasonal fitness trend in [0, 1]."""
+        n = (day - self.first_day).days
+        return 0.5 + 0.35 * math.sin(n / 58.0) + 0.1 * math.sin(n / 9.0)
+
+    def _sleep_window(self, day):
+        """(start, end) GMT datetimes of the night that ends on ``day``."""
+        rng = self._rng("sleep-window", day)
+        start = self._day_start_gmt(day) - timedelta(minutes=rng.randint(60, 150))
+        return start, start + timedelta(minutes=rng.randint(380, 520))
+
+    def _activity_slots(self, day):
+        """Activities started on ``day``: [(activity_id, kind, start GMT)]."""
+        rng = self._rng("activities", day)
+        if rng.random() < 0.3:
+            return []
+        slots = []
+        for n in range(1 if rng.random() < 0.85 else 2):
+            kind = ACTIVITY_KINDS[rng.randrange(len(ACTIVITY_KINDS))]
+            start = self._day_start_gmt(day) + timedelta(hours=7 + 10 * n, minutes=rng.randint(0, 59))
+            if start + timedelta(minutes=kind[4]) > self.last_sync():
+                continue
+            activity_id = ACTIVITY_ID_BASE + day.toordinal() * 10 + n
+            slots.append((activity_id, kind, start))
+        return slots
+
+    def _resting_hr(self, day):
+        return int(round(58 - 8 * self._fitness(day) + self._rng("rhr", day).uniform(-2, 2)))
+
+    def _hrv(self, day):
+        return int(round(42 + 25 * self._fitness(day) + self._rng("hrv", day).uniform(-6, 6)))
+
+    # ── profile ──────────────────────────────────────────────
+
+    def social_profile(self):
+        return {
+            "id": USER_PROFILE_PK, "profileId": USER_PROFILE_PK,
+            "userName": "standin", "displayName": "standin",
+            "fullName": "Stand-in Athlete", "location": "Localhost",
+        }
+
+    def last_used_device(self):
+        return {
+            "userDeviceId": DEVICE_ID, "userProfileNumber": USER_PROFILE_PK,
+            "applicationNumber": 3290, "lastUsedDeviceApplicationKey": "fr965",
+            "lastUsedDeviceName": "Forerunner 965", "lastUsedDeviceUploadTime": _ms(self.last_sync()),
+            "imageUrl": None, "released": True,
+        }
+
+    # ── per-day endpoints ────────────────────────────────────
+
+    def daily_heart_rate(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return None
+        rng = self._rng("hr", day)
+        start = self._day_start_gmt(day)
+        cutoff = self._now_cutoff(day)
+        sleep_start, sleep_end = self._sleep_window(day)
+        busy = [(s, s + timedelta(minutes=k[4]), k[6]) for _, k, s in self._activity_slots(day)]
+        rhr = self._resting_hr(day)
+        values = []
+        ts = start
+        while ts < cutoff:
+            if rng.random() < 0.02:
+                hr = None  # watch off-wrist
+            elif sleep_start <= ts < sleep_end:
+                hr = rhr + rng.randint(-3, 4)
+            else:
+                hr = rhr + 18 + rng.randint(-8, 14)
+                for a_start, a_end, a_hr in busy:
+                    if a_start <= ts < a_end:
+                        hr = a_hr + rng.randint(-10, 12)
+            values.append([_ms(ts), hr])
+            ts += timedelta(minutes=2)
+        valid = [v for _, v in values if v is not None]
+        return {
+            "userProfilePK": USER_PROFILE_PK,
+            "calendarDate": day.isoformat(),
+            "startTimestampGMT": _gmt_str(start),
+            "endTimestampGMT": _gmt_str(start + timedelta(days=1)),
+            "startTimestampLocal": _gmt_str(start + self.tz),
+            "endTimestampLocal": _gmt_str(start + self.tz + timedelta(days=1)),
+            "maxHeartRate": max(valid) if valid else rhr,
+            "minHeartRate": min(valid) if valid else rhr,
+            "restingHeartRate": rhr,
+            "lastSevenDaysAvgRestingHeartRate": int(round(
+                sum(self._resting_hr(day - timedelta(days=i)) for i in range(7)) / 7)),
+            "heartRateValueDescriptors": [
+                {"key": "timestamp", "index": 0}, {"key": "heartrate", "index": 1}],
+            "heartRateValues": values,
+        }
+
+    def daily_sleep(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return {"dailySleepDTO": {"id": None, "userProfilePK": USER_PROFILE_PK,
+                                      "calendarDate": day.isoformat()}}
+        rng = self._rng("sleep", day)
+        sleep_start, sleep_end = self._sleep_window(day)
+        total = int((sleep_end - sleep_start).total_seconds())
+        levels, movement = [], []
+        seconds = {0: 0, 1: 0, 2: 0, 3: 0}
+        ts = sleep_start
+        while ts < sleep_end:
+            length = timedelta(minutes=rng.randint(8, 40))
+            level = rng.choices([0, 1, 2, 3], weights=[2, 5, 2, 1])[0]
+            seg_end = min(ts + length, sleep_end)
+            levels.append({"startGMT": _gmt_str(ts), "endGMT": _gmt_str(seg_end),
+                           "activityLevel": float(level)})
+            seconds[level] += int((seg_end - ts).total_seconds())
+            ts = seg_end
+        ts = sleep_start - timedelta(minutes=30)
+        while ts < sleep_end + timedelta(minutes=30):
+            movement.append({"startGMT": _gmt_str(ts), "endGMT": _gmt_str(ts + timedelta(minutes=1)),
+                             "activityLevel": round(abs(rng.gauss(0.4, 0.6)), 6)})
+            ts += timedelta(minutes=1)
+        score = max(30, min(98, int(60 + 30 * self._fitness(day) + rng.uniform(-10, 10))))
+
+        def sub_score(key, value=None):
+            return {"qualifierKey": key, "value": value}
+
+        return {
+            "dailySleepDTO": {
+                "id": _ms(sleep_start),
+                "userProfilePK": USER_PROFILE_PK,
+                "calendarDate": day.isoformat(),
+                "sleepTimeSeconds": total - seconds[3],
+                "napTimeSeconds": 0,
+                "sleepWindowConfirmed": True,
+                "sleepWindowConfirmationType": "enhanced_confirmed_final",
+                "sleepStartTimestampGMT": _ms(sleep_start),
+                "sleepEndTimestampGMT": _ms(sleep_end),
+                "sleepStartTimestampLocal": _ms(sleep_start + self.tz),
+                "sleepEndTimestampLocal": _ms(sleep_end + self.tz),
+                "unmeasurableSleepSeconds": 0,
+                "deepSleepSeconds": seconds[0],
+                "lightSleepSeconds": seconds[1],
+                "remSleepSeconds": seconds[2],
+                "awakeSleepSeconds": seconds[3],
+                "deviceRemCapable": True,
+                "retro": False,
+                "sleepFromDevice": True,
+                "awakeCount": rng.randint(0, 4),
+                "averageSpO2Value": round(rng.uniform(93, 97), 1),
+                "lowestSpO2Value": rng.randint(85, 91),
+                "highestSpO2Value": 100,
+                "averageRespirationValue": round(rng.uniform(12, 16), 1),
+                "lowestRespirationValue": 9.0,
+                "highestRespirationValue": 20.0,
+                "avgSleepStress": round(rng.uniform(8, 25), 1),
+                "sleepScoreFeedback": "POSITIVE_LONG_AND_DEEP",
+                "sleepScoreInsight": "NONE",
+                "sleepScores": {
+                    "totalDuration": sub_score("GOOD"),
+                    "stress": sub_score("FAIR"),
+                    "awakeCount": sub_score("EXCELLENT"),
+                    "overall": sub_score("GOOD", score),
+                    "remPercentage": sub_score("GOOD", round(100 * seconds[2] / total)),
+                    "restlessness": sub_score("GOOD"),
+                    "lightPercentage": sub_score("GOOD", round(100 * seconds[1] / total)),
+                    "deepPercentage": sub_score("GOOD", round(100 * seconds[0] / total)),
+                },
+            },
+            "sleepMovement": movement,
+            "remSleepData": True,
+            "sleepLevels": levels,
+            "restingHeartRate": self._resting_hr(day),
+            "bodyBatteryChange": rng.randint(20, 65),
+            "skinTempDataExists": False,
+        }
+
+    def body_battery_events(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return []
+        rng = self._rng("bb", day)
+        sleep_start, sleep_end = self._sleep_window(day)
+        events = [("SLEEP", sleep_start, sleep_end, "", None)]
+        for activity_id, kind, start in self._activity_slots(day):
+            events.append(("ACTIVITY", start, start + timedelta(minutes=kind[4]), kind[3], activity_id))
+        cutoff = self.last_sync()
+        items = []
+        level = rng.randint(15, 40)
+        for event_type, start, end, activity_name, activity_id in events:
+            if start >= cutoff:
+                continue
+            end = min(end, cutoff)
+            stress, battery = [], []
+            ts = start
+            while ts < end:
+                if event_type == "SLEEP":
+                    value = max(0, int(rng.gauss(12, 6)))
+                    level = min(100, level + rng.choice([0, 1, 1, 2]))
+                else:
+                    value = -2  # Garmin reports activity periods as -2
+                    level = max(5, level - rng.choice([0, 1, 1, 2]))
+                stress.append([_ms(ts), value if rng.random() > 0.03 else -1])  # -1: no reading
+                battery.append([_ms(ts), "MEASURED", level, 2.0])
+                ts += timedelta(minutes=3)
+            impact = battery[-1][2] - battery[0][2] if battery else 0
+            items.append({
+                "event": {
+                    "eventType": event_type,
+                    "eventStartTimeGmt": _gmt_str(start),
+                    "timezoneOffset": int(self.tz.total_seconds() * 1000),
+                    "durationInMilliseconds": int((end - start).total_seconds() * 1000),
+                    "bodyBatteryImpact": impact,
+                    "feedbackType": "GOOD_SLEEP" if event_type == "SLEEP" else "EXERCISE_TRAINING",
+                    "shortFeedback": "RESTFUL_PERIOD" if event_type == "SLEEP" else "HIGHLY_IMPROVING_AEROBIC",
+                },
+                "activityName": activity_name or None,
+                "activityType": "running" if activity_id else None,
+                "activityId": activity_id,
+                "averageStress": round(sum(v for _, v in stress if v and v > 0) / max(1, len(stress)), 1),
+                "stressValuesArray": stress,
+                "bodyBatteryValuesArray": battery,
+            })
+        return items
+
+    def training_readiness(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return []
+        rng = self._rng("readiness", day)
+        _, wake = self._sleep_window(day)
+        if wake > self.last_sync():
+            return []
+        score = max(1, min(100, int(35 + 50 * self._fitness(day) + rng.uniform(-15, 15))))
+        level = "HIGH" if score >= 75 else "MODERATE" if score >= 50 else "LOW"
+        return [{
+            "userProfilePK": USER_PROFILE_PK,
+            "calendarDate": day.isoformat(),
+            "timestamp": _gmt_str(wake),
+            "timestampLocal": _gmt_str(wake + self.tz),
+            "deviceId": DEVICE_ID,
+            "level": level,
+            "feedbackLong": f"{level}_RT_READY",
+            "feedbackShort": "READY_TO_TRAIN",
+            "score": score,
+            "sleepScore": rng.randint(55, 95),
+            "sleepScoreFactorPercent": rng.randint(40, 100),
+            "sleepScoreFactorFeedback": "GOOD",
+            "recoveryTime": rng.randint(0, 2400),
+            "recoveryTimeFactorPercent": rng.randint(40, 100),
+            "recoveryTimeFactorFeedback": "GOOD",
+            "acwrFactorPercent": rng.randint(60, 100),
+            "acwrFactorFeedback": "GOOD",
+            "acuteLoad": rng.randint(250, 700),
+            "stressHistoryFactorPercent": rng.randint(50, 100),
+            "stressHistoryFactorFeedback": "GOOD",
+            "hrvFactorPercent": rng.randint(50, 100),
+            "hrvFactorFeedback": "GOOD",
+            "hrvWeeklyAverage": self._hrv(day),
+            "sleepHistoryFactorPercent": rng.randint(50, 100),
+            "sleepHistoryFactorFeedback": "GOOD",
+            "validSleep": True,
+            "inputContext": "AFTER_WAKEUP_RESET",
+            "primaryActivityTracker": True,
+            "recoveryTimeChangePhrase": None,
+        }]
+
+    def daily_summary(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return None
+        rng = self._rng("summary", day)
+        hr = self.daily_heart_rate(day)
+        valid = [v for _, v in hr["heartRateValues"] if v is not None]
+        steps = self._steps(day)
+        return {
+            "userProfileId": USER_PROFILE_PK,
+            "calendarDate": day.isoformat(),
+            "totalKilocalories": 1900 + rng.randint(0, 1400),
+            "activeKilocalories": rng.randint(200, 1200),
+            "totalSteps": steps,
+            "totalDistanceMeters": int(steps * 0.78),
+            "minHeartRate": min(valid) if valid else None,
+            "maxHeartRate": max(valid) if valid else None,
+            "restingHeartRate": hr["restingHeartRate"],
+            "lastSevenDaysAvgRestingHeartRate": hr["lastSevenDaysAvgRestingHeartRate"],
+            "maxStressLevel": rng.randint(60, 99),
+            "averageStressLevel": self._stress(day),
+            "stressQualifier": "BALANCED",
+            "bodyBatteryAtWakeTime": rng.randint(55, 100),
+            "bodyBatteryHighestValue": rng.randint(70, 100),
+            "bodyBatteryLowestValue": rng.randint(5, 35),
+            "moderateIntensityMinutes": rng.randint(0, 60),
+            "vigorousIntensityMinutes": rng.randint(0, 45),
+            "activeSeconds": rng.randint(3600, 14400),
+            "highlyActiveSeconds": rng.randint(600, 5400),
+            "sedentarySeconds": rng.randint(28800, 43200),
+            "sleepingSeconds": rng.randint(21600, 30600),
+            "floorsAscended": float(rng.randint(2, 25)),
+            "floorsDescended": float(rng.randint(2, 25)),
+            "averageSpo2": rng.randint(93, 98),
+            "lowestSpo2": rng.randint(84, 92),
+            "avgWakingRespirationValue": rng.randint(12, 17),
+            "highestRespirationValue": rng.randint(18, 24),
+            "lowestRespirationValue": rng.randint(8, 11),
+        }
+
+    def training_status(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return {"mostRecentTrainingStatus": None}
+        rng = self._rng("training-status", day)
+        fitness = self._fitness(day)
+        acute = int(300 + 400 * fitness + rng.uniform(-60, 60))
+        chronic = int(350 + 300 * fitness)
+        device_data = {
+            "calendarDate": day.isoformat(),
+            "sinceDate": (day - timedelta(days=rng.randint(1, 20))).isoformat(),
+            "weeklyTrainingLoad": None,
+            "trainingStatus": 4 if fitness > 0.6 else 3 if fitness > 0.35 else 6,
+            "timestamp": _gmt_str(self._day_start_gmt(day) + timedelta(hours=8)),
+            "deviceId": DEVICE_ID,
+            "loadTunnelMin": None,
+            "loadTunnelMax": None,
+            "loadLevelTrend": None,
+            "sport": "RUNNING",
+            "subSport": "GENERIC",
+            "fitnessTrendSport": "RUNNING",
+            "fitnessTrend": 2 if fitness > 0.5 else 1,
+            "trainingStatusFeedbackPhrase": "PRODUCTIVE_1" if fitness > 0.6 else "MAINTAINING_1",
+            "trainingPaused": False,
+            "primaryTrainingDevice": True,
+            "acuteTrainingLoadDTO": {
+                "acwrPercent": int(100 * acute / max(chronic, 1) / 2),
+                "acwrStatus": "OPTIMAL",
+                "acwrStatusFeedback": "FEEDBACK_2",
+                "dailyTrainingLoadAcute": acute,
+                "maxTrainingLoadChronic": round(chronic * 1.5, 1),
+                "minTrainingLoadChronic": round(chronic * 0.8, 1),
+                "dailyTrainingLoadChronic": chronic,
+                "dailyAcuteChronicWorkloadRatio": round(acute / max(chronic, 1), 1),
+            },
+        }
+        return {
+            "userId": USER_PROFILE_PK,
+            "mostRecentTrainingStatus": {
+                "userId": USER_PROFILE_PK,
+                "payload": {"latestTrainingStatusData": {str(DEVICE_ID): device_data}},
+            },
+        }
+
+    def hill_score(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return None
+        rng = self._rng("hill", day)
+        return {"userProfilePK": USER_PROFILE_PK, "calendarDate": day.isoformat(),
+                "overallScore": int(40 + 40 * self._fitness(day)),
+                "enduranceScore": rng.randint(30, 80), "strengthScore": rng.randint(30, 80)}
+
+    def daily_scores(self, start, end):
+        """Overall and per-area daily scores, oldest day first."""
+        result = []
+        for day in self._days(start, end):
+            rng = self._rng("scores", day)
+            overall = int(45 + 40 * self._fitness(day) + rng.uniform(-5, 5))
+            result.append({
+                "calendarDate": day.isoformat(),
+                "overall": {"value": overall, "qualifier": "GOOD" if overall >= 60 else "FAIR"},
+                "sleep": {"value": rng.randint(55, 92), "qualifier": "GOOD"},
+                "stress": {"value": self._stress(day), "qualifier": "LOW"},
+                "bodyBattery": {"value": rng.randint(40, 95), "qualifier": "GOOD"},
+            })
+        return result
+
+    def endurance_score(self, day):
+        day = date.fromisoformat(str(day))
+        if not self.has_day(day):
+            return None
+        fitness = self._fitness(day)
+        return {
+            "userProfilePK": USER_PROFILE_PK, "calendarDate": day.isoformat(),
+            "overallScore": int(5000 + 4000 * fitness), "classification": 3,
+            "classificationLowerLimitElite": 10500, "classificationLowerLimitSuperior": 9000,
+            "classificationLowerLimitExpert": 7500, "classificationLowerLimitWellTrained": 6000,
+            "classificationLowerLimitTrained": 4500, "classificationLowerLimitIntermediate": 3000,
+            "vo2Max": float(int(44 + 10 * fitness)), "vo2MaxPreciseValue": round(44 + 10 * fitness, 1),
+        }
+
+    # ── range endpoints ──────────────────────────────────────
+
+    def _steps(self, day):
+        rng = self._rng("steps", day)
+        steps = int(6000 + 7000 * self._fitness(day) + rng.uniform(-3000, 3000))
+        if day == self.today:
+            now = self.last_sync()
+            fraction = (now - self._day_start_gmt(day)).total_seconds() / 86400
+            steps = int(steps * max(0.0, min(1.0, fraction)))
+        return steps
+
+    def _stress(self, day):
+        return int(22 + 20 * (1 - self._fitness(day)) + self._rng("stress", day).uniform(-6, 6))
+
+    def hrv_range(self, start, end):
+        summaries = []
+        for day in self._days(start, end):
+            rng = self._rng("hrv-summary", day)
+            last_night = self._hrv(day)
+            weekly = int(round(sum(self._hrv(day - timedelta(days=i)) for i in range(7)) / 7))
+            _, wake = self._sleep_window(day)
+            summaries.append({
+                "calendarDate": day.isoformat(),
+                "weeklyAvg": weekly,
+                "lastNightAvg": last_night,
+                "lastNight5MinHigh": last_night + rng.randint(8, 25),
+                "baseline": {"lowUpper": weekly - 12, "balancedLow": weekly - 8,
+                             "balancedUpper": weekly + 9, "markerValue": 0.5},
+                "status": "BALANCED" if abs(last_night - weekly) < 8 else "UNBALANCED",
+                "feedbackPhrase": "HRV_BALANCED_2",
+                "createTimeStamp": _gmt_str(wake),
+            })
+        return {"hrvSummaries": summaries, "userProfilePk": USER_PROFILE_PK}
+
+    def stress_range(self, start, end):
+        result = []
+        for day in self._days(start, end):
+            rng = self._rng("stress-durations", day)
+            result.append({"calendarDate": day.isoformat(), "values": {
+                "overallStressLevel": self._stress(day),
+                "restStressDuration": rng.randint(18000, 36000),
+                "lowStressDuration": rng.randint(7200, 18000),
+                "mediumStressDuration": rng.randint(1800, 9000),
+                "highStressDuration": rng.randint(0, 3600),
+            }})
+        return result
+
+    def steps_range(self, start, end):
+        return [{"calendarDate": day.isoformat(), "totalSteps": self._steps(day),
+                 "totalDistance": int(self._steps(day) * 0.78), "stepGoal": 8000}
+                for day in self._days(start, end)]
+
+    def _weight(self, day):
+        rng = self._rng("weight", day)
+        if rng.random() < 0.6:
+            return None
+        grams = int(76000 - 4000 * self._fitness(day) + rng.uniform(-600, 600))
+        ts = self._day_start_gmt(day) + timedelta(hours=7, minutes=rng.randint(0, 50))
+        return {
+            "samplePk": _ms(ts), "date": _ms(ts + self.tz), "calendarDate": day.isoformat(),
+            "weight": grams, "bmi": round(grams / 1000 / 1.8 ** 2, 1),
+            "bodyFat": round(rng.uniform(14, 19), 1), "bodyWater": round(rng.uniform(55, 60), 1),
+            "boneMass": 3400, "muscleMass": int(grams * 0.44), "physiqueRating": None,
+            "visceralFat": None, "metabolicAge": None,
+            "sourceType": "INDEX_SCALE", "timestampGMT": _ms(ts), "weightDelta": None,
+        }
+
+    def weight_range(self, start, end):
+        summaries = []
+        for day in reversed(self._days(start, end)):
+            metric = self._weight(day)
+            if metric:
+                summaries.append({"summaryDate": day.isoformat(), "numOfWeightEntries": 1,
+                                  "latestWeight": metric, "allWeightMetrics": [metric]})
+        return {"dailyWeightSummaries": summaries, "totalAverage": {}}
+
+    def weight_dayview(self, day):
+        day = date.fromisoformat(str(day))
+        metric = self._weight(day) if self.has_day(day) else None
+        return {"startDate": day.isoformat(), "endDate": day.isoformat(),
+                "dateWeightList": [metric] if metric else []}
+
+    # ── activities ───────────────────────────────────────────
+
+    def _activity_summary(self, activity_id, kind, start):
+        rng = self._rng("activity", activity_id)
+        type_key, type_id, parent_id, name, minutes, speed, avg_hr = kind
+        duration = minutes * 60 + rng.randint(-300, 300)
+        distance = round(speed * duration * rng.uniform(0.95, 1.05), 1)
+        return {
+            "activityId": activity_id,
+            "activityName": name,
+            "activityType": {"typeId": type_id, "typeKey": type_key, "parentTypeId": parent_id,
+                             "isHidden": False, "restricted": False, "trimmable": True},
+            "startTimeLocal": (start + self.tz).strftime("%Y-%m-%d %H:%M:%S"),
+            "startTimeGMT": start.strftime("%Y-%m-%d %H:%M:%S"),
+            "distance": distance,
+            "duration": float(duration),
+            "elapsedDuration": float(duration + rng.randint(0, 240)),
+            "movingDuration": float(duration - rng.randint(0, 120)),
+            "elevationGain": round(rng.uniform(0, 250), 1) if speed else None,
+            "elevationLoss": round(rng.uniform(0, 250), 1) if speed else None,
+            "averageSpeed": round(distance / duration, 3) if speed else None,
+            "maxSpeed": round(distance / duration * 1.4, 3) if speed else None,
+            "calories": float(int(duration / 60 * rng.uniform(7, 12))),
+            "averageHR": float(avg_hr + rng.randint(-5, 5)),
+            "maxHR": float(avg_hr + rng.randint(15, 30)),
+            "ownerId": USER_PROFILE_PK,
+            "ownerDisplayName": "standin",
+            "ownerFullName": "Stand-in Athlete",
+            "steps": int(duration * 2.7) if type_key in ("running", "walking") else None,
+            "averageRunningCadenceInStepsPerMinute": 168.0 if type_key == "running" else None,
+            "maxRunningCadenceInStepsPerMinute": 184.0 if type_key == "running" else None,
+            "aerobicTrainingEffect": round(rng.uniform(2.0, 4.2), 1),
+            "anaerobicTrainingEffect": round(rng.uniform(0.0, 2.5), 1),
+            "activityTrainingLoad": round(rng.uniform(40, 220), 1),
+            "locationName": "Localhost",
+        }
+
+    def _all_activities(self):
+        """Every activity of the account, newest first (cached per instance)."""
+        if getattr(self, "_activity_index", None) is None:
+            index = []
+            day = self.today
+            while day >= self.first_day:
+                index.extend(reversed(self._activity_slots(day)))
+                day -= timedelta(days=1)
+            self._activity_index = index
+        return self._activity_index
+
+    def _find_activity(self, activity_id):
+        day = date.fromordinal((int(activity_id) - ACTIVITY_ID_BASE) // 10)
+        for slot in self._activity_slots(day) if self.has_day(day) else []:
+            if slot[0] == int(activity_id):
+                return slot
+        return None
+
+    def activities(self, start=0, limit=20):
+        page = self._all_activities()[int(start):int(start) + int(limit)]
+        return [self._activity_summary(*slot) for slot in page]
+
+    def activity_detail(self, activity_id):
+        slot = self._find_activity(activity_id)
+        if slot is None:
+            return None
+        item = self._activity_summary(*slot)
+        rng = self._rng("activity-detail", activity_id)
+        summary_keys = ("distance", "duration", "elapsedDuration", "movingDuration", "elevationGain",
+                        "elevationLoss", "averageSpeed", "maxSpeed", "calories", "averageHR", "maxHR",
+                        "steps", "activityTrainingLoad")
+        summary = {key: item[key] for key in summary_keys}
+        summary.update({
+            "startTimeLocal": item["startTimeLocal"].replace(" ", "T") + ".0",
+            "startTimeGMT": item["startTimeGMT"].replace(" ", "T") + ".0",
+            "averageMovingSpeed": item["averageSpeed"],
+            "minHR": float(item["averageHR"] - rng.randint(20, 40)),
+            "minElevation": round(rng.uniform(80, 150), 1),
+            "maxElevation": round(rng.uniform(150, 300), 1),
+            "averageRunCadence": item["averageRunningCadenceInStepsPerMinute"],
+            "maxRunCadence": item["maxRunningCadenceInStepsPerMinute"],
+            "trainingEffect": item["aerobicTrainingEffect"],
+            "anaerobicTrainingEffect": item["anaerobicTrainingEffect"],
+            "aerobicTrainingEffectMessage": "IMPROVING_AEROBIC_BASE_8",
+            "anaerobicTrainingEffectMessage": "NO_ANAEROBIC_BENEFIT_0",
+            "trainingEffectLabel": "AEROBIC_BASE",
+            "bmrCalories": float(rng.randint(60, 120)),
+            "moderateIntensityMinutes": float(rng.randint(5, 40)),
+            "vigorousIntensityMinutes": float(rng.randint(0, 30)),
+            "differenceBodyBattery": float(-rng.randint(5, 20)),
+            "waterEstimated": float(rng.randint(400, 1200)),
+            "minActivityLapDuration": float(rng.randint(60, 300)),
+            "averageRespirationRate": round(rng.uniform(25, 40), 1),
+            "maxRespirationRate": round(rng.uniform(40, 50), 1),
+            "minRespirationRate": round(rng.uniform(12, 20), 1),
+            "minTemperature": 21.0,
+            "maxTemperature": 29.0,
+        })
+        zone_floor = int(item["maxHR"] * 0.5)
+        zones = [{"zoneNumber": n + 1, "secsInZone": float(rng.randint(0, int(item["duration"] // 3))),
+                  "zoneLowBoundary": zone_floor + n * 15} for n in range(5)]
+        return {
+            "activityId": item["activityId"],
+            "activityName": item["activityName"],
+            "userProfileId": USER_PROFILE_PK,
+            "isMultiSportParent": False,
+            "activityTypeDTO": item["activityType"],
+            "eventTypeDTO": {"typeId": 9, "typeKey": "uncategorized", "sortOrder": 10},
+            "summaryDTO": summary,
+            "metadataDTO": {"deviceApplicationInstallationId": DEVICE_ID, "hasSplits": True,
+                            "lapCount": max(1, int(item["distance"] // 1000))},
+            "locationName": item["locationName"],
+            "heartRateZones": zones,
+        }
+
+    def activity_splits(self, activity_id):
+        slot = self._find_activity(activity_id)
+        if slot is None:
+            return None
+        item = self._activity_summary(*slot)
+        rng = self._rng("activity-splits", activity_id)
+        laps = []
+        remaining, start = item["distance"], slot[2]
+        while remaining > 0 or not laps:
+            distance = min(1000.0, remaining) if remaining > 0 else 0.0
+            speed = (item["averageSpeed"] or 1.0) * rng.uniform(0.92, 1.08)
+            duration = distance / speed if distance else item["duration"]
+            laps.append({
+                "startTimeGMT": _gmt_str(start), "distance": round(distance, 1),
+                "duration": round(duration, 1), "averageSpeed": round(speed, 3),
+                "averageHR": item["averageHR"] + rng.randint(-6, 6), "maxHR": item["maxHR"] - rng.randint(0, 8),
+                "averageRunCadence": item["averageRunningCadenceInStepsPerMinute"],
+                "elevationGain": round(rng.uniform(0, 20), 1), "lapIndex": len(laps) + 1,
+            })
+            remaining -= distance
+            start += timedelta(seconds=duration)
+            if distance == 0:
+                break
+        return {"activityId": int(activity_id), "lapDTOs": laps, "eventDTOs": []}
+
+    def fitness_activities(self, start_date, end_date):
+        items = []
+        for day in self._days(start_date, end_date):
+            for activity_id, kind, start in self._activity_slots(day):
+                rng = self._rng("coaching", activity_id)
+                coached = kind[0] == "running" and rng.random() < 0.5
+                items.append({
+                    "activityId": activity_id,
+                    "startLocal": (start + self.tz).strftime("%Y-%m-%dT%H:%M:%S.0"),
+                    "activityType": kind[0],
+                    "workoutGroupEnumerator": rng.randint(1, 6),
+                    "aerobicTrainingEffect": round(rng.uniform(2.0, 4.2), 1),
+                    "parentId": None,
+                    "workoutType": "BASE" if coached else None,
+                    "adaptiveCoachingWorkoutStatus": "COMPLETED_VIA_ACTIVITY" if coached else None,
+                })
+        return items
@@ -0,0 +1,371 @@
+"""Client-side throttling for Garmin requests.
+
+Every request of garth's client goes through ``throttle_requests``: per
+endpoint (the URL path without IDs and dates) a token bucket caps the
+request rate and an AIMD controller caps how many requests are in flight,
+halving on 429/5xx and growing by one per window of successes. Throttled
+and failed requests are retried with jittered exponential backoff; slow
+GETs can be hedged with a duplicate request, and a deadline stops
+requests from going out at all.
+
+``CircuitBreaker`` lets the collector give up on a data type after repeated
+transient failures instead of spending every remaining day on them.
+"""
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+# Responses that mean "slow down / try again later"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_ID_SEGMENT = re.compile(r"[^/]*\d[^/]*")
+
+
+def endpoint_of(url):
+    """Throttling key of a request URL: its path with dates and IDs left out."""
+    path = urlsplit(url).path
+    return "/".join(segment for segment in path.split("/") if not _ID_SEGMENT.fullmatch(segment)) or "/"
+
+
+def backoff_delay(attempt, base_s, max_s, retry_after=None):
+    """Seconds to wait before retry ``attempt`` (0-based): full-jitter exponential, at least ``Retry-After``."""
+    delay = random.uniform(0, min(max_s, base_s * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_s))
+    return delay
+
+
+def retry_after_s(response):
+    """``Retry-After`` of a response in seconds, or None (HTTP dates are ignored)."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+def status_of(error):
+    """HTTP status behind an exception (garth wraps requests' HTTPError), or None."""
+    error = getattr(error, "error", error)
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_transient(error):
+    """True for errors worth retrying later: throttling, server errors, connection failures."""
+    from requests.exceptions import ConnectionError, Timeout
+
+    if isinstance(getattr(error, "error", error), (ConnectionError, Timeout)):
+        return True
+    return status_of(error) in RETRY_STATUSES
+
+
+def describe_error(error):
+    """One-line description of a fetch error: HTTP status and endpoint when there is one."""
+    status = status_of(error)
+    if status is not None:
+        response = getattr(getattr(error, "error", error), "response", None)
+        return f"HTTP {status} from {endpoint_of(response.url)}"
+    first_line = str(error).split("\n")[0] or type(error).__name__
+    return first_line if len(first_line) <= 200 else first_line[:197] + "..."
+
+
+class TokenBucket:
+    """Allows ``rate`` acquisitions per second on average, bursts of up to ``burst``."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_s = (1 - self.tokens) / self.rate
+            time.sleep(wait_s)
+
+    def try_acquire(self):
+        """Take one token if one is available right now. Returns True if taken."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def available(self):
+        """True if a token could be taken right now (none is taken)."""
+        with self.lock:
+            return self.tokens + (time.monotonic() - self.updated) * self.rate >= 1
+
+
+class AIMDLimiter:
+    """Concurrency limit that adds one per ``limit`` successes and halves on throttling."""
+
+    def __init__(self, initial, minimum=1, maximum=64):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def try_acquire(self):
+        """Take a slot if one is free right now. Returns True if taken."""
+        with self.condition:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, throttled=False):
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit / 2)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+
+class LatencyTracker:
+    """Latencies of an endpoint's recent requests."""
+
+    def __init__(self, size=200):
+        self.samples = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+    def add(self, seconds):
+        with self.lock:
+            self.samples.append(seconds)
+
+    def percentile(self, p, min_samples):
+        """The ``p``-th percentile in seconds, or None with fewer than ``min_samples`` samples."""
+        with self.lock:
+            if len(self.samples) < min_samples:
+                return None
+            ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+def retryable(future):
+    """True if a finished send failed in a way ``Throttle`` retries (connection error, 429/5xx)."""
+    from requests.exceptions import ConnectionError, Timeout
+
+    error = future.exception()
+    if error is not None:
+        return isinstance(error, (ConnectionError, Timeout))
+    return future.result().status_code in RETRY_STATUSES
+
+
+class DeadlineExceeded(Exception):
+    """A request was not sent because the collection deadline has passed."""
+
+
+class Throttle:
+    """Rate limiter, AIMD controller and latency tracker per endpoint, plus the retry and hedging policy.
+
+    With ``hedge_percentile`` set, a GET still running after that percentile
+    of its endpoint's recent latencies gets a duplicate request, and whichever
+    answers first is used; at most ``hedge_budget`` of all requests are hedged.
+    A duplicate takes a token and a concurrency slot of its own, and whichever
+    request loses keeps its slot until it finishes.
+    Once ``deadline`` (a ``time.monotonic()`` value) passes, requests fail with
+    DeadlineExceeded instead of going out.
+    """
+
+    def __init__(self, rate, burst, concurrency, max_concurrency, attempts, backoff_s, max_backoff_s,
+                 hedge_percentile=None, hedge_budget=0.0, hedge_min_samples=20, hedge_workers=64):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.max_concurrency = max_concurrency
+        self.attempts = attempts
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.hedge_percentile = hedge_percentile
+        self.hedge_budget = hedge_budget
+        self.hedge_min_samples = hedge_min_samples
+        self.hedge_workers = hedge_workers
+        self.hedge_pool = None
+        self.deadline = None
+        self.lock = threading.Lock()
+        self.endpoints = {}
+        self.stats = {"requests": 0, "retries": 0, "throttled": 0, "hedged": 0, "hedge_wins": 0}
+
+    def limiters(self, endpoint):
+        """``(TokenBucket, AIMDLimiter, LatencyTracker)`` of an endpoint, created on first use."""
+        with self.lock:
+            if endpoint not in self.endpoints:
+                self.endpoints[endpoint] = (TokenBucket(self.rate, self.burst),
+                                            AIMDLimiter(self.concurrency, maximum=self.max_concurrency),
+                                            LatencyTracker())
+            return self.endpoints[endpoint]
+
+    def count(self, key):
+        with self.lock:
+            self.stats[key] += 1
+
+    def check_deadline(self, wait_s=0.0):
+        """Raise DeadlineExceeded if the deadline passes within ``wait_s`` seconds."""
+        if self.deadline is not None and time.monotonic() + wait_s >= self.deadline:
+            raise DeadlineExceeded("collection deadline reached")
+
+    def send(self, send, request, **kwargs):
+        """Send ``request`` with ``send`` under the endpoint's limits, retrying 429/5xx and connection errors."""
+        from requests.exceptions import ConnectionError, Timeout
+
+        bucket, limiter, latencies = self.limiters(endpoint_of(request.url))
+        for attempt in range(self.attempts):
+            self.check_deadline()
+            bucket.acquire()
+            limiter.acquire()
+            self.count("requests")
+            response = error = None
+            try:
+                response = self.send_hedged(send, request, kwargs, bucket, limiter, latencies)
+            except (ConnectionError, Timeout) as e:
+                error = e
+            except Exception:
+                limiter.release()
+                raise
+            retry = error is not None or response.status_code in RETRY_STATUSES
+            limiter.release(throttled=retry)
+            if not retry:
+                return response
+            if response is not None and response.status_code == 429:
+                self.count("throttled")
+            if attempt + 1 == self.attempts:
+                break
+            self.count("retries")
+            delay = backoff_delay(attempt, self.backoff_s, self.max_backoff_s, retry_after_s(response))
+            self.check_deadline(delay)
+            time.sleep(delay)
+        if error is not None:
+            raise error
+        return response
+
+    def send_hedged(self, send, request, kwargs, bucket, limiter, latencies):
+        """One attempt at ``request``, plus a duplicate if it runs past the hedging percentile.
+
+        Sent directly on the calling thread when no duplicate could go out
+        (not a GET, too few latencies, no hedge budget or no token left).
+        """
+        started = time.monotonic()
+        threshold = None
+        if self.hedge_percentile is not None and request.method == "GET" and self.may_hedge() \
+                and bucket.available():
+            threshold = latencies.percentile(self.hedge_percentile, self.hedge_min_samples)
+        if threshold is None:
+            response = send(request, **kwargs)
+            latencies.add(time.monotonic() - started)
+            return response
+
+        with self.lock:
+            if self.hedge_pool is None:
+                self.hedge_pool = ThreadPoolExecutor(max_workers=self.hedge_workers,
+                                                     thread_name_prefix="hedge")
+        primary = self.hedge_pool.submit(send, request, **kwargs)
+        futures = [primary]
+        if not wait(futures, timeout=threshold).done and self.may_hedge() and limiter.try_acquire():
+            if bucket.try_acquire():
+                self.count("hedged")
+                futures.append(self.hedge_pool.submit(send, request.copy(), **kwargs))
+            else:
+                limiter.release()
+        hedge = futures[1] if len(futures) > 1 else None
+        while True:
+            done, pending = wait(futures, return_when=FIRST_COMPLETED)
+            winner = next((f for f in futures if f in done and f.exception() is None), None)
+            if winner is not None or not pending:
+                break
+            futures = list(pending)  # the first to finish failed; wait for the other
+        if hedge is not None:
+            # the caller releases one slot; the other stays taken until the loser finishes
+            loser = primary if winner is hedge else hedge
+            loser.add_done_callback(lambda f: limiter.release(throttled=retryable(f)))
+        if winner is None:
+            return primary.result()  # raises the primary's error
+        if winner is not primary:
+            self.count("hedge_wins")
+        latencies.add(time.monotonic() - started)
+        return winner.result()
+
+    def may_hedge(self):
+        with self.lock:
+            return self.stats["hedged"] < self.hedge_budget * self.stats["requests"]
+
+
+def throttle_requests(client, throttle):
+    """Route every request of a garth client through ``throttle``. Safe to call again with a new one.
+
+    garth's own urllib3 retries on 5xx are switched off (``Throttle`` retries
+    them), so a failing request is not retried twice over. Call before
+    ``use_standin``, which mounts its own adapter.
+    """
+    if client.status_forcelist:
+        client.configure(status_forcelist=())
+    session = client.sess
+    send = type(session).send.__get__(session)
+    session.send = lambda request, **kwargs: throttle.send(send, request, **kwargs)
+
+
+class CircuitBreaker:
+    """Opens after ``failures`` transient errors in a row; lets one call through again after ``cooldown_s``.
+
+    Errors that are not transient (a day that fails validation, a 404) neither
+    count nor reset the run, since they say nothing about the endpoint's health.
+    """
+
+    def __init__(self, failures, cooldown_s):
+        self.failures = failures
+        self.cooldown_s = cooldown_s
+        self.consecutive = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        with self.lock:
+            return self.opened_at is not None and time.monotonic() - self.opened_at < self.cooldown_s
+
+    def allow(self):
+        """True if a call may go out (closed, or a trial call after the cooldown)."""
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown_s:
+                self.opened_at = time.monotonic()  # half-open: one trial, others wait another cooldown
+                return True
+            return False
+
+    def record(self, error=None):
+        """Record the outcome of a call: ``None`` for success, else the exception it raised."""
+        with self.lock:
+            if error is None:
+                self.consecutive = 0
+                self.opened_at = None
+            elif is_transient(error):
+                self.consecutive += 1
+                if self.consecutive >= self.failures:
+                    self.opened_at = time.monotonic()
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 """Shared functions for ChatGPT upload scripts."""
+import json
 import sys
 import time
 import subprocess
@@ -84,6 +85,22 @@ end tell
     run_applescript(script)
 
 
+def with_collection_note(prompt, file_path):
+    """Append PARTIAL_DATA_NOTE to the prompt when the data file was collected incompletely."""
+    from collection_utils import COLLECTION_STATUS_KEY
+    from prompts import PARTIAL_DATA_NOTE
+
+    try:
+        with open(file_path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return prompt
+    if isinstance(data, dict) and data.get(COLLECTION_STATUS_KEY):
+        print("⚠️  Report is incomplete, telling ChatGPT which data is missing")
+        return f"{prompt.rstrip()}\n\n{PARTIAL_DATA_NOTE}"
+    return prompt
+
+
 def upload_to_chatgpt(file_path, prompt, chatgpt_url, delay_ms, finder_wait_ms, upload_wait_ms):
     """Upload file to ChatGPT with given prompt."""
     if not file_path.exists():
@@ -92,6 +109,7 @@ def upload_to_chatgpt(file_path, prompt, chatgpt_url, delay_ms, finder_wait_ms,
     
     absolute_path = file_path.resolve()
     print(f"✅ File: {absolute_path}")
+    prompt = with_collection_note(prompt, absolute_path)
     
     print("📂 Opening file in Finder...")
     subprocess.run(["open", "-R", str(absolute_path)], check=True)
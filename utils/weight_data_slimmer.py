@@ -1,6 +1,8 @@
 """Slimmer for WeightData — extracts key weight and body composition metrics."""
 from datetime import datetime
 
+from format_utils import to_dict
+
 
 def _parse_metabolic_age(value):
     """Convert metabolic_age timestamp to years, or return None."""
@@ -22,15 +24,7 @@ def slim_weight_data_list(raw_list):
     """Slim a list of WeightData entries."""
     result = []
     for entry in raw_list:
-        if hasattr(entry, '__dict__'):
-            d = vars(entry)
-        elif hasattr(entry, 'dict'):
-            d = entry.dict()
-        elif isinstance(entry, dict):
-            d = entry
-        else:
-            continue
-
+        d = to_dict(entry)
         weight_g = d.get("weight")
         if not weight_g:
             continue